@@ -0,0 +1,114 @@
+"""Concurrent async Category use cases over the SQLite repository.
+
+Runs ``--requests`` get/list calls with ``--concurrency`` of them in flight
+and reports throughput and event-loop lag (how late a 1 ms ticker wakes up),
+comparing direct blocking calls against the thread-offloaded repository.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_async_use_cases.py``.
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.application.use_cases import (
+    AsyncGetCategoryUseCase,
+    AsyncListCategoriesUseCase,
+    GetCategoryInput,
+    GetCategoryUseCase,
+    ListCategoriesInput,
+    ListCategoriesUseCase
+)
+from category.domain.entities import Category
+from category.infra.async_repositories import CategoryThreadOffloadedRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+async def measure_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - started - 0.001)
+
+
+async def run(handlers, ids, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+    lags = []
+    ticker = asyncio.create_task(measure_lag(stop, lags))
+
+    async def request(position: int):
+        async with semaphore:
+            get, search = handlers
+            if position % 4:
+                await get(GetCategoryInput(random.choice(ids)))
+            else:
+                await search(ListCategoriesInput(page=random.randint(1, 100), filter='7'))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(position) for position in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    lags.sort()
+    return requests / elapsed, lags[len(lags) // 2] if lags else 0.0, lags[-1] if lags else 0.0
+
+
+def blocking_handlers(repo):
+    get, search = GetCategoryUseCase(repo), ListCategoriesUseCase(repo)
+
+    async def get_category(input_param):
+        return get.execute(input_param)
+
+    async def list_categories(input_param):
+        return search.execute(input_param)
+
+    return get_category, list_categories
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=50_000)
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    start = datetime(2020, 1, 1)
+    categories = Category.hydrate_many(
+        {'name': f'category {position}', 'created_at': start + timedelta(seconds=position)}
+        for position in range(args.size)
+    )
+    ids = [category.id for category in categories]
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(os.path.join(directory, 'db.sqlite3'), size=args.threads)
+        repo = CategorySqliteRepository(pool)
+        repo.bulk_insert(categories)
+
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            async_repo = CategoryThreadOffloadedRepository(repo, executor=executor)
+            for label, handlers in [
+                ('blocking in the event loop', blocking_handlers(repo)),
+                (f'thread-offloaded, {args.threads} threads', (
+                    AsyncGetCategoryUseCase(async_repo).execute,
+                    AsyncListCategoriesUseCase(async_repo).execute,
+                )),
+            ]:
+                throughput, median_lag, max_lag = asyncio.run(
+                    run(handlers, ids, args.requests, args.concurrency))
+                print(f'{label:<32} {throughput:8.0f} req/s  '
+                      f'loop lag median {median_lag * 1000:6.2f} ms  max {max_lag * 1000:7.2f} ms')
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Per-row Category.validate versus column-wise Category.validate_batch.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_batch_validation.py``.
+"""
+import argparse
+import timeit
+
+from __seedwork.domain.exceptions import ValidationException
+from category.domain.entities import Category
+
+
+def build_columns(size: int, invalid_ratio: float):
+    invalid_every = max(int(1 / invalid_ratio), 1) if invalid_ratio else size + 1
+    names = [
+        None if position % invalid_every == 0 else f'category {position}'
+        for position in range(size)
+    ]
+    descriptions = [None] * size
+    is_active = [True] * size
+    return names, descriptions, is_active
+
+
+def validate_per_row(names, descriptions, is_active):
+    errors = {}
+    for row, values in enumerate(zip(names, descriptions, is_active)):
+        try:
+            Category.validate(*values)
+        except ValidationException as exception:
+            errors[row] = exception.args[0]
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=500_000)
+    parser.add_argument('--invalid-ratio', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    columns = build_columns(args.size, args.invalid_ratio)
+
+    print(f'{args.size} rows, {args.invalid_ratio:.0%} invalid, best of {args.repeat}')
+    for label, function in [
+        ('Category.validate per row', validate_per_row),
+        ('Category.validate_batch', Category.validate_batch),
+    ]:
+        best = min(timeit.repeat(lambda: function(*columns), number=1, repeat=args.repeat))
+        print(f'{label:<28} {best * 1000:10.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
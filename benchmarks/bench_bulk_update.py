@@ -0,0 +1,90 @@
+"""Deactivating every category: per-entity saves vs. set-based ``update_many``.
+
+Per-entity saves are timed on ``--sample`` rows and reported as a rate,
+since running them over the whole table takes minutes.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_bulk_update.py``.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from datetime import datetime, timedelta
+
+from __seedwork.application.unit_of_work import UnitOfWork
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.domain.entities import Category
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+def build_categories(size: int):
+    start = datetime(2020, 1, 1)
+    return Category.hydrate_many(
+        {'name': f'category {position}', 'created_at': start + timedelta(seconds=position)}
+        for position in range(size)
+    )
+
+
+def timed(label: str, rows: int, job) -> None:
+    started = time.perf_counter()
+    job()
+    elapsed = time.perf_counter() - started
+    print(f'{label:<38} {elapsed * 1000:9.1f} ms  {rows / elapsed:12.0f} rows/s')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--sample', type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(os.path.join(directory, 'db.sqlite3'))
+        repo = CategorySqliteRepository(pool)
+        categories = build_categories(args.size)
+        repo.bulk_insert(categories)
+        ids = [category.id for category in categories]
+
+        def per_entity():
+            for entity_id in ids[:args.sample]:
+                category = repo.find_by_id(entity_id)
+                category.deactivate()
+                repo.update(category)
+
+        def unit_of_work():
+            with UnitOfWork(repo) as uow:
+                for category in repo.find_all():
+                    uow.track(category).deactivate()
+
+        print(f'sqlite, {args.size} rows')
+        timed(f'find + deactivate + update ({args.sample})', args.sample, per_entity)
+        repo.activate_many()
+        timed('unit of work over find_all', args.size, unit_of_work)
+        repo.activate_many()
+        timed('deactivate_many(ids)', args.size, lambda: repo.deactivate_many(ids))
+        timed('activate_many()', args.size, repo.activate_many)
+        timed("update_many(filter='category 1')", args.size,
+              lambda: repo.update_many({'description': 'ones'}, filter_param='category 1'))
+        pool.close()
+
+    in_memory = CategoryInMemoryRepository()
+    in_memory.bulk_insert(build_categories(args.size))
+
+    def per_entity_in_memory():
+        for category in in_memory.find_all():
+            category.deactivate()
+            in_memory.update(category)
+
+    print(f'in memory, {args.size} rows')
+    timed('deactivate + update', args.size, per_entity_in_memory)
+    timed('activate_many()', args.size, in_memory.activate_many)
+    timed("update_many(name, filter='category 1')", args.size,
+          lambda: in_memory.update_many({'name': 'renamed'}, filter_param='category 1'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""``find_by_id`` latency with and without the read-through cache.
+
+Looks up ids drawn from a skewed (Zipf-like) distribution, as a hot
+"Consultar uma categoria" endpoint would, against the SQLite repository.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_cached_repository.py``.
+"""
+import argparse
+import os
+import random
+import tempfile
+import timeit
+
+from datetime import datetime, timedelta
+
+from __seedwork.infra.cached_repositories import LruCache
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.domain.entities import Category
+from category.infra.cached_repositories import CategoryCachedRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--lookups', type=int, default=50_000)
+    parser.add_argument('--cache-size', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    start = datetime(2020, 1, 1)
+    categories = Category.hydrate_many(
+        {'name': f'category {position}', 'created_at': start + timedelta(seconds=position)}
+        for position in range(args.size)
+    )
+    random.seed(0)
+    weights = [1 / (rank + 1) for rank in range(args.size)]
+    ids = [category.id for category in random.choices(categories, weights, k=args.lookups)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(os.path.join(directory, 'db.sqlite3'))
+        repo = CategorySqliteRepository(pool)
+        repo.bulk_insert(categories)
+        cached = CategoryCachedRepository(repo, LruCache(maxsize=args.cache_size))
+
+        def lookup_all(target):
+            for entity_id in ids:
+                target.find_by_id(entity_id)
+
+        def lookup_all_in_identity_map():
+            with cached.identity_map():
+                lookup_all(cached)
+
+        for label, run in [
+            ('sqlite', lambda: lookup_all(repo)),
+            (f'cached, LRU {args.cache_size}', lambda: lookup_all(cached)),
+            ('cached + identity map', lookup_all_in_identity_map),
+        ]:
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            print(f'{label:<26} {best / args.lookups * 1e6:8.2f} us/lookup')
+        stats = cached.stats
+        print(f'hits {stats.hits}  misses {stats.misses}  evictions {stats.evictions}  '
+              f'identity hits {stats.identity_hits}  hit ratio {stats.hit_ratio:.1%}')
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Throughput of the event buses for ``--events`` Category events.
+
+Two subscribers: an in-memory cache invalidation (cheap, per event) and a
+search indexer that pays ``--io-latency`` seconds per call, as a network
+round trip would. Batching turns one round trip per event into one per batch.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_event_bus.py``.
+"""
+import argparse
+import asyncio
+import time
+
+from __seedwork.infra.event_bus import AsyncQueueEventBus, SyncEventBus, ThreadPoolEventBus
+
+from category.domain.events import CategoryDeactivated, CategoryUpdated
+
+
+def build_events(size: int):
+    return [
+        CategoryUpdated(aggregate_id=str(position), name=f'category {position}', description=None)
+        if position % 2 else CategoryDeactivated(aggregate_id=str(position))
+        for position in range(size)
+    ]
+
+
+def subscribers(io_latency: float):
+    cache = set(range(10_000))
+
+    def invalidate_cache(events):
+        for event in events:
+            cache.discard(event.aggregate_id)
+
+    def index_for_search(events):
+        time.sleep(io_latency)
+
+    async def index_for_search_async(events):
+        await asyncio.sleep(io_latency)
+
+    return invalidate_cache, index_for_search, index_for_search_async
+
+
+def report(label: str, events: int, elapsed: float, stats) -> None:
+    print(f'{label:<34} {events / elapsed:10.0f} events/s  '
+          f'{stats.batches:6} batches  delivered {stats.delivered}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events', type=int, default=100_000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--io-latency', type=float, default=0.0005)
+    args = parser.parse_args()
+
+    events = build_events(args.events)
+    invalidate_cache, index_for_search, index_for_search_async = subscribers(args.io_latency)
+
+    sample = events[:args.events // 100]
+    bus = SyncEventBus()
+    bus.subscribe(CategoryUpdated, invalidate_cache)
+    bus.subscribe(CategoryUpdated, index_for_search)
+    started = time.perf_counter()
+    for event in sample:
+        bus.publish((event,))
+    report(f'sync, one publish per event ({len(sample)})', len(sample),
+           time.perf_counter() - started, bus.stats)
+
+    for batch_size in [1, args.batch_size]:
+        started = time.perf_counter()
+        with ThreadPoolEventBus(workers=args.workers, batch_size=batch_size) as bus:
+            bus.subscribe(CategoryUpdated, invalidate_cache)
+            bus.subscribe(CategoryUpdated, index_for_search)
+            for position in range(0, len(events), 100):
+                bus.publish(events[position:position + 100])
+        report(f'thread pool, batch_size {batch_size}', len(events),
+               time.perf_counter() - started, bus.stats)
+
+    async def run_async():
+        async with AsyncQueueEventBus(workers=args.workers, batch_size=args.batch_size) as bus:
+            bus.subscribe(CategoryUpdated, invalidate_cache)
+            bus.subscribe(CategoryUpdated, index_for_search_async)
+            for position in range(0, len(events), 100):
+                await bus.publish(events[position:position + 100])
+        return bus
+
+    started = time.perf_counter()
+    bus = asyncio.run(run_async())
+    report(f'asyncio queue, batch_size {args.batch_size}', len(events),
+           time.perf_counter() - started, bus.stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Throughput and peak RSS of the streaming exporters against json.dumps of a full list.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_export.py``.
+Each mode runs in a fresh process so peak RSS is measured independently.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timedelta
+
+from category.domain.entities import Category
+from __seedwork.domain.entities import Entity
+from __seedwork.infra.exporters import JsonArrayExporter, NdjsonExporter, json_default
+
+
+def categories(size: int):
+    start = datetime(2020, 1, 1)
+    for position in range(size):
+        yield Category.from_trusted(
+            name=f'category {position}',
+            created_at=start + timedelta(seconds=position)
+        )
+
+
+def run(mode: str, size: int) -> None:
+    started = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as output:
+        if mode == 'ndjson':
+            NdjsonExporter(output).export(categories(size))
+        elif mode == 'json-array':
+            JsonArrayExporter(output).export(categories(size))
+        else:
+            output.write(json.dumps(Entity.to_dicts(list(categories(size))), default=json_default))
+    elapsed = time.perf_counter() - started
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{mode:<12} {elapsed:8.2f} s  {size / elapsed:10.0f} rows/s  peak RSS {peak_rss:8.1f} MiB')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=5_000_000)
+    parser.add_argument('--mode', choices=['ndjson', 'json-array', 'json.dumps'])
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.size)
+        return
+
+    print(f'{args.size} categories')
+    for mode in ['ndjson', 'json-array', 'json.dumps']:
+        subprocess.run(
+            [sys.executable, __file__, '--size', str(args.size), '--mode', mode], check=True)
+
+
+if __name__ == '__main__':
+    main()
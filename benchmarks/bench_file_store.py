@@ -0,0 +1,112 @@
+"""Cold start and point lookups of a ``FileStore`` holding Categories.
+
+"open + rows" opens the store and decodes every row; "repository" also
+hydrates the categories and builds ``CategoryInMemoryRepository``'s
+indexes. Files stay in the OS page cache between runs, so cold start
+here means a fresh ``FileStore``, not a cold disk. Lookups are timed one
+by one and reported as percentiles.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_file_store.py``.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from datetime import datetime, timedelta
+
+from __seedwork.infra.file_store import LOG_NAME, SNAPSHOT_NAME, FileStore
+
+from category.domain.entities import Category
+from category.infra.file_store.repositories import CategoryFileStoreRepository
+
+
+def build_categories(size: int):
+    start = datetime(2020, 1, 1)
+    return Category.hydrate_many(
+        {
+            'name': f'category {position}',
+            'description': f'description of category {position}',
+            'is_active': position % 3 != 0,
+            'created_at': start + timedelta(seconds=position),
+        }
+        for position in range(size)
+    )
+
+
+def timed(job):
+    started = time.perf_counter()
+    result = job()
+    return time.perf_counter() - started, result
+
+
+def percentiles(job, keys, number: int):
+    samples = []
+    clock = time.perf_counter_ns
+    for key in random.choices(keys, k=number):
+        started = clock()
+        job(key)
+        samples.append(clock() - started)
+    samples.sort()
+    return [samples[int(len(samples) * fraction)] / 1e3 for fraction in (0.5, 0.9, 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--changes', type=int, default=20_000)
+    parser.add_argument('--lookups', type=int, default=100_000)
+    args = parser.parse_args()
+
+    categories = build_categories(args.size)
+    to_rows = CategoryFileStoreRepository._to_rows  # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as directory:
+        with FileStore(directory, compact_after=None) as store:
+            elapsed, _ = timed(lambda: store.put_many(to_rows(categories)))
+            print(f'{args.size} categories appended to the log in {elapsed:.2f} s')
+            elapsed, _ = timed(store.compact)
+            print(f'compacted in {elapsed:.2f} s, snapshot '
+                  f'{os.path.getsize(os.path.join(directory, SNAPSHOT_NAME)) / 2 ** 20:.1f} MiB')
+
+        def cold_start(label):
+            store = FileStore(directory, compact_after=None)
+            rows_time, rows = timed(store.rows)
+            store.close()
+            store = FileStore(directory, compact_after=None)
+            repository_time, repository = timed(lambda: CategoryFileStoreRepository(store))
+            store.close()
+            print(f'{label:<24} open + rows {rows_time:6.2f} s ({len(rows) / rows_time:9.0f} rows/s)'
+                  f'  repository {repository_time:6.2f} s')
+            return repository
+
+        cold_start('snapshot only')
+
+        changed = random.sample(categories, args.changes)
+        with FileStore(directory, compact_after=None) as store:
+            for category in changed:
+                category.deactivate()
+            store.put_many(to_rows(changed))
+        log_size = os.path.getsize(os.path.join(directory, LOG_NAME))
+        repository = cold_start(f'+ {args.changes} in log')
+        print(f'log {log_size / 2 ** 20:.1f} MiB')
+
+        ids = [category.id for category in categories]
+        changed_ids = [category.id for category in changed]
+        missing = [str(position) for position in range(1000)]
+        with FileStore(directory, compact_after=None) as store:
+            cases = [
+                ('store.get, snapshot', store.get, ids),
+                ('store.get, log', store.get, changed_ids),
+                ('store.get, missing', store.get, missing),
+                ('repository.find_by_id', repository.find_by_id, ids),
+            ]
+            print(f'\n{f"{args.lookups} lookups":<30} {"p50 us":>8} {"p90 us":>8} {"p99 us":>8}')
+            for label, job, keys in cases:
+                p50, p90, p99 = percentiles(job, keys, args.lookups)
+                print(f'{label:<30} {p50:8.2f} {p90:8.2f} {p99:8.2f}')
+
+
+if __name__ == '__main__':
+    main()
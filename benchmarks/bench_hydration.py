@@ -0,0 +1,58 @@
+"""Category construction versus trusted hydration.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_hydration.py``.
+"""
+import argparse
+import timeit
+
+from datetime import datetime
+
+from category.domain.entities import Category
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+def build_rows(size: int):
+    created_at = datetime(2020, 1, 1)
+    return [
+        Category(name=f'category {position}', created_at=created_at).to_dict()
+        for position in range(size)
+    ]
+
+
+def construct(rows):
+    return [
+        Category(
+            unique_entity_id=UniqueEntityId(row['id']),
+            name=row['name'],
+            description=row['description'],
+            is_active=row['is_active'],
+            created_at=row['created_at']
+        )
+        for row in rows
+    ]
+
+
+def from_trusted(rows):
+    return [Category.from_trusted(**row) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.size)
+
+    print(f'{args.size} categories, best of {args.repeat}')
+    for label, function in [
+        ('Category(...)', construct),
+        ('Category.from_trusted', from_trusted),
+        ('Category.hydrate_many', Category.hydrate_many),
+    ]:
+        best = min(timeit.repeat(lambda: function(rows), number=1, repeat=args.repeat))
+        print(f'{label:<24} {best * 1000:10.1f} ms  {best / args.size * 1e6:6.2f} us/row')
+
+
+if __name__ == '__main__':
+    main()
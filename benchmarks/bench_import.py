@@ -0,0 +1,49 @@
+"""Rows per second of the Category import pipeline, in process and with a process pool.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_import.py``.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from __seedwork.infra.importers import read_csv
+
+from category.infra.importers import CategoryImporter
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+def write_csv(path: str, size: int, invalid_every: int) -> None:
+    with open(path, 'w', encoding='utf-8') as output:
+        output.write('name,description,is_active\n')
+        for position in range(size):
+            name = '' if position % invalid_every == 0 else f'category {position}'
+            output.write(f'{name},description {position},{position % 2 == 0}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=500_000)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--invalid-every', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'categories.csv')
+        write_csv(path, args.size, args.invalid_every)
+
+        print(f'{args.size} rows, chunks of {args.chunk_size}, 1 in {args.invalid_every} invalid')
+        for workers in [None, 2, 4]:
+            repo = CategoryInMemoryRepository()
+            importer = CategoryImporter(repo, chunk_size=args.chunk_size, workers=workers)
+            with open(path, encoding='utf-8', newline='') as source:
+                started = time.perf_counter()
+                report = importer.import_rows(read_csv(source))
+                elapsed = time.perf_counter() - started
+            label = 'in process' if workers is None else f'{workers} workers'
+            print(f'{label:<12} {elapsed:7.2f} s  {args.size / elapsed:9.0f} rows/s  '
+                  f'imported {report.imported}  rejected {len(report.rejected)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Cumulative import time of the domain modules, measured with ``python -X importtime``.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_import_time.py``.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MODULES = [
+    '__seedwork.domain.validators',
+    'category.domain.entities',
+    'rest_framework.serializers',
+]
+
+
+def cumulative_import_time(module: str) -> int:
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=os.environ,
+    ).stderr
+
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(':', '|').split('|'))
+        if name == module:
+            return int(cumulative)
+    raise RuntimeError(f'{module} was not imported')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'cumulative import time, best of {args.repeat}')
+    for module in MODULES:
+        best = min(cumulative_import_time(module) for _ in range(args.repeat))
+        print(f'{module:<32} {best / 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Cost of ``Instrumentation`` on Category construction and validation.
+
+"off" runs after ``uninstrument``, so it measures the original methods.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_instrumentation.py``.
+"""
+import argparse
+import timeit
+
+from datetime import datetime
+
+from __seedwork.infra.instrumentation import Instrumentation, render_prometheus
+
+from category.domain.entities import Category
+from category.domain.validators import CategoryValidator
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    created_at = datetime(2020, 1, 1)
+    jobs = {
+        'Category()': lambda: Category(name='Movie', description='Films', created_at=created_at),
+        'CategoryValidator.validate': lambda: CategoryValidator().validate({'name': 'Movie'}),
+    }
+
+    def measure(job):
+        return min(timeit.repeat(job, number=args.number, repeat=args.repeat)) / args.number * 1e6
+
+    baseline = {label: measure(job) for label, job in jobs.items()}
+
+    instrumentation = Instrumentation()
+    instrumentation.instrument_entity(Category)
+    instrumentation.instrument_validator(CategoryValidator)
+    instrumented = {label: measure(job) for label, job in jobs.items()}
+    instrumentation.uninstrument()
+    off = {label: measure(job) for label, job in jobs.items()}
+
+    print(f'{"":<28} {"baseline us":>12} {"on us":>8} {"off us":>8}')
+    for label in jobs:
+        print(f'{label:<28} {baseline[label]:12.2f} {instrumented[label]:8.2f} {off[label]:8.2f}')
+
+    exposition = render_prometheus(instrumentation.sink)
+    print(f'\n{exposition.count(chr(10))} exposition lines, e.g.')
+    print('\n'.join(line for line in exposition.splitlines() if '_count' in line))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""DRFValidator versus the Django-free CategoryValidator on Category payloads.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_native_validator.py``.
+"""
+import argparse
+import timeit
+
+from rest_framework import serializers
+
+from __seedwork.domain.validators import DRFValidator
+from category.domain.validators import CategoryValidatorFactory
+
+
+# pylint: disable=abstract-method
+class CategoryRules(serializers.Serializer):
+    name = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    is_active = serializers.BooleanField(required=False)
+
+
+PAYLOADS = {
+    'valid': {'name': 'Movie', 'description': 'Some description', 'is_active': True},
+    'invalid': {'name': '', 'description': {}, 'is_active': 'fake'},
+}
+
+
+def validate_with_drf(data):
+    return DRFValidator().validate(CategoryRules(data=data))
+
+
+def validate_native(data):
+    return CategoryValidatorFactory.create().validate(data)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{args.number} payloads, best of {args.repeat}')
+    for payload_label, payload in PAYLOADS.items():
+        for label, function in [('DRFValidator', validate_with_drf),
+                                ('CategoryValidator', validate_native)]:
+            best = min(timeit.repeat(
+                lambda: function(payload), number=args.number, repeat=args.repeat))
+            print(f'{payload_label:<8} {label:<20} {best / args.number * 1e6:8.2f} us/payload')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Validating Category payloads with ``ParallelValidator`` over 1/2/4/8 workers.
+
+"row dicts" ships every chunk as a list of dicts, as the importer did
+before, to show what the columnar chunks save. Scaling depends on the
+cores available: ``os.cpu_count()`` is printed with the results.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_parallel_validation.py``.
+"""
+import argparse
+import os
+import time
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from __seedwork.infra.importers import ParallelValidator, chunked, validate_chunk
+
+from category.domain.entities import Category
+
+
+def build_rows(size: int, invalid_every: int):
+    return [
+        {
+            'name': '' if position % invalid_every == 0 else f'category {position}',
+            'description': f'description {position}',
+            'is_active': position % 2 == 0,
+        }
+        for position in range(size)
+    ]
+
+
+def validate_row_dicts(rows, workers: int, chunk_size: int) -> int:
+    errors = 0
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunked(rows, chunk_size):
+            pending.append(executor.submit(validate_chunk, Category, chunk))
+            if len(pending) >= 2 * workers:
+                errors += len(pending.popleft().result())
+        while pending:
+            errors += len(pending.popleft().result())
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--invalid-every', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = build_rows(args.size, args.invalid_every)
+    print(f'{args.size} rows, chunks of {args.chunk_size}, {os.cpu_count()} CPUs')
+
+    def timed(label, job):
+        started = time.perf_counter()
+        errors = job()
+        elapsed = time.perf_counter() - started
+        print(f'{label:<24} {elapsed:7.2f} s  {args.size / elapsed:10.0f} rows/s  {errors} invalid')
+
+    timed('in process', lambda: len(
+        ParallelValidator(Category, chunk_size=args.chunk_size).validate(rows).errors))
+    for workers in [1, 2, 4, 8]:
+        validator = ParallelValidator(Category, workers=workers, chunk_size=args.chunk_size)
+        timed(f'{workers} workers', lambda: len(validator.validate(rows).errors))
+    for workers in [1, 4]:
+        timed(f'{workers} workers, row dicts',
+              lambda: validate_row_dicts(rows, workers, args.chunk_size))
+
+
+if __name__ == '__main__':
+    main()
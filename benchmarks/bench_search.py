@@ -0,0 +1,56 @@
+"""Search latency of the in-memory Category repository.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_search.py``.
+"""
+import argparse
+import random
+import timeit
+
+from datetime import datetime, timedelta
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+def build_repository(size: int) -> CategoryInMemoryRepository:
+    repo = CategoryInMemoryRepository()
+    start = datetime(2020, 1, 1)
+    names = list(range(size))
+    random.Random(42).shuffle(names)
+    for position, name in enumerate(names):
+        repo.insert(Category(
+            name=f'category {name}',
+            created_at=start + timedelta(seconds=position)
+        ))
+    return repo
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    repo = build_repository(args.size)
+
+    cases = [
+        ('default sort, page 1', {'page': 1}),
+        ('default sort, page 10000', {'page': 10_000}),
+        ('name asc, page 1', {'page': 1, 'sort': 'name'}),
+        ('name asc, page 10000', {'page': 10_000, 'sort': 'name'}),
+        ('name desc, page 10000', {'page': 10_000, 'sort': 'name', 'sort_dir': 'desc'}),
+        ('filter + name, page 1', {'page': 1, 'sort': 'name', 'filter': '99'}),
+        ('filter + name, page 1000', {'page': 1_000, 'sort': 'name', 'filter': '99'}),
+    ]
+
+    print(f'{args.size} categories, best of {args.repeat}')
+    for label, params in cases:
+        search_params = CategoryRepository.SearchParams(**params)
+        best = min(timeit.repeat(
+            lambda: repo.search(search_params), number=1, repeat=args.repeat))
+        print(f'{label:<28} {best * 1000:10.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
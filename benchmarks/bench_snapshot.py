@@ -0,0 +1,91 @@
+"""Reporting over categories: a list of ``Category`` vs. ``CategorySnapshot``.
+
+Memory is measured with ``tracemalloc`` while building each form from the
+same rows; the list keeps every entity, the snapshot only its columns.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_snapshot.py``.
+"""
+import argparse
+import collections
+import gc
+import timeit
+import tracemalloc
+
+from datetime import datetime, timedelta
+
+from category.domain.entities import Category
+from category.infra.snapshots import CategorySnapshot
+
+
+def build_rows(size: int):
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            'name': f'category {position}',
+            'is_active': position % 3 != 0,
+            'created_at': start + timedelta(minutes=position),
+        }
+        for position in range(size)
+    ]
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = build_rows(args.size)
+    categories, list_size = traced(lambda: Category.hydrate_many(rows))
+    snapshot, snapshot_size = traced(lambda: CategorySnapshot.from_categories(categories))
+    build = min(timeit.repeat(
+        lambda: CategorySnapshot.from_categories(categories), number=1, repeat=args.repeat))
+
+    print(f'{args.size} categories')
+    print(f'list of Category   {list_size / 2 ** 20:8.1f} MiB')
+    print(f'CategorySnapshot   {snapshot_size / 2 ** 20:8.1f} MiB  (built in {build:.2f} s)')
+
+    since = datetime(2020, 6, 1)
+    until = datetime(2021, 1, 1)
+
+    def by_month_list():
+        return collections.Counter(
+            (category.created_at.year, category.created_at.month)
+            for category in categories if category.is_active)
+
+    jobs = [
+        ('count active',
+         lambda: sum(1 for category in categories if category.is_active is True),
+         lambda: snapshot.count(is_active=True)),
+        ('count active in date range',
+         lambda: sum(1 for category in categories
+                     if category.is_active is True and since <= category.created_at < until),
+         lambda: snapshot.count(is_active=True, created_from=since, created_until=until)),
+        ('active per month',
+         by_month_list,
+         lambda: snapshot.count_by_created_at('month', is_active=True)),
+        ('select inactive',
+         lambda: [category for category in categories if category.is_active is False],
+         lambda: snapshot.select(is_active=False)),
+    ]
+
+    print(f'\n{"":<28} {"list ms":>10} {"snapshot ms":>12} {"speedup":>8}')
+    for label, on_list, on_snapshot in jobs:
+        list_time = min(timeit.repeat(on_list, number=1, repeat=args.repeat))
+        snapshot_time = min(timeit.repeat(on_snapshot, number=1, repeat=args.repeat))
+        print(f'{label:<28} {list_time * 1000:10.1f} {snapshot_time * 1000:12.3f} '
+              f'{list_time / snapshot_time:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Insert and paginated search throughput of the SQLite Category repository.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_sqlite.py``;
+add ``--use-text-index`` to measure with the FTS5 filter index.
+"""
+import argparse
+import os
+import tempfile
+import time
+import timeit
+
+from datetime import datetime, timedelta
+
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+def build_categories(size: int):
+    start = datetime(2020, 1, 1)
+    return Category.hydrate_many(
+        {'name': f'category {position}', 'created_at': start + timedelta(seconds=position)}
+        for position in range(size)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--single-inserts', type=int, default=5_000)
+    parser.add_argument('--batch-size', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--use-text-index', action='store_true')
+    args = parser.parse_args()
+
+    categories = build_categories(args.size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(os.path.join(directory, 'db.sqlite3'))
+        repo = CategorySqliteRepository(pool, use_text_index=args.use_text_index)
+
+        started = time.perf_counter()
+        for category in categories[:args.single_inserts]:
+            repo.insert(category)
+        elapsed = time.perf_counter() - started
+        print(f'insert, one transaction each  {args.single_inserts / elapsed:10.0f} rows/s')
+
+        started = time.perf_counter()
+        rest = categories[args.single_inserts:]
+        for position in range(0, len(rest), args.batch_size):
+            repo.bulk_insert(rest[position:position + args.batch_size])
+        elapsed = time.perf_counter() - started
+        print(f'bulk_insert, {args.batch_size} per batch   {len(rest) / elapsed:10.0f} rows/s')
+
+        print(f'search over {args.size} rows, best of {args.repeat}')
+        last_page = args.size // 15
+        for label, params in [
+            ('default sort, page 1', {'page': 1}),
+            (f'default sort, page {last_page}', {'page': last_page}),
+            ('name asc, page 1', {'page': 1, 'sort': 'name'}),
+            (f'name asc, page {last_page}', {'page': last_page, 'sort': 'name'}),
+            ('filter + name, page 1', {'page': 1, 'sort': 'name', 'filter': '99'}),
+        ]:
+            search_params = CategoryRepository.SearchParams(**params)
+            best = min(timeit.repeat(
+                lambda: repo.search(search_params), number=1, repeat=args.repeat))
+            print(f'{label:<30} {best * 1000:8.2f} ms')
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""Regression suite for the seedwork and Category hot paths.
+
+Every case runs at several batch sizes and reports the best time per
+operation over ``--rounds`` rounds of ``--repeat`` runs. Results are
+compared with ``benchmarks/baselines.json`` and the script exits with
+status 1 when a case got slower than the baseline by more than
+``--threshold`` and stays slower when measured again (``--retries``).
+
+Each case is timed next to a fixed pure-Python calibration loop and
+compared through the ratio of the two, so neither a baseline recorded
+on another machine nor a CPU that changes speed mid-run shows up as a
+regression. Refresh the baselines after an intended change with
+``--update``.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_suite.py [--update] [--only NAME]``.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.value_objects import UniqueEntityId
+
+from category.domain.entities import Category
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+SIZES = (100, 10_000)
+
+Job = Callable[[], object]
+Result = Dict[str, float]
+
+
+def calibration(size: int) -> Job:
+    """Allocates and calls much like the cases do, so it slows down with them."""
+    def job():
+        return [str({'position': position, 'square': position * position})
+                for position in range(size)]
+    return job
+
+
+def category_new(size: int) -> Job:
+    created_at = datetime(2020, 1, 1)
+    names = [f'category {position}' for position in range(size)]
+    return lambda: [Category(name=name, description='description', created_at=created_at)
+                    for name in names]
+
+
+def validator_rules(size: int) -> Job:
+    values = [f'value {position}' for position in range(size)]
+    return lambda: [ValidatorRules.values(value, 'name').required().string().max_length(255)
+                    for value in values]
+
+
+def unique_entity_id_new(size: int) -> Job:
+    return lambda: [UniqueEntityId() for _ in range(size)]
+
+
+def unique_entity_id_validated(size: int) -> Job:
+    ids = [UniqueEntityId().id for _ in range(size)]
+    return lambda: [UniqueEntityId(entity_id) for entity_id in ids]
+
+
+def value_object_str(size: int) -> Job:
+    unique_entity_ids = [UniqueEntityId() for _ in range(size)]
+    return lambda: [str(unique_entity_id) for unique_entity_id in unique_entity_ids]
+
+
+def entity_to_dict(size: int) -> Job:
+    categories = [Category(name=f'category {position}') for position in range(size)]
+    return lambda: [category.to_dict() for category in categories]
+
+
+def entity_to_dicts(size: int) -> Job:
+    categories = [Category(name=f'category {position}') for position in range(size)]
+    return lambda: Entity.to_dicts(categories)
+
+
+CASES: Dict[str, Callable[[int], Job]] = {
+    'Category.__new__': category_new,
+    'ValidatorRules': validator_rules,
+    'UniqueEntityId()': unique_entity_id_new,
+    'UniqueEntityId(id)': unique_entity_id_validated,
+    'ValueObject.__str__': value_object_str,
+    'Entity.to_dict': entity_to_dict,
+    'Entity.to_dicts': entity_to_dicts,
+}
+
+
+def best_ns_per_op(job: Job, size: int, repeat: int) -> float:
+    """Like ``timeit``: one warm-up call, then the best of ``repeat`` runs with the GC off."""
+    job()
+    best = float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter_ns()
+            job()
+            best = min(best, time.perf_counter_ns() - started)
+    finally:
+        gc.enable()
+    return best / size
+
+
+def run(cases: List[Tuple[str, int]], repeat: int, rounds: int) -> Dict[str, Result]:
+    reference = calibration(10_000)
+    jobs = {f'{name}[{size}]': (CASES[name](size), size) for name, size in cases}
+    results: Dict[str, Result] = {}
+    for _ in range(rounds):
+        for key, (job, size) in jobs.items():
+            result = results.setdefault(key, {'ns': float('inf'), 'calibration': float('inf')})
+            result['calibration'] = min(
+                result['calibration'], best_ns_per_op(reference, 10_000, repeat))
+            result['ns'] = min(result['ns'], best_ns_per_op(job, size, repeat))
+    return results
+
+
+def load_baselines() -> Dict[str, Result]:
+    if not os.path.exists(BASELINES):
+        return {}
+    with open(BASELINES, encoding='utf-8') as baselines:
+        return json.load(baselines)['results']
+
+
+def save_baselines(results: Dict[str, Result]) -> None:
+    merged = {**load_baselines(), **results}
+    with open(BASELINES, 'w', encoding='utf-8') as baselines:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': {
+                key: {name: round(value, 1) for name, value in result.items()}
+                for key, result in sorted(merged.items())
+            },
+        }, baselines, indent=2)
+        baselines.write('\n')
+
+
+def compare(results: Dict[str, Result], baselines: Dict[str, Result], threshold: float) -> List[str]:
+    """Prints every case against its baseline and returns the ones that regressed.
+
+    The baseline column is the stored time scaled by this run's calibration.
+    """
+    regressions = []
+    for key, result in results.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            print(f'{key:<28} {result["ns"]:10.1f} {"-":>10} {"new":>8}')
+            continue
+        expected = baseline['ns'] * result['calibration'] / baseline['calibration']
+        change = result['ns'] / expected - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(key)
+            flag = '  SLOWER'
+        print(f'{key:<28} {result["ns"]:10.1f} {expected:10.1f} {change:+8.1%}{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--only', action='append', choices=sorted(CASES),
+                        help='run only this case; may be repeated')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.4,
+                        help='allowed slowdown over the baseline, as a fraction')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='how many times a slower case is measured again before failing')
+    parser.add_argument('--update', action='store_true',
+                        help='store these results as the new baselines')
+    args = parser.parse_args()
+
+    cases = [(name, size) for name in args.only or list(CASES) for size in args.sizes]
+    results = run(cases, args.repeat, args.rounds)
+    if args.update:
+        save_baselines(results)
+        print(f'Stored {len(results)} baselines in {BASELINES}')
+        return
+
+    baselines = load_baselines()
+    print(f'{"case":<28} {"ns/op":>10} {"baseline":>10} {"change":>8}')
+    regressions = compare(results, baselines, args.threshold)
+    for _ in range(args.retries):
+        if not regressions:
+            break
+        print('\nMeasuring the slower cases again')
+        retried = [(name, size) for name, size in cases if f'{name}[{size}]' in regressions]
+        regressions = compare(run(retried, args.repeat, args.rounds), baselines, args.threshold)
+    if regressions:
+        print(f'\n{len(regressions)} case(s) slower than the baseline by more than '
+              f'{args.threshold:.0%}: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Category search by filter: ``use_text_index`` vs. a naive scan.
+
+The scan matches the same word prefixes over name and description with
+``contains_terms`` and returns the same first page. Names and descriptions
+are built from a fixed vocabulary so queries range from one match to most
+of the table.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_text_index.py``.
+"""
+import argparse
+import heapq
+import random
+import string
+import time
+import timeit
+
+from datetime import datetime, timedelta
+from operator import attrgetter
+
+from __seedwork.domain.repositories import contains_terms, tokenize
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+def build_rows(size: int, words: int):
+    rng = random.Random(19)
+    vocabulary = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+                  for _ in range(words)]
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            'name': f'{rng.choice(vocabulary)} {rng.choice(vocabulary)} {position}',
+            'description': ' '.join(rng.choices(vocabulary, k=4)),
+            'created_at': start + timedelta(seconds=position),
+        }
+        for position in range(size)
+    ], vocabulary
+
+
+def timed_build(label: str, rows, use_text_index: bool) -> CategoryInMemoryRepository:
+    repo = CategoryInMemoryRepository(use_text_index=use_text_index)
+    categories = Category.hydrate_many(rows)
+    started = time.perf_counter()
+    repo.bulk_insert(categories)
+    print(f'{label:<28} bulk_insert {time.perf_counter() - started:8.2f} s')
+    return repo
+
+
+def scan(categories, query: str, per_page: int = 15):
+    terms = tokenize(query)
+    matches = [
+        category for category in categories
+        if contains_terms(' '.join(filter(None, (category.name, category.description))), terms)
+    ]
+    return len(matches), heapq.nlargest(per_page, matches, key=attrgetter('created_at', 'id'))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--words', type=int, default=5_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows, vocabulary = build_rows(args.size, args.words)
+    indexed = timed_build('text index', rows, use_text_index=True)
+    timed_build('no text index', rows, use_text_index=False)
+    categories = indexed.find_all()
+
+    rare = f'{rows[args.size // 2]["name"].split()[0]} {args.size // 2}'
+    queries = [
+        ('exact name', rare),
+        ('one word', vocabulary[0]),
+        ('two words', f'{vocabulary[1]} {vocabulary[2]}'),
+        ('3-letter prefix', vocabulary[3][:3]),
+        ('1-letter prefix', vocabulary[4][:1]),
+    ]
+
+    print(f'\n{args.size} categories, first page sorted by created_at desc')
+    print(f'{"query":<36} {"matches":>8} {"index ms":>10} {"scan ms":>10} {"speedup":>8}')
+    for label, query in queries:
+        params = CategoryRepository.SearchParams(filter=query)
+        result = indexed.search(params)
+        total, items = scan(categories, query)
+        assert (result.total, result.items) == (total, items)
+        index_time = min(timeit.repeat(lambda: indexed.search(params), number=1, repeat=args.repeat))
+        scan_time = min(timeit.repeat(
+            lambda query=query: scan(categories, query), number=1, repeat=args.repeat))
+        print(f'{label + " " + repr(query):<36} {total:>8} {index_time * 1000:10.2f} '
+              f'{scan_time * 1000:10.1f} {scan_time / index_time:7.0f}x')
+
+    categories = categories[:10_000]
+    started = time.perf_counter()
+    for position, category in enumerate(categories):
+        category.update(name=f'renamed {position}', description=category.description)
+        indexed.update(category)
+    elapsed = time.perf_counter() - started
+    print(f'\nupdate with re-indexing: {elapsed / len(categories) * 1e6:.1f} us per category')
+
+
+if __name__ == '__main__':
+    main()
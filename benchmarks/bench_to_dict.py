@@ -0,0 +1,40 @@
+"""Entity.to_dict/to_dicts versus the previous dataclasses.asdict implementation.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_to_dict.py``.
+"""
+import argparse
+import timeit
+
+from dataclasses import asdict
+
+from category.domain.entities import Category
+from __seedwork.domain.entities import Entity
+
+
+def to_dict_with_asdict(entity):
+    entity_dict = asdict(entity)
+    entity_dict.pop('unique_entity_id')
+    entity_dict['id'] = entity.id
+    return entity_dict
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    categories = [Category(name=f'category {position}') for position in range(args.size)]
+
+    print(f'{args.size} categories, best of {args.repeat}')
+    for label, function in [
+        ('dataclasses.asdict', lambda: [to_dict_with_asdict(entity) for entity in categories]),
+        ('Entity.to_dict', lambda: [entity.to_dict() for entity in categories]),
+        ('Entity.to_dicts', lambda: Entity.to_dicts(categories)),
+    ]:
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f'{label:<20} {best * 1000:8.1f} ms  {best / args.size * 1e6:6.2f} us/entity')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""UniqueEntityId generation and validation.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_unique_entity_id.py``.
+"""
+import argparse
+import timeit
+import uuid
+
+from __seedwork.domain.value_objects import UniqueEntityId
+
+EXTERNAL_ID = '3aefc22e-8006-4024-a239-a27084c5133e'
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ('str(uuid.uuid4())', lambda: str(uuid.uuid4())),
+        ('uuid.UUID(external id)', lambda: uuid.UUID(EXTERNAL_ID)),
+        ('UniqueEntityId()', UniqueEntityId),
+        ('UniqueEntityId.time_ordered()', UniqueEntityId.time_ordered),
+        ('UniqueEntityId(external id)', lambda: UniqueEntityId(EXTERNAL_ID)),
+    ]
+
+    print(f'{args.number} calls, best of {args.repeat}')
+    for label, function in cases:
+        best = min(timeit.repeat(function, number=args.number, repeat=args.repeat))
+        print(f'{label:<32} {best / args.number * 1e9:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Memory held by UniqueEntityId versus CompactUniqueEntityId, measured with tracemalloc.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_unique_entity_id_memory.py``.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from __seedwork.domain.value_objects import CompactUniqueEntityId, UniqueEntityId
+
+
+def measure(factory, size: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    ids = [factory() for _ in range(size)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ids
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f'{args.size} ids, including the list holding them')
+    for label, factory in [
+        ('UniqueEntityId', UniqueEntityId),
+        ('CompactUniqueEntityId', CompactUniqueEntityId),
+    ]:
+        current = measure(factory, args.size)
+        print(f'{label:<24} {current / 2 ** 20:8.1f} MiB  {current / args.size:6.1f} B/id')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Write volume of a bulk deactivate job: whole-row updates vs. a Unit of Work.
+
+Deactivates every category of a SQLite table in which half of them are
+already inactive. ``bulk_update`` rewrites every row, while the Unit of
+Work skips unchanged entities and only sets ``is_active`` on the rest.
+Write volume is the size of the WAL after the job (auto-checkpoint is off).
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_unit_of_work.py``.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from datetime import datetime, timedelta
+
+from __seedwork.application.unit_of_work import UnitOfWork
+from __seedwork.infra.sqlite import DEFAULT_PRAGMAS, SqliteConnectionPool
+
+from category.domain.entities import Category
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+def build_categories(size: int):
+    start = datetime(2020, 1, 1)
+    return Category.hydrate_many(
+        {
+            'name': f'category {position}',
+            'description': f'description of category {position} ' * 4,
+            'is_active': position % 2 == 0,
+            'created_at': start + timedelta(seconds=position),
+        }
+        for position in range(size)
+    )
+
+
+def run(directory: str, size: int, job) -> None:
+    path = os.path.join(directory, f'{job.__name__}.sqlite3')
+    pool = SqliteConnectionPool(
+        path, size=1, pragmas={**DEFAULT_PRAGMAS, 'wal_autocheckpoint': '0'})
+    repo = CategorySqliteRepository(pool)
+    repo.bulk_insert(build_categories(size))
+    with pool.connection() as connection:
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    categories = repo.find_all()
+    started = time.perf_counter()
+    job(repo, categories)
+    elapsed = time.perf_counter() - started
+
+    wal_size = os.path.getsize(f'{path}-wal')
+    print(f'{job.__name__:<14} {elapsed * 1000:8.1f} ms  WAL {wal_size / 2**20:7.2f} MiB')
+    pool.close()
+
+
+def bulk_update(repo, categories):
+    for category in categories:
+        category.deactivate()
+    repo.bulk_update(categories)
+
+
+def unit_of_work(repo, categories):
+    with UnitOfWork(repo) as uow:
+        for category in categories:
+            uow.track(category).deactivate()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for job in [bulk_update, unit_of_work]:
+            run(directory, args.size, job)
+
+
+if __name__ == '__main__':
+    main()
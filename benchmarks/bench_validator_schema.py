@@ -0,0 +1,36 @@
+"""ValidatorRules chains versus the compiled Category validator schema.
+
+Run from the repository root with ``PYTHONPATH=src python benchmarks/bench_validator_schema.py``.
+"""
+import argparse
+import timeit
+
+from __seedwork.domain.validators import ValidatorRules
+from category.domain.entities import Category
+
+
+def validate_with_rules(name, description, is_active=None):
+    ValidatorRules.values(name, 'name').required().string().max_length(255)
+    ValidatorRules.values(description, 'description').string()
+    ValidatorRules.values(is_active, 'is_active').boolean()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{args.number} calls, best of {args.repeat}')
+    for label, function in [
+        ('ValidatorRules chains', validate_with_rules),
+        ('compiled schema', Category.validate),
+    ]:
+        best = min(timeit.repeat(
+            lambda: function('Movie', 'Some description', True),
+            number=args.number, repeat=args.repeat))
+        print(f'{label:<24} {best / args.number * 1e9:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""``ValueObject.__str__``: per-call reflection vs. the generated method.
+
+``reflective_str`` is the previous implementation, kept here as the
+reference.
+
+Run from the repository root with
+``PYTHONPATH=src python benchmarks/bench_value_object_str.py``.
+"""
+import argparse
+import json
+import timeit
+
+from dataclasses import dataclass, fields
+
+from __seedwork.domain.value_objects import UniqueEntityId, ValueObject
+
+from category.domain.entities import Category
+
+
+def reflective_str(value_object: ValueObject):
+    fields_name = [field.name for field in fields(value_object)]
+    return getattr(value_object, fields_name[0]) \
+        if len(fields_name) == 1 \
+        else json.dumps({
+            field_name: getattr(value_object, field_name) for field_name in fields_name
+        })
+
+
+@dataclass(frozen=True, slots=True)
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    unique_entity_id = UniqueEntityId()
+    money = Money(10, 'BRL')
+    category = Category(name='Movie')
+
+    def reflective_id():
+        return reflective_str(category.unique_entity_id)
+
+    cases = [
+        ('UniqueEntityId', lambda: reflective_str(unique_entity_id), lambda: str(unique_entity_id)),
+        ('two fields', lambda: reflective_str(money), lambda: str(money)),
+        ('Category.id', reflective_id, lambda: category.id),
+    ]
+
+    print(f'{args.number} calls, best of {args.repeat}')
+    print(f'{"":<16} {"reflective ns":>14} {"generated ns":>13} {"speedup":>8}')
+    for label, before, after in cases:
+        before_time = min(timeit.repeat(before, number=args.number, repeat=args.repeat))
+        after_time = min(timeit.repeat(after, number=args.number, repeat=args.repeat))
+        print(f'{label:<16} {before_time / args.number * 1e9:14.0f} '
+              f'{after_time / args.number * 1e9:13.0f} {before_time / after_time:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from typing import Dict, Generic, Optional
+
+from __seedwork.domain.events import EventBusInterface
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import ET, ChangeSet, EntityId, RepositoryInterface
+
+
+@dataclass(slots=True)
+class UnitOfWork(Generic[ET]):
+    """Collects new, changed and removed entities and saves them with one ``save_changes``.
+
+    Entities loaded through ``find_by_id`` or registered with ``track`` are
+    checked for ``dirty_fields`` on ``commit``, so untouched entities are
+    skipped and changed ones only write the fields that changed. As a
+    context manager it commits on success and discards everything on error.
+    The events recorded on the saved entities are pulled once the changes
+    are stored and published to ``event_bus`` when there is one.
+    """
+    repository: RepositoryInterface[ET]
+    event_bus: Optional[EventBusInterface] = None
+    _new: Dict[str, ET] = field(default_factory=dict, init=False)
+    _tracked: Dict[str, ET] = field(default_factory=dict, init=False)
+    _deleted: Dict[str, None] = field(default_factory=dict, init=False)
+
+    def __enter__(self) -> 'UnitOfWork[ET]':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def add(self, entity: ET) -> ET:
+        self._deleted.pop(entity.id, None)
+        self._new[entity.id] = entity
+        return entity
+
+    def track(self, entity: ET) -> ET:
+        if entity.id not in self._new:
+            self._tracked[entity.id] = entity
+        return entity
+
+    def find_by_id(self, entity_id: EntityId) -> ET:
+        entity_id = str(entity_id)
+        if entity_id in self._deleted:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        entity = self._new.get(entity_id) or self._tracked.get(entity_id)
+        if entity is None:
+            entity = self.track(self.repository.find_by_id(entity_id))
+        return entity
+
+    def remove(self, entity_id: EntityId) -> None:
+        entity_id = str(entity_id)
+        if self._new.pop(entity_id, None) is not None:
+            return
+        self._tracked.pop(entity_id, None)
+        self._deleted[entity_id] = None
+
+    def pending_changes(self) -> ChangeSet[ET]:
+        updated = []
+        for entity in self._tracked.values():
+            dirty_fields = entity.dirty_fields
+            if dirty_fields:
+                updated.append((entity, dirty_fields))
+        return ChangeSet(
+            inserted=list(self._new.values()),
+            updated=updated,
+            deleted=list(self._deleted),
+        )
+
+    def commit(self) -> ChangeSet[ET]:
+        changes = self.pending_changes()
+        if changes:
+            self.repository.save_changes(changes)
+        saved = [*changes.inserted, *(entity for entity, _ in changes.updated)]
+        for entity in saved:
+            entity.mark_clean()
+        self._clear()
+        events = [event for entity in saved for event in entity.pull_events()]
+        if self.event_bus is not None and events:
+            self.event_bus.publish(events)
+        return changes
+
+    def rollback(self) -> None:
+        """Forgets pending work; entities already changed in memory keep their values."""
+        self._clear()
+
+    def _clear(self) -> None:
+        self._new.clear()
+        self._tracked.clear()
+        self._deleted.clear()
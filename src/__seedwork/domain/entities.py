@@ -1,10 +1,43 @@
 from abc import ABC
 
-from dataclasses import dataclass, field, asdict
+import functools
 
-from __seedwork.domain.value_objects import UniqueEntityId
+from dataclasses import asdict, dataclass, field, fields, is_dataclass, MISSING
+from datetime import date, datetime
 
-from typing import Any
+from __seedwork.domain.events import DomainEvent
+from __seedwork.domain.exceptions import InvalidUuidException
+from __seedwork.domain.value_objects import CompactUniqueEntityId, UniqueEntityId
+
+from typing import (
+    Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TypeVar, Union,
+    get_args, get_origin, get_type_hints
+)
+
+T = TypeVar('T', bound='Entity')
+
+# Field types whose values asdict returns unchanged, so to_dict reads them directly.
+_PLAIN_TYPES = (str, int, float, bool, bytes, type(None), date, datetime)
+
+
+def _is_plain(annotation: Any) -> bool:
+    if get_origin(annotation) is Union:
+        return all(map(_is_plain, get_args(annotation)))
+    return annotation in _PLAIN_TYPES
+
+
+def _to_plain(value: Any) -> Any:
+    """Converts dataclasses to dicts, also inside lists, tuples and dicts,
+    as ``asdict`` does; other values are returned as they are."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value)(*map(_to_plain, value))
+    if isinstance(value, (list, tuple)):
+        return type(value)(map(_to_plain, value))
+    if isinstance(value, dict):
+        return type(value)((_to_plain(key), _to_plain(item)) for key, item in value.items())
+    return value
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,17 +46,149 @@ class Entity(ABC):
     unique_entity_id: UniqueEntityId = field(
         default_factory=lambda: UniqueEntityId()
     )
+    _dirty_fields: Optional[Set[str]] = field(
+        default_factory=lambda: None, init=False, repr=False, compare=False
+    )
+    _events: Optional[List[DomainEvent]] = field(
+        default_factory=lambda: None, init=False, repr=False, compare=False
+    )
+
+    # Whether hydrate_many keeps ids as CompactUniqueEntityId instead of UniqueEntityId.
+    compact_ids: ClassVar[bool] = False
 
     @property
     def id(self):
         return str(self.unique_entity_id)
 
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """Fields changed through ``_set`` since creation or the last ``mark_clean``."""
+        return frozenset(self._dirty_fields or ())
+
+    def mark_clean(self) -> None:
+        object.__setattr__(self, '_dirty_fields', None)
+
+    @property
+    def events(self) -> Tuple[DomainEvent, ...]:
+        """Events recorded since creation or the last ``pull_events``."""
+        return tuple(self._events or ())
+
+    def pull_events(self) -> List[DomainEvent]:
+        events = self._events or []
+        object.__setattr__(self, '_events', None)
+        return events
+
+    def _record(self, event: DomainEvent) -> None:
+        if self._events is None:
+            object.__setattr__(self, '_events', [])
+        self._events.append(event)
+
     def _set(self, name: str, value: Any):
-        object.__setattr__(self, name, value)
+        current = getattr(self, name)
+        if current is not value and current != value:
+            object.__setattr__(self, name, value)
+            if self._dirty_fields is None:
+                object.__setattr__(self, '_dirty_fields', set())
+            self._dirty_fields.add(name)
         return self
 
-    def to_dict(self):
-        entity_dict = asdict(self)
-        entity_dict.pop('unique_entity_id')
-        entity_dict['id'] = self.id
-        return entity_dict
+    def to_dict(self) -> Dict[str, Any]:
+        return self._dict_serializer()(self)
+
+    @staticmethod
+    def to_dicts(entities: Iterable['Entity']) -> List[Dict[str, Any]]:
+        entity_class = serializer = None
+        entity_dicts = []
+        for entity in entities:
+            if type(entity) is not entity_class:
+                entity_class = type(entity)
+                serializer = entity_class._dict_serializer()
+            entity_dicts.append(serializer(entity))
+        return entity_dicts
+
+    @classmethod
+    @functools.cache
+    def _dict_serializer(cls) -> Callable[['Entity'], Dict[str, Any]]:
+        """Generates the ``to_dict`` body for this class once.
+
+        Produces the same output, keys in the same order, as ``asdict``
+        followed by moving ``unique_entity_id`` to ``id``. Fields annotated
+        with plain types such as ``str``, ``bool`` or ``Optional[datetime]``
+        are read directly; any other field goes through ``_to_plain``, so
+        nested dataclasses and value objects still become dicts. Values
+        that are not dataclasses are not deep-copied.
+        """
+        try:
+            annotations = get_type_hints(cls)
+        except (NameError, TypeError):
+            annotations = {}
+        items = ''.join(
+            f"{entity_field.name!r}: entity.{entity_field.name}, "
+            if _is_plain(annotations.get(entity_field.name))
+            else f"{entity_field.name!r}: to_plain(entity.{entity_field.name}), "
+            for entity_field in cls._state_fields()
+        )
+        source = f"def to_dict(entity):\n    return {{{items}'id': str(entity.unique_entity_id)}}"
+
+        namespace = {'to_plain': _to_plain}
+        exec(source, namespace)  # pylint: disable=exec-used
+        return namespace['to_dict']
+
+    @classmethod
+    def from_trusted(cls: type[T], **props: Any) -> T:
+        """Rebuilds an entity from data that was validated before it was stored.
+
+        Skips ``__new__``, ``validate`` and UUID parsing, so it must only
+        receive rows produced by ``to_dict`` or read back from storage.
+        """
+        return cls.hydrate_many((props,))[0]
+
+    @classmethod
+    def hydrate_many(cls: type[T], rows: Iterable[Dict[str, Any]]) -> List[T]:
+        trusted_fields = cls._trusted_fields()
+        new = object.__new__
+        setattr_ = object.__setattr__
+        id_class = CompactUniqueEntityId if cls.compact_ids else UniqueEntityId
+        trusted_id = id_class.from_trusted
+
+        entities = []
+        for row in rows:
+            entity = new(cls)
+            entity_id = row.get('id', MISSING)
+            if entity_id is MISSING:
+                unique_entity_id = id_class()
+            elif entity_id is None:
+                raise InvalidUuidException()
+            else:
+                unique_entity_id = trusted_id(entity_id)
+            setattr_(entity, 'unique_entity_id', unique_entity_id)
+            setattr_(entity, '_dirty_fields', None)
+            setattr_(entity, '_events', None)
+            for name, default, default_factory in trusted_fields:
+                value = row.get(name, MISSING)
+                if value is MISSING:
+                    if default is not MISSING:
+                        value = default
+                    elif default_factory is not MISSING:
+                        value = default_factory()
+                    else:
+                        raise TypeError(
+                            f"{cls.__name__} is missing the required prop '{name}'")
+                setattr_(entity, name, value)
+            entities.append(entity)
+        return entities
+
+    @classmethod
+    @functools.cache
+    def _trusted_fields(cls) -> Tuple[Tuple[str, Any, Callable[[], Any]], ...]:
+        return tuple(
+            (entity_field.name, entity_field.default, entity_field.default_factory)
+            for entity_field in cls._state_fields()
+        )
+
+    @classmethod
+    def _state_fields(cls):
+        return [
+            entity_field for entity_field in fields(cls)
+            if entity_field.name not in ('unique_entity_id', '_dirty_fields', '_events')
+        ]
@@ -0,0 +1,37 @@
+import abc
+from abc import ABC
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterable, List
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DomainEvent:
+    aggregate_id: str
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+
+Handler = Callable[[List[DomainEvent]], Any]
+
+
+class EventBusInterface(ABC):
+
+    @abc.abstractmethod
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        raise NotImplementedError()
+
+
+class AsyncEventBusInterface(ABC):
+
+    @abc.abstractmethod
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def publish(self, events: Iterable[DomainEvent]) -> None:
+        raise NotImplementedError()
@@ -10,3 +10,11 @@ class DomainException(Exception):
 
 class ValidationException(Exception):
     pass
+
+
+class NotFoundException(Exception):
+    pass
+
+
+class AlreadyExistsException(Exception):
+    pass
@@ -0,0 +1,837 @@
+import abc
+from abc import ABC
+
+import bisect
+import heapq
+import itertools
+import math
+import re
+import sys
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, FrozenSet, Generic, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import AlreadyExistsException, NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+
+ET = TypeVar('ET', bound=Entity)
+
+EntityId = Union[str, UniqueEntityId]
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeSet(Generic[ET]):
+    """Writes collected by a unit of work; ``updated`` pairs each entity with its dirty fields."""
+    inserted: List[ET] = field(default_factory=list)
+    updated: List[Tuple[ET, FrozenSet[str]]] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+
+class RepositoryInterface(Generic[ET], ABC):
+
+    @abc.abstractmethod
+    def insert(self, entity: ET) -> None:
+        """Raises ``AlreadyExistsException`` when the id is already stored."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def bulk_insert(self, entities: List[ET]) -> None:
+        """Raises ``AlreadyExistsException``, writing nothing, when an id is
+        already stored or repeated in ``entities``."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_by_id(self, entity_id: EntityId) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, entity_id: EntityId) -> None:
+        raise NotImplementedError()
+
+    def save_changes(self, changes: ChangeSet[ET]) -> None:
+        """Applies a ``ChangeSet``; storages override it to write in one batch."""
+        if changes.inserted:
+            self.bulk_insert(changes.inserted)
+        for entity, _ in changes.updated:
+            self.update(entity)
+        for entity_id in changes.deleted:
+            self.delete(entity_id)
+
+
+IndexKey = Tuple[bool, Any, str]
+
+
+@dataclass(slots=True)
+class SortedIndex:
+    """Keeps entity ids ordered by one field so ordered reads never re-sort.
+
+    Keys are ``(has_value, value, id)`` tuples: ``None`` values sort first
+    and the id breaks ties, which keeps every key unique. Keys live in
+    buckets of roughly ``load`` items, so an insert or removal only shifts
+    one bucket instead of the whole index.
+    """
+    field_name: str
+    load: int = 1000
+    _lists: List[List[IndexKey]] = field(default_factory=list)
+    _maxes: List[IndexKey] = field(default_factory=list)
+    _current: Dict[str, IndexKey] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def add(self, entity: Entity) -> None:
+        entity_id = entity.id
+        value = getattr(entity, self.field_name)
+        key = (value is not None, value, entity_id)
+
+        old_key = self._current.get(entity_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._discard(old_key)
+
+        self._insert(key)
+        self._current[entity_id] = key
+
+    def add_many(self, entities: List[Entity]) -> None:
+        """Adds ``entities`` like ``add``. When they are at least a quarter
+        of the index, every key is sorted once and cut into buckets of
+        ``load`` instead, which is how an index is built on load.
+        """
+        current = self._current
+        if len(entities) * 4 < len(current):
+            for entity in entities:
+                self.add(entity)
+            return
+
+        field_name, load = self.field_name, self.load
+        for entity in entities:
+            entity_id = entity.id
+            value = getattr(entity, field_name)
+            current[entity_id] = (value is not None, value, entity_id)
+        keys = sorted(current.values())
+        self._lists = [keys[position:position + load] for position in range(0, len(keys), load)]
+        self._maxes = [bucket[-1] for bucket in self._lists]
+
+    def remove(self, entity_id: str) -> None:
+        old_key = self._current.pop(entity_id, None)
+        if old_key is not None:
+            self._discard(old_key)
+
+    def ids(self, reverse: bool = False, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        size = len(self)
+        start = max(start, 0)
+        stop = size if stop is None else min(stop, size)
+
+        if start >= stop:
+            return iter(())
+
+        if reverse:
+            return self._iter_ids(size - stop, size - start, reverse=True)
+        return self._iter_ids(start, stop, reverse=False)
+
+    def _iter_ids(self, low: int, high: int, reverse: bool) -> Iterator[str]:
+        slices = []
+        offset = 0
+        for bucket in self._lists:
+            length = len(bucket)
+            if offset + length > low:
+                slices.append((bucket, max(low - offset, 0), min(high - offset, length)))
+            offset += length
+            if offset >= high:
+                break
+
+        if reverse:
+            for bucket, begin, end in reversed(slices):
+                for position in range(end - 1, begin - 1, -1):
+                    yield bucket[position][2]
+        else:
+            for bucket, begin, end in slices:
+                for key in bucket[begin:end]:
+                    yield key[2]
+
+    def _insert(self, key: IndexKey) -> None:
+        if not self._maxes:
+            self._lists.append([key])
+            self._maxes.append(key)
+            return
+
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            position -= 1
+            self._lists[position].append(key)
+            self._maxes[position] = key
+        else:
+            bisect.insort(self._lists[position], key)
+
+        bucket = self._lists[position]
+        if len(bucket) > 2 * self.load:
+            half = bucket[self.load:]
+            del bucket[self.load:]
+            self._maxes[position] = bucket[-1]
+            self._lists.insert(position + 1, half)
+            self._maxes.insert(position + 1, half[-1])
+
+    def _discard(self, key: IndexKey) -> None:
+        position = bisect.bisect_left(self._maxes, key)
+        bucket = self._lists[position]
+        del bucket[bisect.bisect_left(bucket, key)]
+
+        if bucket:
+            self._maxes[position] = bucket[-1]
+        else:
+            del self._lists[position]
+            del self._maxes[position]
+
+
+_TOKEN = re.compile(r'\w+')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Splits ``text`` into lowercase word tokens."""
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+def contains_terms(text: Optional[str], terms: List[str], prefix: bool = True) -> bool:
+    """Whether ``text`` has every one of ``terms`` (tokenized) as a token or,
+    with ``prefix``, as the start of one: the match ``TextIndex.search``
+    answers from its postings, for scans without the index."""
+    tokens = tokenize(text)
+    if prefix:
+        return all(any(token.startswith(term) for token in tokens) for term in terms)
+    return set(terms).issubset(tokens)
+
+
+Postings = Union[str, Set[str]]
+
+
+@dataclass(slots=True)
+class TextIndex:
+    """Inverted index from word tokens to entity ids, for token and prefix queries.
+
+    Every entity keeps its current tokens so re-indexing only touches the
+    postings that changed. A posting with one id is stored as the bare id,
+    which matters when most tokens are unique. Prefix queries bisect a
+    sorted vocabulary; new tokens go to a small sorted ``_recent`` list
+    that is merged into it once it outgrows ``merge_threshold`` (or a
+    32nd of the vocabulary), and tokens whose postings went empty are
+    only dropped from it on that merge.
+    """
+    field_names: Tuple[str, ...]
+    merge_threshold: int = 4096
+    verify_below: int = 64
+    _postings: Dict[str, Postings] = field(default_factory=dict)
+    _documents: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    _vocabulary: List[str] = field(default_factory=list)
+    _recent: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, entity: Entity) -> None:
+        entity_id = entity.id
+        values = [getattr(entity, field_name) for field_name in self.field_names]
+        tokens = tuple(dict.fromkeys(map(sys.intern, tokenize(' '.join(filter(None, values))))))
+
+        old_tokens = self._documents.get(entity_id)
+        if old_tokens is None:
+            added: Iterable[str] = tokens
+        elif old_tokens == tokens:
+            return
+        else:
+            for token in set(old_tokens).difference(tokens):
+                self._unlink(token, entity_id)
+            added = set(tokens).difference(old_tokens)
+        for token in added:
+            self._link(token, entity_id)
+        self._documents[entity_id] = tokens
+
+    def add_many(self, entities: Iterable[Entity]) -> None:
+        """Indexes ``entities`` in one pass.
+
+        Postings are filled directly and the new tokens are merged into the
+        vocabulary with one sort when there are many of them, instead of
+        one ``insort`` each. Ids already indexed go through ``add``.
+        """
+        postings, documents = self._postings, self._documents
+        field_names, intern = self.field_names, sys.intern
+        new_tokens = []
+        for entity in entities:
+            entity_id = entity.id
+            if entity_id in documents:
+                self.add(entity)
+                continue
+            values = [getattr(entity, field_name) for field_name in field_names]
+            tokens = tuple(dict.fromkeys(map(intern, tokenize(' '.join(filter(None, values))))))
+            documents[entity_id] = tokens
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is None:
+                    postings[token] = entity_id
+                    new_tokens.append(token)
+                elif isinstance(ids, str):
+                    postings[token] = {ids, entity_id}
+                else:
+                    ids.add(entity_id)
+
+        if len(new_tokens) <= max(self.merge_threshold, len(self._vocabulary) >> 5):
+            for token in new_tokens:
+                if not self._in_vocabulary(token):
+                    bisect.insort(self._recent, token)
+            if len(self._recent) > max(self.merge_threshold, len(self._vocabulary) >> 5):
+                self._merge()
+        else:
+            self._vocabulary = sorted(
+                set(self._vocabulary).union(self._recent, new_tokens).intersection(postings))
+            self._recent = []
+
+    def remove(self, entity_id: str) -> None:
+        for token in self._documents.pop(entity_id, ()):
+            self._unlink(token, entity_id)
+
+    def search(self, query: str, prefix: bool = True) -> Optional[Set[str]]:
+        """Returns the ids having every token of ``query``.
+
+        With ``prefix`` a query token also matches the tokens it starts.
+        Returns ``None`` when ``query`` has no tokens. The longest (most
+        selective) tokens go first; once few candidates remain the other
+        tokens are checked against each candidate's own tokens instead of
+        building their postings.
+        """
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return None
+
+        matches = self._lookup(terms[0], prefix)
+        for term in terms[1:]:
+            if not matches:
+                break
+            if len(matches) <= self.verify_below:
+                matches = {
+                    entity_id for entity_id in matches
+                    if self._has_term(self._documents[entity_id], term, prefix)
+                }
+            else:
+                matches.intersection_update(self._lookup(term, prefix))
+        return matches
+
+    def _lookup(self, term: str, prefix: bool) -> Set[str]:
+        if not prefix:
+            return self._ids(self._postings.get(term))
+
+        matches: Set[str] = set()
+        postings = self._postings
+        for vocabulary in (self._vocabulary, self._recent):
+            position = bisect.bisect_left(vocabulary, term)
+            end = bisect.bisect_left(vocabulary, term + '\U0010ffff', position)
+            for token in vocabulary[position:end]:
+                ids = postings.get(token)
+                if isinstance(ids, str):
+                    matches.add(ids)
+                elif ids:
+                    matches.update(ids)
+        return matches
+
+    @staticmethod
+    def _ids(postings: Optional[Postings]) -> Set[str]:
+        if postings is None:
+            return set()
+        if isinstance(postings, str):
+            return {postings}
+        return set(postings)
+
+    @staticmethod
+    def _has_term(tokens: Tuple[str, ...], term: str, prefix: bool) -> bool:
+        if prefix:
+            return any(token.startswith(term) for token in tokens)
+        return term in tokens
+
+    def _link(self, token: str, entity_id: str) -> None:
+        postings = self._postings.get(token)
+        if postings is None:
+            self._postings[token] = entity_id
+            if not self._in_vocabulary(token):
+                bisect.insort(self._recent, token)
+                if len(self._recent) > max(self.merge_threshold, len(self._vocabulary) >> 5):
+                    self._merge()
+        elif isinstance(postings, str):
+            self._postings[token] = {postings, entity_id}
+        else:
+            postings.add(entity_id)
+
+    def _unlink(self, token: str, entity_id: str) -> None:
+        postings = self._postings[token]
+        if isinstance(postings, str):
+            del self._postings[token]
+            return
+        postings.discard(entity_id)
+        if len(postings) == 1:
+            self._postings[token] = postings.pop()
+
+    def _in_vocabulary(self, token: str) -> bool:
+        for vocabulary in (self._vocabulary, self._recent):
+            position = bisect.bisect_left(vocabulary, token)
+            if position < len(vocabulary) and vocabulary[position] == token:
+                return True
+        return False
+
+    def _merge(self) -> None:
+        vocabulary = self._vocabulary
+        vocabulary.extend(self._recent)
+        vocabulary.sort()
+        self._recent = []
+        postings = self._postings
+        if len(vocabulary) > len(postings):
+            self._vocabulary = [token for token in vocabulary if token in postings]
+
+
+@dataclass(slots=True)
+class InMemoryRepository(RepositoryInterface[ET], ABC):
+    """Keeps entities in a dict, with a ``SortedIndex`` per ``sorted_indexes`` field.
+
+    With ``use_text_index`` the ``text_indexed_fields`` also get a
+    ``TextIndex``. It is opt-in because it makes inserts several times
+    slower, and because filters it answers match by word prefix, which a
+    subclass's ``_apply_filter`` scan need not do.
+    """
+    items: Dict[str, ET] = field(default_factory=dict)
+    use_text_index: bool = False
+    indexes: Dict[str, SortedIndex] = field(default_factory=dict, init=False)
+    text_index: Optional[TextIndex] = field(default_factory=lambda: None, init=False)
+
+    sorted_indexes: ClassVar[List[str]] = []
+    text_indexed_fields: ClassVar[List[str]] = []
+
+    def __post_init__(self):
+        self.indexes = {
+            field_name: SortedIndex(field_name) for field_name in self.sorted_indexes
+        }
+        if self.text_indexed_fields and self.use_text_index:
+            self.text_index = TextIndex(tuple(self.text_indexed_fields))
+        self._index_many(list(self.items.values()))
+
+    def insert(self, entity: ET) -> None:
+        if entity.id in self.items:
+            raise AlreadyExistsException(f"Entity already exists using ID '{entity.id}'")
+        self.items[entity.id] = entity
+        self._index(entity)
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        """Inserts nothing when an id is already stored or repeated in ``entities``."""
+        entity_ids = [entity.id for entity in entities]
+        if len(set(entity_ids)) != len(entity_ids) or not self.items.keys().isdisjoint(entity_ids):
+            seen = set()
+            for entity_id in entity_ids:
+                if entity_id in self.items or entity_id in seen:
+                    raise AlreadyExistsException(f"Entity already exists using ID '{entity_id}'")
+                seen.add(entity_id)
+        self.items.update(zip(entity_ids, entities))
+        self._index_many(entities)
+
+    def find_by_id(self, entity_id: EntityId) -> ET:
+        return self._get(str(entity_id))
+
+    def find_all(self) -> List[ET]:
+        return list(self.items.values())
+
+    def find_all_sorted(
+        self,
+        sort: str,
+        sort_dir: str = 'asc',
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[ET]:
+        index = self.indexes.get(sort)
+        if index is None:
+            raise ValueError(f"The {sort} field is not indexed")
+
+        stop = None if limit is None else offset + limit
+        ids = index.ids(reverse=sort_dir == 'desc', start=offset, stop=stop)
+        return [self.items[entity_id] for entity_id in ids]
+
+    def update(self, entity: ET) -> None:
+        self._get(entity.id)
+        self.items[entity.id] = entity
+        self._index(entity)
+
+    def delete(self, entity_id: EntityId) -> None:
+        entity_id = str(entity_id)
+        self._get(entity_id)
+        del self.items[entity_id]
+        for index in self.indexes.values():
+            index.remove(entity_id)
+        if self.text_index is not None:
+            self.text_index.remove(entity_id)
+
+    def save_changes(self, changes: ChangeSet[ET]) -> None:
+        for entity, _ in changes.updated:
+            self._get(entity.id)
+        for entity_id in changes.deleted:
+            self._get(entity_id)
+
+        self.bulk_insert(changes.inserted)
+        for entity, dirty_fields in changes.updated:
+            self.items[entity.id] = entity
+            for field_name in dirty_fields:
+                index = self.indexes.get(field_name)
+                if index is not None:
+                    index.add(entity)
+            if self.text_index is not None and not dirty_fields.isdisjoint(self.text_indexed_fields):
+                self.text_index.add(entity)
+        for entity_id in changes.deleted:
+            self.delete(entity_id)
+
+    def _get(self, entity_id: str) -> ET:
+        entity = self.items.get(entity_id)
+        if entity is None:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return entity
+
+    def _index(self, entity: ET) -> None:
+        for index in self.indexes.values():
+            index.add(entity)
+        if self.text_index is not None:
+            self.text_index.add(entity)
+
+    def _index_many(self, entities: List[ET]) -> None:
+        for index in self.indexes.values():
+            index.add_many(entities)
+        if self.text_index is not None:
+            self.text_index.add_many(entities)
+
+
+Filter = TypeVar('Filter', str, Any)
+
+
+@dataclass(slots=True, kw_only=True)
+class SearchParams(Generic[Filter]):
+    page: Optional[int] = 1
+    per_page: Optional[int] = 15
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        self._normalize_page()
+        self._normalize_per_page()
+        self._normalize_sort()
+        self._normalize_sort_dir()
+        self._normalize_filter()
+
+    def _normalize_page(self):
+        page = self._convert_to_int(self.page)
+        self.page = page if page > 0 else self._get_dataclass_field('page').default
+
+    def _normalize_per_page(self):
+        per_page = self._convert_to_int(self.per_page)
+        self.per_page = per_page if per_page > 0 \
+            else self._get_dataclass_field('per_page').default
+
+    def _normalize_sort(self):
+        self.sort = None if self.sort == '' or self.sort is None else str(self.sort)
+
+    def _normalize_sort_dir(self):
+        if not self.sort:
+            self.sort_dir = None
+            return
+
+        sort_dir = str(self.sort_dir).lower()
+        self.sort_dir = 'asc' if sort_dir not in ['asc', 'desc'] else sort_dir
+
+    def _normalize_filter(self):
+        self.filter = None if self.filter == '' or self.filter is None else self.filter
+
+    def _convert_to_int(self, value: Any, default: int = 0) -> int:
+        if isinstance(value, bool):
+            return default
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return default
+
+    def _get_dataclass_field(self, field_name: str):
+        return SearchParams.__dataclass_fields__[field_name]  # pylint: disable=no-member
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SearchResult(Generic[ET, Filter]):
+    items: List[ET]
+    total: int
+    current_page: int
+    per_page: int
+    last_page: int = field(init=False)
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'last_page', math.ceil(self.total / self.per_page))
+
+    def to_dict(self):
+        return {
+            'items': self.items,
+            'total': self.total,
+            'current_page': self.current_page,
+            'per_page': self.per_page,
+            'last_page': self.last_page,
+            'sort': self.sort,
+            'sort_dir': self.sort_dir,
+            'filter': self.filter,
+        }
+
+
+Input = TypeVar('Input')
+Output = TypeVar('Output')
+
+
+class SearchableRepositoryInterface(Generic[ET, Input, Output], RepositoryInterface[ET], ABC):
+    sortable_fields: List[str] = []
+
+    @abc.abstractmethod
+    def search(self, input_params: Input) -> Output:
+        raise NotImplementedError()
+
+
+@dataclass(slots=True)
+class InMemorySearchableRepository(
+    Generic[ET, Filter],
+    InMemoryRepository[ET],
+    SearchableRepositoryInterface[ET, SearchParams[Filter], SearchResult[ET, Filter]],
+    ABC
+):
+    """Searches without sorting or copying the whole collection.
+
+    Only the requested page is materialized: unfiltered searches on an indexed
+    field slice the ``SortedIndex`` directly, filtered ones walk it once while
+    counting matches, and non-indexed sorts keep a bounded heap of
+    ``offset + per_page`` items. When ``_filter_ids`` answers a filter from
+    an index (such as ``text_index``), only the matching ids are sorted.
+    """
+
+    default_sort: ClassVar[Optional[str]] = None
+    default_sort_dir: ClassVar[str] = 'asc'
+
+    def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        sort, sort_dir = self._sort_params(input_params.sort, input_params.sort_dir)
+        offset = (input_params.page - 1) * input_params.per_page
+        stop = offset + input_params.per_page
+
+        if input_params.filter is None:
+            total = len(self.items)
+            items = self._paginate_unfiltered(sort, sort_dir, offset, stop)
+        else:
+            total, items = self._paginate_filtered(
+                input_params.filter, sort, sort_dir, offset, stop)
+
+        return SearchResult(
+            items=items,
+            total=total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[Filter] = None
+    ) -> int:
+        """Sets ``values`` on the entities matching ``ids`` and ``filter_param``.
+
+        ``None`` for both selects every entity. Unknown ids are skipped and
+        only the indexes of the updated fields are touched; returns the
+        number of matched entities.
+        """
+        if not values:
+            raise ValueError('There are no values to update')
+        matched = None if filter_param is None else self._filter_ids(filter_param)
+        if ids is None:
+            entities: Iterable[ET] = self.items.values() if matched is None \
+                else map(self.items.__getitem__, matched)
+        else:
+            ids = dict.fromkeys(map(str, ids))
+            if matched is not None:
+                ids = [entity_id for entity_id in ids if entity_id in matched]
+            entities = filter(None, map(self.items.get, ids))
+        if filter_param is not None and matched is None:
+            entities = self._apply_filter(entities, filter_param)
+
+        entities = list(entities)
+        self._set_values(entities, values)
+        return len(entities)
+
+    def _set_values(self, entities: List[ET], values: Dict[str, Any]) -> None:
+        """Sets ``values`` through ``Entity._set`` and re-indexes only the updated fields.
+
+        The stored entities are the ones changed, so the write is saved as
+        soon as it is made: the fields it set are dropped from their dirty
+        fields again, while other unsaved changes stay dirty.
+        """
+        indexes: List[Union[SortedIndex, TextIndex]] = [
+            index for name, index in self.indexes.items() if name in values]
+        if self.text_index is not None and not values.keys().isdisjoint(self.text_indexed_fields):
+            indexes.append(self.text_index)
+        setattr_ = object.__setattr__
+        for entity in entities:
+            dirty_fields = entity._dirty_fields  # pylint: disable=protected-access
+            unsaved = set(dirty_fields) if dirty_fields else None
+            for name, value in values.items():
+                entity._set(name, value)  # pylint: disable=protected-access
+            if unsaved is not None:
+                unsaved.difference_update(values)
+            setattr_(entity, '_dirty_fields', unsaved or None)
+            for index in indexes:
+                index.add(entity)
+
+    @abc.abstractmethod
+    def _apply_filter(self, items: Iterable[ET], filter_param: Filter) -> Iterator[ET]:
+        raise NotImplementedError()
+
+    def _filter_ids(self, filter_param: Filter) -> Optional[Set[str]]:  # pylint: disable=unused-argument
+        """Ids matching ``filter_param`` from an index, or ``None`` to scan with ``_apply_filter``."""
+        return None
+
+    def _sort_params(self, sort: Optional[str], sort_dir: Optional[str]) -> Tuple[Optional[str], str]:
+        if sort is None:
+            return self.default_sort, self.default_sort_dir
+        if sort not in self.sortable_fields:
+            return None, 'asc'
+        return sort, sort_dir
+
+    def _paginate_unfiltered(self, sort: Optional[str], sort_dir: str, offset: int, stop: int) -> List[ET]:
+        index = self.indexes.get(sort)
+        if index is not None:
+            ids = index.ids(reverse=sort_dir == 'desc', start=offset, stop=stop)
+            return [self.items[entity_id] for entity_id in ids]
+        return self._paginate(self.items.values(), sort, sort_dir, offset, stop)
+
+    def _paginate_filtered(
+        self,
+        filter_param: Filter,
+        sort: Optional[str],
+        sort_dir: str,
+        offset: int,
+        stop: int
+    ) -> Tuple[int, List[ET]]:
+        matched = self._filter_ids(filter_param)
+        if matched is not None:
+            return len(matched), self._paginate_ids(matched, sort, sort_dir, offset, stop)
+
+        index = self.indexes.get(sort)
+        if index is None:
+            matches = list(self._apply_filter(self.items.values(), filter_param))
+            return len(matches), self._paginate(matches, sort, sort_dir, offset, stop)
+
+        ordered = (self.items[entity_id]
+                   for entity_id in index.ids(reverse=sort_dir == 'desc'))
+        total = 0
+        items = []
+        for entity in self._apply_filter(ordered, filter_param):
+            if offset <= total < stop:
+                items.append(entity)
+            total += 1
+        return total, items
+
+    def _paginate_ids(
+        self,
+        matched: Set[str],
+        sort: Optional[str],
+        sort_dir: str,
+        offset: int,
+        stop: int
+    ) -> List[ET]:
+        if sort is None:
+            ordered = (entity for entity_id, entity in self.items.items() if entity_id in matched)
+            return list(itertools.islice(ordered, offset, stop))
+
+        # Walking the index visits about stop * len(items) / len(matched) ids,
+        # sorting the matches costs len(matched); take the cheaper one.
+        index = self.indexes.get(sort)
+        if index is not None and stop * len(self.items) < len(matched) ** 2:
+            ordered_ids = (entity_id for entity_id in index.ids(reverse=sort_dir == 'desc')
+                           if entity_id in matched)
+            return [self.items[entity_id]
+                    for entity_id in itertools.islice(ordered_ids, offset, stop)]
+
+        def key(entity_id: str):
+            value = getattr(self.items[entity_id], sort)
+            return value is not None, value, entity_id
+
+        select = heapq.nlargest if sort_dir == 'desc' else heapq.nsmallest
+        return [self.items[entity_id] for entity_id in select(stop, matched, key=key)[offset:]]
+
+    def _paginate(
+        self,
+        items: Iterable[ET],
+        sort: Optional[str],
+        sort_dir: str,
+        offset: int,
+        stop: int
+    ) -> List[ET]:
+        if sort is None:
+            return list(itertools.islice(items, offset, stop))
+
+        def key(item: ET):
+            value = getattr(item, sort)
+            return value is not None, value
+
+        select = heapq.nlargest if sort_dir == 'desc' else heapq.nsmallest
+        return select(stop, items, key=key)[offset:]
+
+
+class AsyncRepositoryInterface(Generic[ET], ABC):
+
+    @abc.abstractmethod
+    async def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_by_id(self, entity_id: EntityId) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def delete(self, entity_id: EntityId) -> None:
+        raise NotImplementedError()
+
+    async def save_changes(self, changes: ChangeSet[ET]) -> None:
+        if changes.inserted:
+            await self.bulk_insert(changes.inserted)
+        for entity, _ in changes.updated:
+            await self.update(entity)
+        for entity_id in changes.deleted:
+            await self.delete(entity_id)
+
+
+class AsyncSearchableRepositoryInterface(Generic[ET, Input, Output], AsyncRepositoryInterface[ET], ABC):
+    sortable_fields: List[str] = []
+
+    @abc.abstractmethod
+    async def search(self, input_params: Input) -> Output:
+        raise NotImplementedError()
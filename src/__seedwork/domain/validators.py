@@ -1,18 +1,31 @@
 import abc
 from abc import ABC
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Generic, TypeVar
-
-from rest_framework.serializers import Serializer
-from django.conf import settings
+from dataclasses import dataclass, field
+import functools
+import importlib.metadata
+import keyword
+import re
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Generic, Optional, Sequence,
+    Tuple, TypeVar, Union
+)
 
 from __seedwork.domain.exceptions import ValidationException
 
-if not settings.configured:
-    settings.configure(
-        USE_I18N=False
-    )
+if TYPE_CHECKING:
+    from rest_framework.serializers import Serializer
+
+
+@functools.cache
+def configure_django() -> None:
+    """Configures Django on first use so importing this module stays Django-free."""
+    from django.conf import settings  # pylint: disable=import-outside-toplevel
+
+    if not settings.configured:
+        settings.configure(
+            USE_I18N=False
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -48,6 +61,165 @@ class ValidatorRules:
 
 ErrorFields = Dict[str, List[str]]
 
+
+@dataclass(slots=True)
+class BatchValidationResult:
+    size: int
+    mask: bytearray = None
+    errors: Dict[int, ErrorFields] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.mask is None:
+            self.mask = bytearray(self.size)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def add_error(self, row: int, prop: str, message: str) -> None:
+        self.mask[row] = 1
+        self.errors.setdefault(row, {}).setdefault(prop, []).append(message)
+
+    def valid_rows(self) -> Iterator[int]:
+        return (row for row, invalid in enumerate(self.mask) if not invalid)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchValidatorRules:
+    """Column-wise counterpart of ``ValidatorRules``.
+
+    Applies each rule to a whole column and records failures in a
+    ``BatchValidationResult`` instead of raising. As with ``ValidatorRules``,
+    a row stops being checked for a prop after its first failed rule.
+    """
+    column: Sequence[Any]
+    prop: str
+    result: BatchValidationResult
+    failed: bytearray
+
+    @staticmethod
+    def values(
+        column: Sequence[Any],
+        prop: str,
+        result: Optional[BatchValidationResult] = None
+    ) -> 'BatchValidatorRules':
+        if result is None:
+            result = BatchValidationResult(len(column))
+        return BatchValidatorRules(column, prop, result, bytearray(len(column)))
+
+    def required(self) -> 'BatchValidatorRules':
+        self._fail([
+            row for row, value in enumerate(self.column)
+            if value is None or value == ''
+        ], f"The {self.prop} is required")
+        return self
+
+    def string(self) -> 'BatchValidatorRules':
+        self._fail([
+            row for row, value in enumerate(self.column)
+            if value is not None and not isinstance(value, str)
+        ], f"The {self.prop} must be a string")
+        return self
+
+    def max_length(self, max_length: int) -> 'BatchValidatorRules':
+        failed = self.failed
+        self._fail([
+            row for row, value in enumerate(self.column)
+            if value is not None and not failed[row] and len(value) > max_length
+        ], f"The {self.prop} must be less than {max_length}")
+        return self
+
+    def boolean(self) -> 'BatchValidatorRules':
+        self._fail([
+            row for row, value in enumerate(self.column)
+            if value is not None and value is not True and value is not False
+        ], f"The {self.prop} must be a boolean")
+        return self
+
+    def _fail(self, rows: List[int], message: str) -> None:
+        failed = self.failed
+        for row in rows:
+            if not failed[row]:
+                failed[row] = 1
+                self.result.add_error(row, self.prop, message)
+
+
+Rule = Union[str, Tuple[Any, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatorSchema:
+    """Rule chains declared once per entity class.
+
+    ``rules`` maps each prop to the ``ValidatorRules`` methods to chain,
+    either as a name (``'required'``) or a name plus arguments
+    (``('max_length', 255)``). ``compile`` turns the whole schema into one
+    generated function that raises the same ``ValidationException``
+    messages as the equivalent ``ValidatorRules`` chains.
+    """
+    rules: Dict[str, Tuple[Rule, ...]]
+
+    _conditions = {
+        'required': ("{var} is None or {var} == ''", "The {prop} is required"),
+        'string': ("{var} is not None and not isinstance({var}, str)",
+                   "The {prop} must be a string"),
+        'max_length': ("{var} is not None and len({var}) > {arg}",
+                       "The {prop} must be less than {arg}"),
+        'boolean': ("{var} is not None and {var} is not True and {var} is not False",
+                    "The {prop} must be a boolean"),
+    }
+
+    def compile(self, name: str = 'validate') -> Callable[..., None]:
+        props = list(self.rules)
+        for prop in props:
+            if not prop.isidentifier() or keyword.iskeyword(prop):
+                raise ValueError(f"The {prop} prop can not be compiled")
+
+        lines = [f"def {name}({', '.join(f'{prop}=None' for prop in props)}):"]
+        for prop, rules in self.rules.items():
+            for rule_name, args in self._normalize(rules):
+                condition, message = self._conditions[rule_name]
+                arg = int(args[0]) if args else None
+                lines.append(f"    if {condition.format(var=prop, arg=arg)}:")
+                lines.append(
+                    f"        raise ValidationException({message.format(prop=prop, arg=arg)!r})")
+        lines.append("    return None")
+
+        namespace = {'ValidationException': ValidationException}
+        exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+        return namespace[name]
+
+    def subset(self, props: Iterable[str]) -> 'ValidatorSchema':
+        """The rules of ``props`` only, for validating partial changes."""
+        props = set(props)
+        unknown = sorted(props - self.rules.keys())
+        if unknown:
+            raise ValueError(f"The {unknown[0]} prop is not in the schema")
+        return ValidatorSchema({
+            prop: rules for prop, rules in self.rules.items() if prop in props
+        })
+
+    def validate_batch(self, **columns: Optional[Sequence[Any]]) -> BatchValidationResult:
+        size = next(len(column) for column in columns.values() if column is not None)
+        result = BatchValidationResult(size)
+        for prop, rules in self.rules.items():
+            column = columns.get(prop)
+            if column is None:
+                continue
+            validator = BatchValidatorRules.values(column, prop, result)
+            for rule_name, args in self._normalize(rules):
+                getattr(validator, rule_name)(*args)
+        return result
+
+    @staticmethod
+    def _normalize(rules: Tuple[Rule, ...]) -> Iterator[Tuple[str, Tuple[Any, ...]]]:
+        for rule in rules:
+            if isinstance(rule, str):
+                yield rule, ()
+            else:
+                yield rule[0], tuple(rule[1:])
+
+
 PropsValidated = TypeVar('PropsValidated')
 
 
@@ -61,9 +233,185 @@ class ValidatorFieldsInterface(ABC, Generic[PropsValidated]):
         raise NotImplementedError()
 
 
+class FieldError(Exception):
+    pass
+
+
+empty = object()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NativeField(ABC):
+    """Django-free counterpart of a ``rest_framework`` serializer field.
+
+    Error messages follow the DRF defaults so ``NativeValidator`` reports
+    the same ``errors`` as ``DRFValidator`` for the supported options.
+    """
+    required: bool = True
+    allow_null: bool = False
+
+    def run_validation(self, data: Any) -> Any:
+        if data is empty:
+            if self.required:
+                raise FieldError(['This field is required.'])
+            return empty
+        if data is None:
+            if not self.allow_null:
+                raise FieldError(['This field may not be null.'])
+            return None
+        return self.to_internal_value(data)
+
+    @abc.abstractmethod
+    def to_internal_value(self, data: Any) -> Any:
+        raise NotImplementedError()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CharField(NativeField):
+    allow_blank: bool = False
+    trim_whitespace: bool = True
+    max_length: Optional[int] = None
+    min_length: Optional[int] = None
+
+    _surrogates: ClassVar[re.Pattern] = re.compile('[\ud800-\udfff]')
+
+    def run_validation(self, data: Any) -> Any:
+        if data == '' or (self.trim_whitespace and data is not empty and data is not None
+                          and str(data).strip() == ''):
+            if not self.allow_blank:
+                raise FieldError(['This field may not be blank.'])
+            return ''
+        return NativeField.run_validation(self, data)
+
+    def to_internal_value(self, data: Any) -> str:
+        if isinstance(data, bool) or not isinstance(data, (str, int, float)):
+            raise FieldError(['Not a valid string.'])
+        value = str(data)
+        if self.trim_whitespace:
+            value = value.strip()
+
+        errors = []
+        if self.max_length is not None and len(value) > self.max_length:
+            errors.append(
+                f'Ensure this field has no more than {self.max_length} characters.')
+        if self.min_length is not None and len(value) < self.min_length:
+            errors.append(f'Ensure this field has at least {self.min_length} characters.')
+        if '\x00' in value:
+            errors.append('Null characters are not allowed.')
+        surrogate = self._surrogates.search(value)
+        if surrogate is not None:
+            errors.append(
+                f'Surrogate characters are not allowed: U+{ord(surrogate.group()):X}.')
+        if errors:
+            raise FieldError(errors)
+        return value
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BooleanField(NativeField):
+    """Accepts exactly the strings DRF's ``BooleanField`` accepts.
+
+    Up to DRF 3.14 those are fixed sets of spellings, so ``'tRuE'`` is
+    invalid; DRF 3.15 lowercases strings first. The installed release is
+    read from the package metadata, without importing DRF, and the fixed
+    sets are used when DRF is not installed.
+    """
+    _true_values: ClassVar[frozenset] = frozenset({
+        't', 'T', 'y', 'Y', 'yes', 'Yes', 'YES', 'true', 'True', 'TRUE',
+        'on', 'On', 'ON', '1', 1, True})
+    _false_values: ClassVar[frozenset] = frozenset({
+        'f', 'F', 'n', 'N', 'no', 'No', 'NO', 'false', 'False', 'FALSE',
+        'off', 'Off', 'OFF', '0', 0, 0.0, False})
+    _null_values: ClassVar[frozenset] = frozenset({'null', 'Null', 'NULL', '', None})
+
+    def to_internal_value(self, data: Any) -> Optional[bool]:
+        value = data.lower() if isinstance(data, str) and _drf_lowercases_booleans() else data
+        try:
+            if value in self._true_values:
+                return True
+            if value in self._false_values:
+                return False
+            if value in self._null_values and self.allow_null:
+                return None
+        except TypeError:
+            pass
+        raise FieldError(['Must be a valid boolean.'])
+
+
+@functools.cache
+def _drf_lowercases_booleans() -> bool:
+    try:
+        version = importlib.metadata.version('djangorestframework')
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return tuple(map(int, re.findall(r'\d+', version)[:2])) >= (3, 15)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class IntegerField(NativeField):
+    max_value: Optional[int] = None
+    min_value: Optional[int] = None
+
+    _decimal: ClassVar[re.Pattern] = re.compile(r'\.0*\s*$')
+
+    def to_internal_value(self, data: Any) -> int:
+        if isinstance(data, str) and len(data) > 1000:
+            raise FieldError(['String value too large.'])
+        try:
+            value = int(self._decimal.sub('', str(data)))
+        except (ValueError, TypeError) as ex:
+            raise FieldError(['A valid integer is required.']) from ex
+
+        errors = []
+        if self.max_value is not None and value > self.max_value:
+            errors.append(f'Ensure this value is less than or equal to {self.max_value}.')
+        if self.min_value is not None and value < self.min_value:
+            errors.append(f'Ensure this value is greater than or equal to {self.min_value}.')
+        if errors:
+            raise FieldError(errors)
+        return value
+
+
+class NativeValidator(ValidatorFieldsInterface[PropsValidated], ABC):
+    """Validates plain dicts against ``fields`` without Django.
+
+    Produces the same ``errors``/``validated_data`` shape as ``DRFValidator``.
+    """
+
+    fields: ClassVar[Dict[str, NativeField]] = {}
+
+    def validate(self, data: Any) -> bool:
+        if not isinstance(data, dict):
+            self.errors = {
+                'non_field_errors': [
+                    f'Invalid data. Expected a dictionary, but got {type(data).__name__}.'
+                ]
+            }
+            return False
+
+        errors = {}
+        validated_data = {}
+        for name, native_field in self.fields.items():
+            try:
+                value = native_field.run_validation(data.get(name, empty))
+            except FieldError as error:
+                errors[name] = error.args[0]
+                continue
+            if value is not empty:
+                validated_data[name] = value
+
+        if errors:
+            self.errors = errors
+            return False
+
+        self.validated_data = validated_data
+        return True
+
+
 class DRFValidator(ValidatorFieldsInterface[PropsValidated], ABC):
 
-    def validate(self, data: Serializer) -> bool:
+    def validate(self, data: 'Serializer') -> bool:
+        configure_django()
         serializer = data
 
         if serializer.is_valid():
@@ -2,9 +2,13 @@ from dataclasses import dataclass, field, fields
 
 import json
 
+import os
+import re
+import time
 import uuid
 
 from abc import ABC
+from typing import Callable, Union
 
 from __seedwork.domain.exceptions import InvalidUuidException
 
@@ -12,33 +16,179 @@ from __seedwork.domain.exceptions import InvalidUuidException
 @dataclass(frozen=True, slots=True)
 class ValueObject(ABC):
 
+    def __init_subclass__(cls, **kwargs):
+        # A subclass may add fields, so it gets its own __str__ unless it inherits a hand-written one.
+        super(ValueObject, cls).__init_subclass__(**kwargs)
+        inherited = cls.__str__
+        if '__str__' not in cls.__dict__ and (
+                inherited is ValueObject.__str__ or getattr(inherited, 'generated', False)):
+            cls.__str__ = ValueObject.__str__
+
     def __str__(self):
-        fields_name = [field.name for field in fields(self)]
-        return getattr(self, fields_name[0]) \
-            if len(fields_name) == 1 \
-            else json.dumps({
-                field_name: getattr(self, field_name) for field_name in fields_name
-            })
+        """Generates ``__str__`` for the concrete class on first use and installs it there.
+
+        The field names are only known once ``@dataclass`` has run, after
+        ``__init_subclass__``. The generated method returns the single
+        field directly, or ``json.dumps`` of a dict literal of the fields,
+        without calling ``fields()`` again.
+        """
+        value_object_class = type(self)
+        str_method = value_object_class._generate_str()
+        if value_object_class is not ValueObject:
+            value_object_class.__str__ = str_method
+        return str_method(self)
+
+    @classmethod
+    def _generate_str(cls) -> Callable[['ValueObject'], str]:
+        names = [value_object_field.name for value_object_field in fields(cls)]
+        if len(names) == 1:
+            body = f'self.{names[0]}'
+        else:
+            body = 'dumps({' + ''.join(f'{name!r}: self.{name}, ' for name in names) + '})'
+
+        namespace = {'dumps': json.dumps}
+        exec(f'def __str__(self):\n    return {body}', namespace)  # pylint: disable=exec-used
+        str_method = namespace['__str__']
+        str_method.generated = True
+        return str_method
+
+
+_UUID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
+
+# The form ``str(uuid.UUID(...))`` produces, the only one CompactUniqueEntityId can give back.
+_CANONICAL_UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+_VERSION_MASK = ~(0xf000 << 64) & ~(0xc000 << 48)
+_VARIANT_RFC_4122 = 0x8000 << 48
+
+
+def _format_uuid(value: int) -> str:
+    hex_value = '%032x' % value
+    return f'{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}'
+
+
+def generate_uuid4() -> str:
+    value = int.from_bytes(os.urandom(16), 'big')
+    return _format_uuid(value & _VERSION_MASK | 0x4000 << 64 | _VARIANT_RFC_4122)
+
+
+def generate_uuid7() -> str:
+    """UUIDv7: a 48-bit Unix timestamp in milliseconds followed by random bits,
+    so ids generated later sort after earlier ones."""
+    value = time.time_ns() // 1_000_000 << 80 | int.from_bytes(os.urandom(10), 'big')
+    return _format_uuid(value & _VERSION_MASK | 0x7000 << 64 | _VARIANT_RFC_4122)
+
+
+# Default of the generated ids, so an explicit ``None`` is still rejected.
+_GENERATE = object()
 
 
 @dataclass(frozen=True, slots=True)
 class UniqueEntityId(ValueObject):
-    id: str = field(
-        default_factory=lambda: str(uuid.uuid4())
-    )
+    id: str = _GENERATE
 
     def __post_init__(self):
-        id_value = str(self.id) if isinstance(self.id, uuid.UUID) else self.id
+        if self.id is _GENERATE:
+            object.__setattr__(self, 'id', generate_uuid4())
+        elif isinstance(self.id, uuid.UUID):
+            object.__setattr__(self, 'id', str(self.id))
+        else:
+            self.__validate()
 
-        object.__setattr__(self, 'id', id_value)
+    @classmethod
+    def time_ordered(cls) -> 'UniqueEntityId':
+        return cls.from_trusted(generate_uuid7())
 
-        self.__validate()
+    @classmethod
+    def from_trusted(cls, id: str) -> 'UniqueEntityId':  # pylint: disable=redefined-builtin
+        unique_entity_id = object.__new__(cls)
+        object.__setattr__(unique_entity_id, 'id', id)
+        return unique_entity_id
+
+    def compact(self) -> Union['CompactUniqueEntityId', 'UniqueEntityId']:
+        """Returns the ``CompactUniqueEntityId`` equal to this id, or this id
+        itself when it is not spelled in canonical form (uppercase, braces,
+        ``urn:uuid:``, no hyphens), since the int would change its ``str()``,
+        equality and hash."""
+        return CompactUniqueEntityId.from_trusted(self.id)
 
     def __validate(self) -> None:
+        if isinstance(self.id, str) and _UUID_PATTERN.fullmatch(self.id):
+            return
         try:
             uuid.UUID(self.id)
-        except ValueError as ex:
+        except (ValueError, TypeError, AttributeError) as ex:
             raise InvalidUuidException() from ex
 
     # def __str__(self) -> str:
         # return f"{self.id}"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CompactUniqueEntityId(ValueObject):
+    """A ``UniqueEntityId`` that keeps the 128-bit UUID as an ``int``.
+
+    Uses about half the memory of the 36-character string. ``str()`` and
+    ``id`` return the canonical lowercase form, and an instance compares
+    and hashes equal to the ``UniqueEntityId`` holding that same string,
+    so both can key the same dicts. Only canonical ids are kept in this
+    form: ``compact`` and ``from_trusted`` leave any other spelling in a
+    ``UniqueEntityId``. Entities built by ``hydrate_many`` keep this form
+    only when their class sets ``compact_ids``.
+    """
+    value: int = _GENERATE
+
+    def __post_init__(self):
+        if self.value is _GENERATE:
+            value = int.from_bytes(os.urandom(16), 'big')
+            object.__setattr__(
+                self, 'value', value & _VERSION_MASK | 0x4000 << 64 | _VARIANT_RFC_4122)
+        elif not isinstance(self.value, int) or isinstance(self.value, bool) \
+                or not 0 <= self.value < 1 << 128:
+            raise InvalidUuidException()
+
+    @classmethod
+    def from_trusted(
+        cls, id: str  # pylint: disable=redefined-builtin
+    ) -> Union['CompactUniqueEntityId', UniqueEntityId]:
+        """Converts a UUID string that was validated before it was stored.
+
+        Any spelling other than the canonical one is returned as a
+        ``UniqueEntityId`` holding it unchanged.
+        """
+        if not _CANONICAL_UUID_PATTERN.fullmatch(id):
+            return UniqueEntityId.from_trusted(id)
+        compact_id = object.__new__(cls)
+        object.__setattr__(compact_id, 'value', int(id.replace('-', ''), 16))
+        return compact_id
+
+    @classmethod
+    def from_id(cls, id: str) -> 'CompactUniqueEntityId':  # pylint: disable=redefined-builtin
+        if isinstance(id, str) and _UUID_PATTERN.fullmatch(id):
+            return cls(int(id.replace('-', ''), 16))
+        try:
+            return cls(uuid.UUID(id).int)
+        except (ValueError, TypeError, AttributeError) as ex:
+            raise InvalidUuidException() from ex
+
+    @property
+    def id(self) -> str:
+        return _format_uuid(self.value)
+
+    def expand(self) -> UniqueEntityId:
+        return UniqueEntityId.from_trusted(self.id)
+
+    def __str__(self) -> str:
+        return _format_uuid(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactUniqueEntityId):
+            return self.value == other.value
+        if isinstance(other, UniqueEntityId):
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((_format_uuid(self.value),))
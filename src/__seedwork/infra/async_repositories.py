@@ -0,0 +1,73 @@
+import asyncio
+import functools
+import threading
+
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, List, Optional
+
+from __seedwork.domain.repositories import (
+    ET,
+    AsyncSearchableRepositoryInterface,
+    ChangeSet,
+    EntityId,
+    Input,
+    Output,
+    SearchableRepositoryInterface
+)
+
+
+@dataclass(slots=True)
+class ThreadOffloadedRepository(
+    Generic[ET, Input, Output],
+    AsyncSearchableRepositoryInterface[ET, Input, Output]
+):
+    """Exposes a synchronous repository to asyncio code.
+
+    Every call runs in ``executor`` (the loop's default executor when
+    ``None``), so blocking I/O such as SQLite never stalls the event loop.
+    Repositories that are not thread-safe, such as the in-memory ones,
+    must be wrapped with ``thread_safe=False`` so calls are serialized.
+    """
+    repository: SearchableRepositoryInterface[ET, Input, Output]
+    executor: Optional[Executor] = None
+    thread_safe: bool = True
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self.repository.sortable_fields
+
+    async def insert(self, entity: ET) -> None:
+        await self._run(self.repository.insert, entity)
+
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        await self._run(self.repository.bulk_insert, entities)
+
+    async def find_by_id(self, entity_id: EntityId) -> ET:
+        return await self._run(self.repository.find_by_id, entity_id)
+
+    async def find_all(self) -> List[ET]:
+        return await self._run(self.repository.find_all)
+
+    async def update(self, entity: ET) -> None:
+        await self._run(self.repository.update, entity)
+
+    async def delete(self, entity_id: EntityId) -> None:
+        await self._run(self.repository.delete, entity_id)
+
+    async def save_changes(self, changes: ChangeSet[ET]) -> None:
+        await self._run(self.repository.save_changes, changes)
+
+    async def search(self, input_params: Input) -> Output:
+        return await self._run(self.repository.search, input_params)
+
+    async def _run(self, method: Callable[..., Any], *args: Any) -> Any:
+        if not self.thread_safe:
+            method = functools.partial(self._locked, method)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, method, *args)
+
+    def _locked(self, method: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            return method(*args)
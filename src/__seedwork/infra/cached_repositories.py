@@ -0,0 +1,206 @@
+import contextvars
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple
+
+from __seedwork.domain.repositories import (
+    ET,
+    ChangeSet,
+    EntityId,
+    Input,
+    Output,
+    SearchableRepositoryInterface
+)
+
+Row = Dict[str, Any]
+
+# The identity maps of the active units of work, keyed by the id() of their
+# CachedRepository. Context variables are never freed, so there is one for
+# all repositories rather than one per instance.
+_identity_maps: contextvars.ContextVar[Optional[Dict[int, Dict[str, Any]]]] = \
+    contextvars.ContextVar('identity_maps', default=None)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    identity_hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class LruCache:
+    """A bounded, thread-safe LRU mapping whose entries expire after ``ttl`` seconds."""
+    maxsize: int = 10_000
+    ttl: Optional[float] = None
+    clock: Callable[[], float] = time.monotonic
+    stats: CacheStats = field(default_factory=CacheStats)
+    _entries: 'OrderedDict[str, Tuple[float, Any]]' = field(default_factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < self.clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        expires_at = float('inf') if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass(slots=True)
+class CachedRepository(Generic[ET, Input, Output], SearchableRepositoryInterface[ET, Input, Output]):
+    """Read-through cache in front of another repository.
+
+    ``find_by_id`` first looks in the identity map of the current unit of
+    work (see ``identity_map``), then in an LRU/TTL cache, and only then
+    in ``repository``. The cache keeps ``to_dict`` snapshots and hydrates
+    a fresh entity on every lookup, misses included, so in-place changes
+    such as ``Category.update`` never leak into other callers before they
+    are saved. Entries are invalidated by ``update`` and ``delete``.
+    """
+    repository: SearchableRepositoryInterface[ET, Input, Output]
+    cache: LruCache = field(default_factory=LruCache)
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self.repository.sortable_fields
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    @contextmanager
+    def identity_map(self) -> Iterator[Dict[str, ET]]:
+        """Within the block, every lookup of an id returns the same instance.
+
+        The map is held in a context variable, so concurrent threads and
+        asyncio tasks each get their own unit of work.
+        """
+        entities = self._active_identity_map()
+        if entities is not None:
+            yield entities
+            return
+        entities = {}
+        token = _identity_maps.set({**(_identity_maps.get() or {}), id(self): entities})
+        try:
+            yield entities
+        finally:
+            _identity_maps.reset(token)
+
+    def insert(self, entity: ET) -> None:
+        self.repository.insert(entity)
+        self._remember(entity)
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        self.repository.bulk_insert(entities)
+        identity_map = self._active_identity_map()
+        if identity_map is not None:
+            identity_map.update((entity.id, entity) for entity in entities)
+
+    def find_by_id(self, entity_id: EntityId) -> ET:
+        key = str(entity_id)
+        entities = self._active_identity_map()
+        if entities is not None and key in entities:
+            self.cache.stats.identity_hits += 1
+            return entities[key]
+
+        snapshot: Optional[Tuple[type, Row]] = self.cache.get(key)
+        if snapshot is None:
+            # An in-memory inner repository returns its own instance, so a miss hydrates a copy too.
+            found = self.repository.find_by_id(key)
+            snapshot = (type(found), found.to_dict())
+            self.cache.put(key, snapshot)
+        entity_class, row = snapshot
+        entity = entity_class.hydrate_many((row,))[0]
+
+        if entities is not None:
+            entities[key] = entity
+        return entity
+
+    def find_all(self) -> List[ET]:
+        return self.repository.find_all()
+
+    def update(self, entity: ET) -> None:
+        self.repository.update(entity)
+        self.cache.pop(entity.id)
+        self._remember(entity)
+
+    def delete(self, entity_id: EntityId) -> None:
+        key = str(entity_id)
+        self.repository.delete(key)
+        self._forget((key,))
+
+    def save_changes(self, changes: ChangeSet[ET]) -> None:
+        self.repository.save_changes(changes)
+        entities = self._active_identity_map()
+        for entity, _ in changes.updated:
+            self.cache.pop(entity.id)
+            if entities is not None:
+                entities[entity.id] = entity
+        self._forget(changes.deleted)
+        for entity in changes.inserted:
+            self._remember(entity)
+
+    def search(self, input_params: Input) -> Output:
+        return self.repository.search(input_params)
+
+    def _forget(self, entity_ids: Optional[Iterable[str]] = None) -> None:
+        """Drops ``entity_ids`` from the cache and identity map, or everything when ``None``."""
+        entities = self._active_identity_map()
+        if entity_ids is None:
+            self.cache.clear()
+            if entities is not None:
+                entities.clear()
+            return
+        for entity_id in entity_ids:
+            self.cache.pop(entity_id)
+            if entities is not None:
+                entities.pop(entity_id, None)
+
+    def _active_identity_map(self) -> Optional[Dict[str, ET]]:
+        identity_maps = _identity_maps.get()
+        return None if identity_maps is None else identity_maps.get(id(self))
+
+    def _remember(self, entity: ET) -> None:
+        entities = self._active_identity_map()
+        if entities is not None:
+            entities[entity.id] = entity
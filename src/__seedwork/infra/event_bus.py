@@ -0,0 +1,268 @@
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from __seedwork.domain.events import (
+    AsyncEventBusInterface,
+    DomainEvent,
+    EventBusInterface,
+    Handler
+)
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass(slots=True)
+class HandlerRegistry:
+    """Maps event types to handlers; a handler subscribed to a base class gets its subclasses too."""
+    _handlers: Dict[type, List[Handler]] = field(default_factory=dict)
+    _resolved: Dict[type, Tuple[Handler, ...]] = field(default_factory=dict)
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def handlers_for(self, event_type: type) -> Tuple[Handler, ...]:
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            handlers = self._resolved[event_type] = tuple(
+                handler
+                for base in reversed(event_type.__mro__)
+                for handler in self._handlers.get(base, ())
+            )
+        return handlers
+
+    def group(self, events: Iterable[DomainEvent]) -> Dict[Handler, List[DomainEvent]]:
+        """Splits events into one batch per handler, keeping their order."""
+        batches: Dict[Handler, List[DomainEvent]] = {}
+        handlers_for = self.handlers_for
+        for event in events:
+            for handler in handlers_for(type(event)):
+                batch = batches.get(handler)
+                if batch is None:
+                    batches[handler] = [event]
+                else:
+                    batch.append(event)
+        return batches
+
+
+@dataclass(slots=True)
+class EventBusStats:
+    published: int = 0
+    delivered: int = 0
+    failed: int = 0
+    batches: int = 0
+
+    def record(self, events: List[DomainEvent], succeeded: bool) -> None:
+        if succeeded:
+            self.delivered += len(events)
+        else:
+            self.failed += len(events)
+        self.batches += 1
+
+
+def _log_failure(handler: Handler, events: List[DomainEvent]) -> None:
+    logger.exception('Event handler %r failed on %d events', handler, len(events))
+
+
+def _run_handler(handler: Handler, events: List[DomainEvent]) -> bool:
+    try:
+        handler(events)
+    except Exception:  # pylint: disable=broad-except
+        _log_failure(handler, events)
+        return False
+    return True
+
+
+@dataclass(slots=True)
+class SyncEventBus(EventBusInterface):
+    """Runs the handlers in the publishing thread, one batch per handler and ``publish``."""
+    registry: HandlerRegistry = field(default_factory=HandlerRegistry)
+    stats: EventBusStats = field(default_factory=EventBusStats)
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self.registry.subscribe(event_type, handler)
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        events = list(events)
+        self.stats.published += len(events)
+        for handler, batch in self.registry.group(events).items():
+            self.stats.record(batch, _run_handler(handler, batch))
+
+
+@dataclass(slots=True)
+class ThreadPoolEventBus(EventBusInterface):
+    """Batches published events and runs the handlers on a thread pool.
+
+    ``publish`` only enqueues, and blocks once ``max_pending`` events are
+    waiting, so a slow handler slows publishers down instead of growing
+    memory. A dispatcher thread drains up to ``batch_size`` events at a
+    time, groups them per handler and submits each group, with at most
+    ``2 * workers`` groups in flight. Batches of one handler may run
+    concurrently, so handlers must be thread-safe. A failing handler is
+    logged and counted in ``stats.failed``. ``close`` delivers everything
+    still queued; publishing afterwards raises ``RuntimeError``.
+    """
+    registry: HandlerRegistry = field(default_factory=HandlerRegistry)
+    workers: int = 4
+    batch_size: int = 1000
+    max_pending: int = 10_000
+    stats: EventBusStats = field(default_factory=EventBusStats)
+    _queue: queue.Queue = field(init=False)
+    _in_flight: threading.Semaphore = field(init=False)
+    _stats_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _executor: ThreadPoolExecutor = field(init=False)
+    _dispatcher: threading.Thread = field(init=False)
+    _closed: bool = field(default=False, init=False)
+
+    def __post_init__(self):
+        self._queue = queue.Queue(maxsize=self.max_pending)
+        self._in_flight = threading.Semaphore(2 * self.workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix='event-handler')
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name='event-dispatcher', daemon=True)
+        self._dispatcher.start()
+
+    def __enter__(self) -> 'ThreadPoolEventBus':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self.registry.subscribe(event_type, handler)
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        if self._closed:
+            raise RuntimeError('event bus is closed')
+        put = self._queue.put
+        count = 0
+        for event in events:
+            put(event)
+            count += 1
+        with self._stats_lock:
+            self.stats.published += count
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self) -> None:
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        stopping = False
+        while not stopping:
+            batch = [get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                batch = [event for event in batch if event is not _STOP]
+                stopping = True
+
+            for handler, events in self.registry.group(batch).items():
+                self._in_flight.acquire()  # pylint: disable=consider-using-with
+                self._executor.submit(self._run, handler, events)
+
+    def _run(self, handler: Handler, events: List[DomainEvent]) -> None:
+        try:
+            succeeded = _run_handler(handler, events)
+            with self._stats_lock:
+                self.stats.record(events, succeeded)
+        finally:
+            self._in_flight.release()
+
+
+@dataclass(slots=True)
+class AsyncQueueEventBus(AsyncEventBusInterface):
+    """asyncio counterpart of ``ThreadPoolEventBus``.
+
+    ``publish`` awaits while ``max_pending`` events are queued, and
+    ``workers`` tasks drain up to ``batch_size`` events at a time. Handlers
+    may be coroutine functions; plain functions run inline on the loop, so
+    they must not block. Use ``async with`` or call ``close`` to deliver
+    the remaining events and stop the workers.
+    """
+    registry: HandlerRegistry = field(default_factory=HandlerRegistry)
+    workers: int = 4
+    batch_size: int = 1000
+    max_pending: int = 10_000
+    stats: EventBusStats = field(default_factory=EventBusStats)
+    _queue: Optional[asyncio.Queue] = field(default_factory=lambda: None, init=False)
+    _tasks: List[asyncio.Task] = field(default_factory=list, init=False)
+
+    async def __aenter__(self) -> 'AsyncQueueEventBus':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self.registry.subscribe(event_type, handler)
+
+    def start(self) -> None:
+        """Starts the workers on the running loop; ``publish`` calls it when needed."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def publish(self, events: Iterable[DomainEvent]) -> None:
+        self.start()
+        put = self._queue.put
+        for event in events:
+            await put(event)
+            self.stats.published += 1
+
+    async def join(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self) -> None:
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        while True:
+            batch = [await get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                for handler, events in self.registry.group(batch).items():
+                    await self._run(handler, events)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _run(self, handler: Handler, events: List[DomainEvent]) -> None:
+        try:
+            result = handler(events)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:  # pylint: disable=broad-except
+            _log_failure(handler, events)
+            self.stats.record(events, False)
+        else:
+            self.stats.record(events, True)
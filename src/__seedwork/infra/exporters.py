@@ -0,0 +1,81 @@
+import abc
+from abc import ABC
+
+import itertools
+import json
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Iterable, TextIO
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.value_objects import ValueObject
+
+
+def json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, ValueObject):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+@dataclass(slots=True)
+class EntityExporter(ABC):
+    """Writes entities to ``output`` one chunk at a time.
+
+    Only ``chunk_size`` entities are serialized at once, so memory stays
+    bounded no matter how many entities the iterable yields.
+    """
+    output: TextIO
+    chunk_size: int = 1000
+    encoder: json.JSONEncoder = field(
+        default_factory=lambda: json.JSONEncoder(
+            default=json_default, ensure_ascii=False, separators=(',', ':'))
+    )
+
+    def export(self, entities: Iterable[Entity]) -> int:
+        iterator = iter(entities)
+        encode = self.encoder.encode
+        total = 0
+
+        self._start()
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                break
+            self._write_chunk([encode(entity_dict) for entity_dict in Entity.to_dicts(chunk)], total)
+            total += len(chunk)
+        self._finish()
+        return total
+
+    def _start(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _write_chunk(self, lines: Iterable[str], written: int) -> None:
+        raise NotImplementedError()
+
+    def _finish(self) -> None:
+        pass
+
+
+class NdjsonExporter(EntityExporter):
+
+    def _write_chunk(self, lines: Iterable[str], written: int) -> None:
+        self.output.write('\n'.join(lines))
+        self.output.write('\n')
+
+
+class JsonArrayExporter(EntityExporter):
+
+    def _start(self) -> None:
+        self.output.write('[')
+
+    def _write_chunk(self, lines: Iterable[str], written: int) -> None:
+        if written:
+            self.output.write(',')
+        self.output.write(','.join(lines))
+
+    def _finish(self) -> None:
+        self.output.write(']')
@@ -0,0 +1,301 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Row = Dict[str, Any]
+Location = Tuple[int, int]
+
+PUT = 1
+DELETE = 2
+
+LOG_NAME = 'log.bin'
+SNAPSHOT_NAME = 'snapshot.bin'
+
+# op, id size, payload size, crc32 of id + payload
+LOG_HEADER = struct.Struct('<BHII')
+# magic, version, id size, rows, data size, index offset
+SNAPSHOT_HEADER = struct.Struct('<4sHHQQQ')
+SNAPSHOT_MAGIC = b'SWSS'
+SNAPSHOT_VERSION = 1
+
+_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+
+def encode_row(row: Row) -> bytes:
+    return _encode(row).encode()
+
+
+def write_snapshot(path: str, records: List[Tuple[bytes, bytes]]) -> None:
+    """Writes ``(id, JSON payload)`` records as a snapshot file and fsyncs it.
+
+    The data region is a JSON array with one payload per line, so loading
+    every row is a single ``json.loads``. It is followed by an index of
+    fixed-width ``(id, offset, size)`` entries sorted by id, ids padded
+    with NUL bytes to the longest one, so a lookup can bisect the file.
+    """
+    id_size = max((len(entity_id) for entity_id, _ in records), default=0)
+    entry = struct.Struct(f'<{id_size}sQI')
+
+    data = [b'[']
+    offset = SNAPSHOT_HEADER.size + 1
+    entries = []
+    for position, (entity_id, payload) in enumerate(records):
+        if position:
+            data.append(b',\n')
+            offset += 2
+        data.append(payload)
+        entries.append((entity_id.ljust(id_size, b'\0'), offset, len(payload)))
+        offset += len(payload)
+    data.append(b']')
+    entries.sort()
+
+    data_size = offset + 1 - SNAPSHOT_HEADER.size
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, id_size, len(records), data_size, offset + 1)
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.write(b''.join(data))
+        file.write(b''.join(entry.pack(*values) for values in entries))
+        file.flush()
+        os.fsync(file.fileno())
+
+
+@dataclass(slots=True)
+class FileStore:
+    """Durable rows keyed by ``'id'`` in two files under ``directory``.
+
+    Every change is appended to ``log.bin`` as a length-prefixed record
+    with a CRC, and ``compact`` folds the log into ``snapshot.bin``, which
+    is read through ``mmap``. Opening the store replays only the log; a
+    torn record at its end, left by a crash, is cut off.
+
+    ``get`` reads one row: ids changed since the last compaction are kept
+    in a dict of log offsets, the rest are found by bisecting the
+    snapshot's id index, so nothing else is loaded. ``rows`` decodes the
+    whole snapshot with one ``json.loads``.
+
+    Rows must be JSON-serializable and ids at most 65535 bytes. With
+    ``sync`` every append is fsynced; otherwise it is only written to the
+    OS. ``compact_after`` log records trigger a compaction on write.
+    """
+    directory: str
+    sync: bool = False
+    compact_after: Optional[int] = 100_000
+    _log: Any = field(default=None, init=False, repr=False)
+    _log_size: int = field(default=0, init=False)
+    _log_records: int = field(default=0, init=False)
+    _log_index: Dict[str, Optional[Location]] = field(default_factory=dict, init=False, repr=False)
+    _snapshot: Optional[mmap.mmap] = field(default=None, init=False, repr=False)
+    _id_size: int = field(default=0, init=False)
+    _count: int = field(default=0, init=False)
+    _data_size: int = field(default=0, init=False)
+    _index_offset: int = field(default=0, init=False)
+    _entry: struct.Struct = field(
+        default_factory=lambda: struct.Struct('<0sQI'), init=False, repr=False)
+
+    def __post_init__(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._open_snapshot()
+        self._log = open(  # pylint: disable=consider-using-with
+            os.path.join(self.directory, LOG_NAME), 'a+b', buffering=0)
+        self._replay()
+
+    def __enter__(self) -> 'FileStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def log_records(self) -> int:
+        """Records appended since the last compaction."""
+        return self._log_records
+
+    def get(self, entity_id: str) -> Optional[Row]:
+        payload = self._payload(entity_id)
+        return None if payload is None else json.loads(payload)
+
+    def rows(self) -> List[Row]:
+        rows = [] if self._snapshot is None else json.loads(
+            self._snapshot[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + self._data_size])
+        if self._log_index:
+            changed = self._log_index
+            rows = [row for row in rows if row['id'] not in changed]
+            log = self._read_log()
+            rows.extend(
+                json.loads(log[offset:offset + size])
+                for offset, size in filter(None, changed.values())
+            )
+        return rows
+
+    def put(self, row: Row) -> None:
+        self.put_many((row,))
+
+    def put_many(self, rows: Iterable[Row]) -> None:
+        self._append([(PUT, row['id'], encode_row(row)) for row in rows])
+
+    def delete(self, entity_id: str) -> None:
+        self.delete_many((entity_id,))
+
+    def delete_many(self, entity_ids: Iterable[str]) -> None:
+        self._append([(DELETE, entity_id, b'') for entity_id in entity_ids])
+
+    def compact(self) -> None:
+        """Writes the current rows to a new snapshot and empties the log.
+
+        The snapshot is written beside the old one and renamed over it, and
+        the log is only truncated after that, so a crash in between
+        replays changes the new snapshot already has, which is harmless.
+        Unchanged rows are copied as stored, without decoding them.
+        """
+        if not self._log_index:
+            return
+        changed = {entity_id.encode() for entity_id in self._log_index}
+        records = []
+        if self._snapshot is not None:
+            snapshot = self._snapshot
+            index = snapshot[self._index_offset:self._index_offset + self._count * self._entry.size]
+            for padded_id, offset, size in self._entry.iter_unpack(index):
+                entity_id = padded_id.rstrip(b'\0')
+                if entity_id not in changed:
+                    records.append((entity_id, snapshot[offset:offset + size]))
+        log = self._read_log()
+        for entity_id, location in self._log_index.items():
+            if location is not None:
+                offset, size = location
+                records.append((entity_id.encode(), log[offset:offset + size]))
+
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        write_snapshot(path + '.tmp', records)
+        self._close_snapshot()
+        os.replace(path + '.tmp', path)
+        self._sync_directory()
+        self._open_snapshot()
+
+        os.ftruncate(self._log.fileno(), 0)
+        self._log_index.clear()
+        self._log_size = self._log_records = 0
+
+    def close(self) -> None:
+        self._close_snapshot()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _payload(self, entity_id: str) -> Optional[bytes]:
+        if entity_id in self._log_index:
+            location = self._log_index[entity_id]
+            if location is None:
+                return None
+            offset, size = location
+            return os.pread(self._log.fileno(), size, offset)
+        location = self._find_in_snapshot(entity_id.encode())
+        if location is None:
+            return None
+        offset, size = location
+        return self._snapshot[offset:offset + size]
+
+    def _find_in_snapshot(self, entity_id: bytes) -> Optional[Location]:
+        if self._snapshot is None or len(entity_id) > self._id_size:
+            return None
+        snapshot, id_size, width = self._snapshot, self._id_size, self._entry.size
+        key = entity_id.ljust(id_size, b'\0')
+        base = self._index_offset
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = base + middle * width
+            if snapshot[position:position + id_size] < key:
+                low = middle + 1
+            else:
+                high = middle
+        position = base + low * width
+        if low == self._count or snapshot[position:position + id_size] != key:
+            return None
+        _, offset, size = self._entry.unpack_from(snapshot, position)
+        return offset, size
+
+    def _append(self, changes: List[Tuple[int, str, bytes]]) -> None:
+        if not changes:
+            return
+        chunks = []
+        offset = self._log_size
+        locations = []
+        for op, entity_id, payload in changes:
+            encoded_id = entity_id.encode()
+            body = encoded_id + payload
+            chunks.append(LOG_HEADER.pack(op, len(encoded_id), len(payload), zlib.crc32(body)))
+            chunks.append(body)
+            offset += LOG_HEADER.size + len(encoded_id)
+            locations.append((entity_id, (offset, len(payload)) if op == PUT else None))
+            offset += len(payload)
+
+        self._log.write(b''.join(chunks))
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self._log_index.update(locations)
+        self._log_size = offset
+        self._log_records += len(changes)
+        if self.compact_after is not None and self._log_records >= self.compact_after:
+            self.compact()
+
+    def _replay(self) -> None:
+        log = self._read_log()
+        position, end = 0, len(log)
+        index = self._log_index
+        records = 0
+        while position + LOG_HEADER.size <= end:
+            op, id_size, payload_size, checksum = LOG_HEADER.unpack_from(log, position)
+            start = position + LOG_HEADER.size
+            stop = start + id_size + payload_size
+            if op not in (PUT, DELETE) or stop > end or zlib.crc32(log[start:stop]) != checksum:
+                break
+            entity_id = log[start:start + id_size].decode()
+            index[entity_id] = (start + id_size, payload_size) if op == PUT else None
+            position = stop
+            records += 1
+
+        if position < end:
+            os.ftruncate(self._log.fileno(), position)
+        self._log_size = position
+        self._log_records = records
+
+    def _read_log(self) -> bytes:
+        size = os.fstat(self._log.fileno()).st_size
+        if not size:
+            return b''
+        with mmap.mmap(self._log.fileno(), size, access=mmap.ACCESS_READ) as log:
+            return log[:]
+
+    def _open_snapshot(self) -> None:
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as file:
+            snapshot = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, id_size, count, data_size, index_offset = \
+            SNAPSHOT_HEADER.unpack_from(snapshot)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            snapshot.close()
+            raise ValueError(f'{path} is not a snapshot file')
+        self._snapshot = snapshot
+        self._id_size, self._count = id_size, count
+        self._data_size, self._index_offset = data_size, index_offset
+        self._entry = struct.Struct(f'<{id_size}sQI')
+
+    def _close_snapshot(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _sync_directory(self) -> None:
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
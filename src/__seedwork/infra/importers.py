@@ -0,0 +1,218 @@
+import csv
+import itertools
+import json
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any, ClassVar, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Type, Union
+)
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.events import DomainEvent, EventBusInterface
+from __seedwork.domain.repositories import RepositoryInterface
+from __seedwork.domain.validators import ErrorFields
+
+Row = Dict[str, Any]
+Columns = Dict[str, List[Any]]
+ChunkErrors = Dict[int, ErrorFields]
+
+
+@dataclass(frozen=True, slots=True)
+class UnreadableRow:
+    """Stands in for a source line that is not a row, so an import rejects it and goes on."""
+    line: int
+    text: str
+    error: str
+
+
+def read_csv(source: TextIO) -> Iterator[Row]:
+    return csv.DictReader(source)
+
+
+def read_ndjson(source: TextIO) -> Iterator[Union[Row, UnreadableRow]]:
+    """Yields one row per non-blank line, or an ``UnreadableRow`` for a line
+    that is not valid JSON or not a JSON object."""
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as ex:
+            yield UnreadableRow(number, line.rstrip('\n'), f'Line {number} is not valid JSON: {ex}')
+            continue
+        if isinstance(row, dict):
+            yield row
+        else:
+            yield UnreadableRow(number, line.rstrip('\n'), f'Line {number} is not a JSON object')
+
+
+def chunked(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRow:
+    row: int
+    data: Row
+    errors: ErrorFields
+
+
+@dataclass(slots=True)
+class ImportReport:
+    imported: int = 0
+    rejected: List[RejectedRow] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.imported + len(self.rejected)
+
+
+def to_columns(rows: List[Row], props: Iterable[str]) -> Columns:
+    return {prop: [row.get(prop) for row in rows] for prop in props}
+
+
+def validate_columns(entity_class: Type[Entity], columns: Columns) -> ChunkErrors:
+    """Validates one chunk of columns with the entity's ``validator_schema``.
+
+    Module-level so it can run in a ``ProcessPoolExecutor`` worker; only
+    the errors travel back to the parent process, ordered by row.
+    """
+    return dict(sorted(entity_class.validator_schema.validate_batch(**columns).errors.items()))
+
+
+def validate_chunk(entity_class: Type[Entity], rows: List[Row]) -> ChunkErrors:
+    return validate_columns(entity_class, to_columns(rows, entity_class.validator_schema.rules))
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    total: int = 0
+    errors: Dict[int, ErrorFields] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+@dataclass(slots=True)
+class ParallelValidator:
+    """Validates rows against an entity's ``validator_schema`` on a process pool.
+
+    Rows are cut into chunks of ``chunk_size`` and each chunk is shipped as
+    one list per prop, which pickles and unpickles several times faster
+    than a list of dicts. At most ``2 * workers`` chunks are in flight, and
+    results come back in input order, so errors are reported by global row
+    number, in order. Without ``workers`` the chunks are validated in this
+    process.
+    """
+    entity_class: Type[Entity]
+    workers: Optional[int] = None
+    chunk_size: int = 10_000
+
+    def validate(self, rows: Iterable[Row]) -> ValidationReport:
+        report = ValidationReport()
+        for start, chunk, errors in self.validate_chunks(chunked(rows, self.chunk_size)):
+            report.total += len(chunk)
+            report.errors.update((start + row, row_errors) for row, row_errors in errors.items())
+        return report
+
+    def validate_chunks(self, chunks: Iterable[List[Row]]) -> Iterator[Tuple[int, List[Row], ChunkErrors]]:
+        """Yields ``(first row number, chunk, errors by row in the chunk)`` in input order."""
+        props = tuple(self.entity_class.validator_schema.rules)
+        start = 0
+        if not self.workers:
+            for chunk in chunks:
+                yield start, chunk, validate_columns(self.entity_class, to_columns(chunk, props))
+                start += len(chunk)
+            return
+
+        pending: Deque[Tuple[int, List[Row], Future]] = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk in chunks:
+                pending.append((start, chunk, executor.submit(
+                    validate_columns, self.entity_class, to_columns(chunk, props))))
+                start += len(chunk)
+                if len(pending) >= 2 * self.workers:
+                    chunk_start, pending_chunk, future = pending.popleft()
+                    yield chunk_start, pending_chunk, future.result()
+
+            while pending:
+                chunk_start, pending_chunk, future = pending.popleft()
+                yield chunk_start, pending_chunk, future.result()
+
+
+@dataclass(slots=True)
+class EntityImporter:
+    """Streams rows through validation and hydration into a repository.
+
+    Rows are read lazily and handled ``chunk_size`` at a time. With
+    ``workers`` set, chunks are validated by a ``ParallelValidator`` while
+    at most ``2 * workers`` of them are in flight, so memory stays bounded. Valid
+    rows are hydrated with ``hydrate_many`` (validation already ran) and
+    stored with ``bulk_insert``; invalid rows and ``UnreadableRow`` items
+    end up in the report, numbered by their position in ``rows``.
+    Subclasses set ``entity_class``, which must declare a ``validator_schema``.
+    With an ``event_bus``, the events of ``imported_events`` are published
+    after every stored chunk.
+    """
+    entity_class: ClassVar[Type[Entity]]
+
+    repository: RepositoryInterface
+    chunk_size: int = 10_000
+    workers: Optional[int] = None
+    event_bus: Optional[EventBusInterface] = None
+
+    def import_rows(self, rows: Iterable[Union[Row, UnreadableRow]]) -> ImportReport:
+        report = ImportReport()
+        positions: Deque[int] = deque()
+        unreadable: Deque[RejectedRow] = deque()
+        chunks = chunked(self._parse_rows(rows, positions, unreadable), self.chunk_size)
+
+        validator = ParallelValidator(self.entity_class, self.workers, self.chunk_size)
+        for _, chunk, errors in validator.validate_chunks(chunks):
+            chunk_positions = [positions.popleft() for _ in chunk]
+            rejected = [
+                RejectedRow(chunk_positions[position], chunk[position], row_errors)
+                for position, row_errors in errors.items()
+            ]
+            while unreadable and unreadable[0].row < chunk_positions[-1]:
+                rejected.append(unreadable.popleft())
+            if rejected:
+                rejected.sort(key=lambda rejected_row: rejected_row.row)
+                report.rejected.extend(rejected)
+            if errors:
+                chunk = [row for position, row in enumerate(chunk) if position not in errors]
+            entities = self.entity_class.hydrate_many(chunk)
+            self.repository.bulk_insert(entities)
+            report.imported += len(chunk)
+            if self.event_bus is not None and entities:
+                self.event_bus.publish(self.imported_events(entities))
+
+        report.rejected.extend(unreadable)
+        return report
+
+    def parse_row(self, row: Row) -> Row:
+        return row
+
+    def _parse_rows(
+        self,
+        rows: Iterable[Union[Row, UnreadableRow]],
+        positions: Deque[int],
+        unreadable: Deque[RejectedRow]
+    ) -> Iterator[Row]:
+        """Yields the parsed rows, recording each one's position in ``rows``;
+        ``UnreadableRow`` items are set aside as rejected rows instead."""
+        for position, row in enumerate(rows):
+            if isinstance(row, UnreadableRow):
+                unreadable.append(RejectedRow(position, {'line': row.text}, {'line': [row.error]}))
+            else:
+                positions.append(position)
+                yield self.parse_row(row)
+
+    def imported_events(self, entities: List[Entity]) -> List[DomainEvent]:  # pylint: disable=unused-argument
+        """Events describing a stored chunk; none by default."""
+        return []
@@ -0,0 +1,283 @@
+import abc
+from abc import ABC
+
+import bisect
+import functools
+import math
+import threading
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Type
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.validators import ValidatorFieldsInterface, ValidatorRules, ValidatorSchema
+
+Labels = Tuple[Tuple[str, str], ...]
+MetricKey = Tuple[str, Labels]
+
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0,
+)
+RULES = ('required', 'string', 'max_length', 'boolean')
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class Histogram:
+    bounds: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """``(upper bound, observations <= bound)`` pairs, ending with ``+Inf``."""
+        running = 0
+        pairs = []
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+
+class MetricsSink(ABC):
+
+    @abc.abstractmethod
+    def increment(self, name: str, labels: Labels, value: float = 1) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def observe(self, name: str, labels: Labels, seconds: float) -> None:
+        raise NotImplementedError()
+
+
+@dataclass(slots=True)
+class InMemorySink(MetricsSink):
+    """Keeps counters and latency histograms in memory; safe to share between threads."""
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counters: Dict[MetricKey, float] = field(default_factory=dict)
+    histograms: Dict[MetricKey, Histogram] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def increment(self, name: str, labels: Labels, value: float = 1) -> None:
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, seconds: float) -> None:
+        key = (name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        return self.histograms.get((name, tuple(sorted(labels.items()))))
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+def _format_labels(labels: Labels, extra: str = '') -> str:
+    pairs = [f'{name}="{value}"' for name, value in labels]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == math.inf else repr(bound)
+
+
+def render_prometheus(sink: InMemorySink) -> str:
+    """The sink's metrics in the Prometheus text exposition format."""
+    with sink._lock:  # pylint: disable=protected-access
+        counters = sorted(sink.counters.items())
+        histograms = sorted(
+            (key, Histogram(histogram.bounds, list(histogram.counts), histogram.total, histogram.count))
+            for key, histogram in sink.histograms.items()
+        )
+
+    lines = []
+    typed = set()
+    for (name, labels), value in counters:
+        if name not in typed:
+            typed.add(name)
+            lines.append(f'# TYPE {name} counter')
+        lines.append(f'{name}{_format_labels(labels)} {value:g}')
+    for (name, labels), histogram in histograms:
+        if name not in typed:
+            typed.add(name)
+            lines.append(f'# TYPE {name} histogram')
+        for bound, count in histogram.cumulative():
+            bucket_labels = _format_labels(labels, f'le="{_format_bound(bound)}"')
+            lines.append(f'{name}_bucket{bucket_labels} {count}')
+        lines.append(f'{name}_sum{_format_labels(labels)} {histogram.total!r}')
+        lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+class MetricsExporter(ABC):
+
+    @abc.abstractmethod
+    def export(self, sink: InMemorySink) -> None:
+        raise NotImplementedError()
+
+
+@dataclass(slots=True)
+class PrometheusTextExporter(MetricsExporter):
+    """Writes the Prometheus text format to ``output``, e.g. a file a node exporter collects."""
+    output: TextIO
+
+    def export(self, sink: InMemorySink) -> None:
+        self.output.write(render_prometheus(sink))
+        self.output.flush()
+
+
+@dataclass(slots=True)
+class Instrumentation:
+    """Times entity construction, validators and validation rules into ``sink``.
+
+    Nothing is measured until a class is instrumented: the ``instrument_*``
+    methods replace the measured methods with timing wrappers and
+    ``uninstrument`` (or leaving the ``with`` block) puts the originals
+    back, so code paths cost nothing extra while instrumentation is off.
+
+    Metrics, all labelled by class:
+
+    - ``seedwork_entity_init_seconds``: ``__init__`` of an entity, including
+      ``__post_init__``;
+    - ``seedwork_entity_validate_seconds``: the entity's ``validate``;
+    - ``seedwork_rule_seconds``: each rule, by ``prop`` and ``rule``, of the
+      entity's ``validator_schema`` or of ``ValidatorRules`` chains;
+    - ``seedwork_rule_failures_total``: rules that raised;
+    - ``seedwork_validator_seconds`` and ``seedwork_validator_invalid_total``:
+      ``validate`` of a ``ValidatorFieldsInterface`` subclass.
+    """
+    sink: MetricsSink = field(default_factory=InMemorySink)
+    clock: Callable[[], float] = time.perf_counter
+    _patches: List[Tuple[type, str, Any]] = field(default_factory=list, init=False)
+
+    def __enter__(self) -> 'Instrumentation':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.uninstrument()
+
+    def instrument_entity(self, entity_class: Type[Entity]) -> None:
+        labels = (('entity', entity_class.__name__),)
+        self._patch(entity_class, '__init__', self._timed(
+            entity_class.__init__, 'seedwork_entity_init_seconds', labels))
+
+        schema: Optional[ValidatorSchema] = getattr(entity_class, 'validator_schema', None)
+        if 'validate' in entity_class.__dict__ and schema is not None:
+            validate = self._schema_validator(schema, entity_class.__name__)
+            self._patch(entity_class, 'validate', staticmethod(self._timed(
+                validate, 'seedwork_entity_validate_seconds', labels)))
+
+    def instrument_validator(self, validator_class: Type[ValidatorFieldsInterface]) -> None:
+        labels = (('validator', validator_class.__name__),)
+        validate = validator_class.validate
+        observe, increment, clock = self.sink.observe, self.sink.increment, self.clock
+
+        @functools.wraps(validate)
+        def timed_validate(validator, data):
+            started = clock()
+            try:
+                is_valid = validate(validator, data)
+            finally:
+                observe('seedwork_validator_seconds', labels, clock() - started)
+            if not is_valid:
+                increment('seedwork_validator_invalid_total', labels)
+            return is_valid
+
+        self._patch(validator_class, 'validate', timed_validate)
+
+    def instrument_rules(self) -> None:
+        """Times the rule methods of ``ValidatorRules`` chains, per prop and rule."""
+        observe, increment, clock = self.sink.observe, self.sink.increment, self.clock
+        for rule in RULES:
+            method = getattr(ValidatorRules, rule)
+
+            def timed_rule(rules, *args, _method=method, _rule=rule):
+                labels = (('owner', 'ValidatorRules'), ('prop', rules.prop), ('rule', _rule))
+                started = clock()
+                try:
+                    return _method(rules, *args)
+                except ValidationException:
+                    increment('seedwork_rule_failures_total', labels)
+                    raise
+                finally:
+                    observe('seedwork_rule_seconds', labels, clock() - started)
+
+            self._patch(ValidatorRules, rule, functools.wraps(method)(timed_rule))
+
+    def uninstrument(self) -> None:
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+    def _patch(self, owner: type, name: str, replacement: Any) -> None:
+        self._patches.append((owner, name, owner.__dict__.get(name, _MISSING)))
+        setattr(owner, name, replacement)
+
+    def _timed(self, function: Callable, name: str, labels: Labels) -> Callable:
+        observe, clock = self.sink.observe, self.clock
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(name, labels, clock() - started)
+
+        return timed
+
+    def _schema_validator(self, schema: ValidatorSchema, owner: str) -> Callable[..., None]:
+        """Runs ``schema`` one rule at a time, in order, timing each rule.
+
+        Every rule is compiled on its own, so messages and the rule that
+        fails first match the compiled whole-schema validator.
+        """
+        steps = []
+        for prop, rules in schema.rules.items():
+            for rule in rules:
+                rule_name = rule if isinstance(rule, str) else rule[0]
+                check = ValidatorSchema({prop: (rule,)}).compile(f'validate_{prop}_{rule_name}')
+                steps.append((prop, check, (('owner', owner), ('prop', prop), ('rule', rule_name))))
+
+        observe, increment, clock = self.sink.observe, self.sink.increment, self.clock
+
+        def validate(**props):
+            for prop, check, labels in steps:
+                started = clock()
+                try:
+                    check(**{prop: props.get(prop)})
+                except ValidationException:
+                    increment('seedwork_rule_failures_total', labels)
+                    raise
+                finally:
+                    observe('seedwork_rule_seconds', labels, clock() - started)
+
+        return validate
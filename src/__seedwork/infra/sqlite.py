@@ -0,0 +1,80 @@
+import queue
+import sqlite3
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator
+
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+}
+
+
+@dataclass(slots=True)
+class SqliteConnectionPool:
+    """A fixed set of SQLite connections shared between threads.
+
+    Every connection is opened with ``pragmas`` applied (WAL by default).
+    ``sqlite3`` caches compiled statements per connection, so reusing
+    connections also reuses prepared statements. For an in-memory
+    database use a shared-cache URI such as
+    ``file:name?mode=memory&cache=shared``, otherwise every connection
+    sees its own empty database.
+    """
+    database: str
+    size: int = 4
+    pragmas: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_PRAGMAS))
+    timeout: float = 30.0
+    _connections: queue.LifoQueue = field(init=False)
+    _all: list = field(init=False, default_factory=list)
+
+    def __post_init__(self):
+        self._connections = queue.LifoQueue(maxsize=self.size)
+        for _ in range(self.size):
+            connection = self._connect()
+            self._all.append(connection)
+            self._connections.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Runs the block in one write transaction, committed on success.
+
+        ``BEGIN IMMEDIATE`` is issued up front: ``sqlite3`` only opens a
+        transaction implicitly before DML, so a block starting with
+        ``SAVEPOINT`` or a ``SELECT`` would otherwise commit piece by piece,
+        and a deferred transaction that reads before writing (as FTS5
+        triggers do) fails with "database is locked" instead of waiting
+        ``timeout`` for another writer.
+        """
+        with self.connection() as connection:
+            with connection:
+                if not connection.in_transaction:
+                    connection.execute('BEGIN IMMEDIATE')
+                yield connection
+
+    def close(self) -> None:
+        for connection in self._all:
+            connection.close()
+        self._all.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.database,
+            timeout=self.timeout,
+            check_same_thread=False,
+            uri=self.database.startswith('file:'),
+            cached_statements=256,
+        )
+        for pragma, value in self.pragmas.items():
+            connection.execute(f'PRAGMA {pragma}={value}')
+        return connection
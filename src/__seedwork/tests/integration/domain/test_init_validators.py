@@ -2,7 +2,13 @@ import unittest
 
 from rest_framework import serializers
 
-from __seedwork.domain.validators import DRFValidator
+from __seedwork.domain.validators import (
+    BooleanField,
+    CharField,
+    DRFValidator,
+    IntegerField,
+    NativeValidator
+)
 
 
 # pylint: disable=abstract-method
@@ -42,3 +48,54 @@ class TestDRFValidatorIntegration(unittest.TestCase):
                 'price': 10
             }
         )
+
+
+# pylint: disable=abstract-method
+class StubRulesSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=5)
+    description = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    price = serializers.IntegerField(min_value=0)
+    is_active = serializers.BooleanField(required=False)
+
+
+class StubNativeValidator(NativeValidator):
+    fields = {
+        'name': CharField(max_length=5),
+        'description': CharField(required=False, allow_null=True, allow_blank=True),
+        'price': IntegerField(min_value=0),
+        'is_active': BooleanField(required=False),
+    }
+
+
+class TestNativeValidatorIntegration(unittest.TestCase):
+
+    def test_same_output_as_drf_validator(self):
+        arrange = [
+            {},
+            {'name': None, 'price': None},
+            {'name': '', 'price': ''},
+            {'name': '   ', 'price': '-1'},
+            {'name': True, 'price': True},
+            {'name': 'too long', 'price': 1.5},
+            {'name': 'a\x00', 'price': '1.0', 'is_active': 'fake'},
+            {'name': 10, 'price': 10, 'description': None, 'is_active': 'yes'},
+            {'name': 'dudu', 'price': 1, 'is_active': 'tRuE'},
+            {'name': 'dudu', 'price': 1, 'is_active': 'yEs'},
+            {'name': 'dudu', 'price': 1, 'is_active': 'FALSE'},
+            {'name': 'dudu', 'price': 1, 'is_active': 'Null'},
+            {'name': ' dudu ', 'price': '10', 'description': ' ', 'is_active': 0},
+            {'name': 'dudu', 'price': 10, 'description': {}, 'is_active': None},
+            'invalid data',
+        ]
+
+        for data in arrange:
+            drf_validator = DRFValidator()
+            drf_is_valid = drf_validator.validate(StubRulesSerializer(data=data))
+
+            native_validator = StubNativeValidator()
+            native_is_valid = native_validator.validate(data)
+
+            self.assertEqual(native_is_valid, drf_is_valid, f"{data}")
+            self.assertEqual(native_validator.errors, drf_validator.errors, f"{data}")
+            self.assertEqual(
+                native_validator.validated_data, drf_validator.validated_data, f"{data}")
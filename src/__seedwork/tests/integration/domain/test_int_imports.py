@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))))))
+
+
+def imported_modules(module: str):
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONPATH': SRC_PATH},
+    ).stdout
+    return output.splitlines()
+
+
+class TestDjangoIsImportedLazily(unittest.TestCase):
+
+    def test_domain_modules_do_not_import_django(self):
+        for module in [
+            '__seedwork.domain.validators',
+            'category.domain.entities',
+            'category.domain.validators',
+        ]:
+            loaded = [
+                name for name in imported_modules(module)
+                if name.split('.')[0] in ('django', 'rest_framework')
+            ]
+            self.assertEqual(loaded, [], module)
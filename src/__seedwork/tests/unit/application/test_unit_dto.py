@@ -0,0 +1,34 @@
+import unittest
+
+from dataclasses import FrozenInstanceError
+
+from __seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
+from __seedwork.domain.repositories import SearchResult
+
+
+class TestSearchInput(unittest.TestCase):
+
+    def test_defaults_to_none(self):
+        input_param = SearchInput()
+        self.assertIsNone(input_param.page)
+        self.assertIsNone(input_param.per_page)
+        self.assertIsNone(input_param.sort)
+        self.assertIsNone(input_param.sort_dir)
+        self.assertIsNone(input_param.filter)
+
+    def test_is_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            SearchInput().page = 1  # pylint: disable=assigning-non-slot
+
+
+class TestPaginationOutputMapper(unittest.TestCase):
+
+    def test_to_output(self):
+        result = SearchResult(
+            items=['fake'], total=4, current_page=2, per_page=2,
+            sort=None, sort_dir=None, filter=None)
+
+        output = PaginationOutputMapper.to_output(['item'], result)
+
+        self.assertEqual(output, PaginationOutput(
+            items=['item'], total=4, current_page=2, last_page=2, per_page=2))
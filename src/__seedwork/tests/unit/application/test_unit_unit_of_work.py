@@ -0,0 +1,149 @@
+import unittest
+
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import MagicMock
+
+from __seedwork.application.unit_of_work import UnitOfWork
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.events import DomainEvent
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import ChangeSet, InMemoryRepository
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[float] = None
+
+    def rename(self, name: str) -> None:
+        self._set('name', name)
+        self._record(DomainEvent(aggregate_id=self.id))
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    sorted_indexes = ['name']
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.entity = StubEntity(name='some')
+        self.inner = StubInMemoryRepository()
+        self.inner.insert(self.entity)
+        self.repo = MagicMock(wraps=self.inner)
+        self.uow = UnitOfWork(self.repo)
+
+    def test_commit_saves_everything_in_one_call(self):
+        new = self.uow.add(StubEntity(name='new'))
+        removed = StubEntity(name='removed')
+        self.inner.insert(removed)
+        self.uow.find_by_id(self.entity.id).rename('other')
+        self.uow.remove(removed.unique_entity_id)
+
+        changes = self.uow.commit()
+
+        self.assertEqual(changes, ChangeSet(
+            inserted=[new], updated=[(self.entity, frozenset({'name'}))], deleted=[removed.id]))
+        self.repo.save_changes.assert_called_once_with(changes)
+        self.repo.insert.assert_not_called()
+        self.repo.update.assert_not_called()
+        self.assertEqual(self.inner.find_all_sorted('name'), [new, self.entity])
+        self.assertEqual(self.entity.dirty_fields, frozenset())
+        self.assertEqual(new.dirty_fields, frozenset())
+
+    def test_skips_unchanged_entities(self):
+        entity = self.uow.find_by_id(self.entity.id)
+        entity.rename('some')
+
+        self.assertFalse(self.uow.commit())
+        self.repo.save_changes.assert_not_called()
+
+    def test_find_by_id_returns_the_same_instance(self):
+        first = self.uow.find_by_id(self.entity.id)
+        self.assertIs(self.uow.find_by_id(self.entity.unique_entity_id), first)
+        self.repo.find_by_id.assert_called_once_with(self.entity.id)
+
+        new = self.uow.add(StubEntity(name='new'))
+        self.assertIs(self.uow.find_by_id(new.id), new)
+
+    def test_find_by_id_hides_removed_entities(self):
+        self.uow.remove(self.entity.id)
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.uow.find_by_id(self.entity.id)
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity not found using ID '{self.entity.id}'")
+
+    def test_removing_a_new_entity_writes_nothing(self):
+        new = self.uow.add(StubEntity(name='new'))
+        self.uow.remove(new.id)
+
+        self.assertFalse(self.uow.commit())
+
+    def test_tracked_entities_are_checked_on_commit(self):
+        entity = StubEntity(name='detached')
+        self.inner.insert(entity)
+        self.uow.track(entity)
+        entity.rename('renamed')
+
+        changes = self.uow.commit()
+
+        self.assertEqual(changes.updated, [(entity, frozenset({'name'}))])
+
+    def test_context_manager_commits_on_success(self):
+        with UnitOfWork(self.repo) as uow:
+            uow.find_by_id(self.entity.id).rename('other')
+        self.assertEqual(self.inner.find_by_id(self.entity.id).name, 'other')
+        self.repo.save_changes.assert_called_once()
+
+    def test_context_manager_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(self.repo) as uow:
+                uow.add(StubEntity(name='new'))
+                raise RuntimeError()
+        self.repo.save_changes.assert_not_called()
+        self.assertEqual(self.inner.find_all(), [self.entity])
+
+    def test_rollback_forgets_pending_work(self):
+        self.uow.add(StubEntity(name='new'))
+        self.uow.find_by_id(self.entity.id).rename('other')
+
+        self.uow.rollback()
+
+        self.assertEqual(self.uow.pending_changes(), ChangeSet())
+
+    def test_keeps_pending_work_when_save_fails(self):
+        self.uow.find_by_id(self.entity.id).rename('other')
+        self.uow.remove('fake id')
+
+        with self.assertRaises(NotFoundException):
+            self.uow.commit()
+
+        self.assertEqual(self.entity.dirty_fields, {'name'})
+        self.assertEqual(self.uow.pending_changes().deleted, ['fake id'])
+
+    def test_commit_publishes_events_after_saving(self):
+        bus = MagicMock()
+        bus.publish.side_effect = lambda events: self.repo.save_changes.assert_called_once()
+        uow = UnitOfWork(self.repo, event_bus=bus)
+        new = uow.add(StubEntity(name='new'))
+        new.rename('renamed')
+        uow.find_by_id(self.entity.id).rename('other')
+
+        uow.commit()
+
+        bus.publish.assert_called_once()
+        events = bus.publish.call_args.args[0]
+        self.assertEqual([event.aggregate_id for event in events], [new.id, self.entity.id])
+        self.assertEqual(new.events, ())
+        self.assertEqual(self.entity.events, ())
+
+    def test_rollback_keeps_events_unpublished(self):
+        bus = MagicMock()
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(self.repo, event_bus=bus) as uow:
+                uow.find_by_id(self.entity.id).rename('other')
+                raise RuntimeError()
+
+        bus.publish.assert_not_called()
+        self.assertEqual(len(self.entity.events), 1)
@@ -1,9 +1,13 @@
 import unittest
 
-from dataclasses import dataclass, is_dataclass
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 
 from __seedwork.domain.entities import Entity
-from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.domain.events import DomainEvent
+from __seedwork.domain.exceptions import InvalidUuidException
+from __seedwork.domain.value_objects import CompactUniqueEntityId, UniqueEntityId, ValueObject
 
 from abc import ABC
 
@@ -14,6 +18,33 @@ class StubEntity(Entity):
     prop2: str
 
 
+@dataclass(frozen=True, kw_only=True)
+class StubEntityWithDefaults(Entity):
+    prop1: str
+    prop2: str = 'default'
+    prop3: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class StubMoney(ValueObject):
+    amount: int
+    currency: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntityWithValueObjects(Entity):
+    price: StubMoney
+    prices: List[StubMoney] = field(default_factory=list)
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntityWithCompactIds(Entity):
+    prop1: str
+
+    compact_ids = True
+
+
 class TestEntityUnit(unittest.TestCase):
     
     def test_if_is_dataclass(self):
@@ -42,3 +73,168 @@ class TestEntityUnit(unittest.TestCase):
         entity = StubEntity(**expected_dict)
         expected_dict = {"id": entity.id, **expected_dict}
         self.assertDictEqual(entity.to_dict(), expected_dict)
+
+    def test_to_dict_keeps_asdict_key_order(self):
+        entity = StubEntityWithDefaults(prop1='value1', prop3=['value3'])
+        expected_dict = asdict(entity)
+        expected_dict.pop('unique_entity_id')
+        expected_dict.pop('_dirty_fields')
+        expected_dict.pop('_events')
+        expected_dict['id'] = entity.id
+
+        entity_dict = entity.to_dict()
+        self.assertEqual(list(entity_dict.items()), list(expected_dict.items()))
+
+    def test_to_dict_converts_nested_dataclasses_like_asdict(self):
+        entity = StubEntityWithValueObjects(
+            price=StubMoney(1, 'BRL'),
+            prices=[StubMoney(2, 'USD')],
+            extra={'discount': StubMoney(3, 'BRL'), 'tags': ('a', 'b')}
+        )
+        expected_dict = asdict(entity)
+        expected_dict.pop('unique_entity_id')
+        expected_dict.pop('_dirty_fields')
+        expected_dict.pop('_events')
+        expected_dict['id'] = entity.id
+
+        self.assertEqual(entity.to_dict()['price'], {'amount': 1, 'currency': 'BRL'})
+        self.assertEqual(list(entity.to_dict().items()), list(expected_dict.items()))
+        self.assertEqual(Entity.to_dicts([entity]), [expected_dict])
+
+    def test_to_dicts(self):
+        entities = [
+            StubEntity(prop1='value1', prop2='value2'),
+            StubEntityWithDefaults(prop1='value1'),
+            StubEntity(prop1='value3', prop2='value4'),
+        ]
+        self.assertEqual(
+            Entity.to_dicts(iter(entities)),
+            [entity.to_dict() for entity in entities]
+        )
+        self.assertEqual(Entity.to_dicts([]), [])
+
+    def test_from_trusted_skips_id_validation(self):
+        with patch.object(UniqueEntityId, '_UniqueEntityId__validate') as mock_validate:
+            entity = StubEntity.from_trusted(
+                id='cf28b7b2-a8af-4bd1-9d5b-b4c9917d340c', prop1='value1', prop2='value2')
+            mock_validate.assert_not_called()
+
+        self.assertIsInstance(entity, StubEntity)
+        self.assertIsInstance(entity.unique_entity_id, UniqueEntityId)
+        self.assertEqual(entity.id, 'cf28b7b2-a8af-4bd1-9d5b-b4c9917d340c')
+        self.assertEqual(entity.prop1, 'value1')
+        self.assertEqual(entity.prop2, 'value2')
+
+    def test_from_trusted_round_trips_to_dict(self):
+        entity = StubEntity(prop1='value1', prop2='value2')
+        self.assertEqual(StubEntity.from_trusted(**entity.to_dict()), entity)
+
+    def test_from_trusted_fills_defaults(self):
+        entity = StubEntityWithDefaults.from_trusted(prop1='value1')
+        self.assertIsInstance(entity.unique_entity_id, UniqueEntityId)
+        self.assertEqual(entity.prop2, 'default')
+        self.assertEqual(entity.prop3, [])
+
+    def test_from_trusted_requires_props_without_default(self):
+        with self.assertRaises(TypeError) as assert_error:
+            StubEntity.from_trusted(prop1='value1')
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "StubEntity is missing the required prop 'prop2'"
+        )
+
+    def test_hydrate_many_rejects_a_none_id(self):
+        with self.assertRaises(InvalidUuidException):
+            StubEntity.from_trusted(id=None, prop1='value1', prop2='value2')
+
+    def test_hydrate_many_keeps_compact_ids(self):
+        entity_id = 'cf28b7b2-a8af-4bd1-9d5b-b4c9917d340c'
+        entity = StubEntityWithCompactIds.from_trusted(id=entity_id, prop1='value1')
+        self.assertIsInstance(entity.unique_entity_id, CompactUniqueEntityId)
+        self.assertEqual(entity.id, entity_id)
+        self.assertEqual(entity.to_dict(), {'prop1': 'value1', 'id': entity_id})
+        self.assertEqual(entity.unique_entity_id, UniqueEntityId(entity_id))
+        self.assertIsInstance(
+            StubEntityWithCompactIds.from_trusted(prop1='value1').unique_entity_id,
+            CompactUniqueEntityId)
+        self.assertIsInstance(
+            StubEntity.from_trusted(id=entity_id, prop1='a', prop2='b').unique_entity_id,
+            UniqueEntityId)
+
+    def test_hydrate_many_keeps_non_canonical_ids_with_compact_ids(self):
+        entity_id = 'cf28b7b2-a8af-4bd1-9d5b-b4c9917d340c'
+        for id_value in [
+            entity_id.upper(),
+            '{' + entity_id + '}',
+            'urn:uuid:' + entity_id,
+            entity_id.replace('-', ''),
+        ]:
+            compact = StubEntityWithCompactIds.from_trusted(id=id_value, prop1='value1')
+            plain = StubEntity.from_trusted(id=id_value, prop1='a', prop2='b')
+            self.assertEqual(compact.id, id_value)
+            self.assertEqual(compact.unique_entity_id, plain.unique_entity_id)
+            self.assertEqual(hash(compact.unique_entity_id), hash(plain.unique_entity_id))
+            items = {compact.id: compact}
+            self.assertIs(items.get(plain.id), compact)
+            self.assertIsNone(items.get(entity_id))
+
+    def test_hydrate_many(self):
+        rows = [
+            {'id': 'cf28b7b2-a8af-4bd1-9d5b-b4c9917d340c', 'prop1': 'a', 'prop2': 'b'},
+            {'id': '3aefc22e-8006-4024-a239-a27084c5133e', 'prop1': 'c', 'prop2': 'd'},
+        ]
+        entities = StubEntity.hydrate_many(iter(rows))
+        self.assertEqual([entity.to_dict() for entity in entities], [
+            {'prop1': 'a', 'prop2': 'b', 'id': 'cf28b7b2-a8af-4bd1-9d5b-b4c9917d340c'},
+            {'prop1': 'c', 'prop2': 'd', 'id': '3aefc22e-8006-4024-a239-a27084c5133e'},
+        ])
+
+    def test_set_records_dirty_fields(self):
+        entity = StubEntity(prop1='value1', prop2='value2')
+        self.assertEqual(entity.dirty_fields, frozenset())
+
+        entity._set('prop1', 'value1')  # pylint: disable=protected-access
+        self.assertEqual(entity.dirty_fields, frozenset())
+
+        entity._set('prop1', 'changed')  # pylint: disable=protected-access
+        self.assertEqual(entity.prop1, 'changed')
+        self.assertEqual(entity.dirty_fields, {'prop1'})
+
+        entity.mark_clean()
+        self.assertEqual(entity.dirty_fields, frozenset())
+
+    def test_dirty_fields_are_not_state(self):
+        entity = StubEntity(prop1='value1', prop2='value2')
+        clean = StubEntity(unique_entity_id=entity.unique_entity_id, prop1='value1', prop2='value2')
+        entity._set('prop1', 'changed')  # pylint: disable=protected-access
+        entity._set('prop1', 'value1')  # pylint: disable=protected-access
+
+        self.assertEqual(entity, clean)
+        self.assertEqual(hash(entity), hash(clean))
+        self.assertNotIn('_dirty_fields', repr(entity))
+        self.assertNotIn('_dirty_fields', entity.to_dict())
+        self.assertEqual(StubEntity.from_trusted(**entity.to_dict()).dirty_fields, frozenset())
+        with self.assertRaises(TypeError):
+            StubEntity(prop1='value1', prop2='value2', _dirty_fields=set())
+
+    def test_record_and_pull_events(self):
+        entity = StubEntity(prop1='value1', prop2='value2')
+        self.assertEqual(entity.events, ())
+        self.assertEqual(entity.pull_events(), [])
+
+        events = [DomainEvent(aggregate_id=entity.id), DomainEvent(aggregate_id=entity.id)]
+        for event in events:
+            entity._record(event)  # pylint: disable=protected-access
+
+        self.assertEqual(entity.events, tuple(events))
+        self.assertEqual(entity.pull_events(), events)
+        self.assertEqual(entity.events, ())
+
+    def test_events_are_not_state(self):
+        entity = StubEntity(prop1='value1', prop2='value2')
+        entity._record(DomainEvent(aggregate_id=entity.id))  # pylint: disable=protected-access
+
+        self.assertEqual(
+            entity, StubEntity(unique_entity_id=entity.unique_entity_id, prop1='value1', prop2='value2'))
+        self.assertNotIn('_events', entity.to_dict())
+        self.assertEqual(StubEntity.from_trusted(**entity.to_dict()).events, ())
@@ -0,0 +1,35 @@
+import unittest
+
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+
+from __seedwork.domain.events import AsyncEventBusInterface, DomainEvent, EventBusInterface
+
+
+class TestDomainEvent(unittest.TestCase):
+
+    def test_props(self):
+        event = DomainEvent(aggregate_id='some id')
+        self.assertEqual(event.aggregate_id, 'some id')
+        self.assertIsInstance(event.occurred_at, datetime)
+
+        occurred_at = datetime(2023, 1, 1)
+        self.assertEqual(
+            DomainEvent(aggregate_id='some id', occurred_at=occurred_at).occurred_at, occurred_at)
+
+    def test_is_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            DomainEvent(aggregate_id='some id').aggregate_id = 'other'
+
+    def test_requires_keyword_arguments(self):
+        with self.assertRaises(TypeError):
+            DomainEvent('some id')  # pylint: disable=too-many-function-args
+
+
+class TestEventBusInterfaces(unittest.TestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        for interface in [EventBusInterface, AsyncEventBusInterface]:
+            with self.assertRaises(TypeError) as assert_error:
+                interface()  # pylint: disable=abstract-class-instantiated
+            self.assertIn('publish, subscribe', assert_error.exception.args[0])
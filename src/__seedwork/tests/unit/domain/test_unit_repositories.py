@@ -0,0 +1,698 @@
+import unittest
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+from unittest.mock import MagicMock, call
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import AlreadyExistsException, NotFoundException
+from __seedwork.domain.repositories import (
+    ChangeSet,
+    InMemoryRepository,
+    InMemorySearchableRepository,
+    RepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult,
+    SortedIndex,
+    TextIndex,
+    Filter,
+    contains_terms,
+    tokenize
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[float] = None
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    sorted_indexes = ['name', 'price']
+
+
+class TestRepositoryInterface(unittest.TestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        with self.assertRaises(TypeError) as assert_error:
+            # pylint: disable=abstract-class-instantiated
+            RepositoryInterface()
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Can't instantiate abstract class RepositoryInterface with abstract methods bulk_insert, delete, find_all, find_by_id, insert, update"
+        )
+
+    def test_save_changes_falls_back_to_single_writes(self):
+        repo = MagicMock()
+        new, changed = StubEntity(name='new'), StubEntity(name='changed')
+
+        RepositoryInterface.save_changes(repo, ChangeSet(
+            inserted=[new], updated=[(changed, frozenset({'name'}))], deleted=['some id']))
+
+        self.assertEqual(repo.mock_calls, [
+            call.bulk_insert([new]), call.update(changed), call.delete('some id')])
+
+
+class TestChangeSet(unittest.TestCase):
+
+    def test_is_falsy_when_empty(self):
+        self.assertFalse(ChangeSet())
+        self.assertTrue(ChangeSet(inserted=[StubEntity(name='a')]))
+        self.assertTrue(ChangeSet(updated=[(StubEntity(name='a'), frozenset({'name'}))]))
+        self.assertTrue(ChangeSet(deleted=['some id']))
+
+
+class TestSortedIndex(unittest.TestCase):
+
+    def test_keep_ids_ordered_by_field(self):
+        index = SortedIndex('name')
+        entities = [StubEntity(name=name) for name in ['c', 'a', 'b']]
+        for entity in entities:
+            index.add(entity)
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(
+            list(index.ids()),
+            [entities[1].id, entities[2].id, entities[0].id]
+        )
+        self.assertEqual(
+            list(index.ids(reverse=True)),
+            [entities[0].id, entities[2].id, entities[1].id]
+        )
+        self.assertEqual(list(index.ids(start=1, stop=2)), [entities[2].id])
+        self.assertEqual(list(index.ids(reverse=True, start=2)), [entities[1].id])
+        self.assertEqual(list(index.ids(start=5)), [])
+
+    def test_none_values_come_first(self):
+        index = SortedIndex('price')
+        with_price = StubEntity(name='a', price=10)
+        without_price = StubEntity(name='b')
+        index.add(with_price)
+        index.add(without_price)
+        self.assertEqual(list(index.ids()), [without_price.id, with_price.id])
+
+    def test_split_and_merge_buckets(self):
+        index = SortedIndex('price', load=2)
+        entities = [StubEntity(name=str(price), price=price)
+                    for price in [5, 3, 9, 1, 7, 2, 8, 4, 6, 0]]
+        for entity in entities:
+            index.add(entity)
+
+        by_price = sorted(entities, key=lambda entity: entity.price)
+        self.assertGreater(len(index._lists), 1)
+        self.assertEqual(list(index.ids()), [entity.id for entity in by_price])
+        self.assertEqual(
+            list(index.ids(start=3, stop=8)),
+            [entity.id for entity in by_price[3:8]]
+        )
+        self.assertEqual(
+            list(index.ids(reverse=True, start=2, stop=7)),
+            [entity.id for entity in by_price[::-1][2:7]]
+        )
+
+        for entity in by_price[:6]:
+            index.remove(entity.id)
+        self.assertEqual(list(index.ids()), [entity.id for entity in by_price[6:]])
+
+    def test_add_many_matches_add(self):
+        entities = [StubEntity(name=str(position), price=price)
+                    for position, price in enumerate([5, 3, None, 1, 7, 3, 8, None, 6, 0])]
+        for batches in [[entities], [entities[:8], entities[8:]], [entities[:2], entities[2:]]]:
+            index = SortedIndex('price', load=2)
+            for batch in batches:
+                index.add_many(batch)
+            entities[0]._set('price', 4)
+            index.add_many(entities[:1])
+            index.add_many(entities[:6])
+            entities[0]._set('price', 5)
+            index.add(entities[0])
+
+            expected = SortedIndex('price', load=2)
+            for entity in entities:
+                expected.add(entity)
+            self.assertEqual(len(index), 10)
+            self.assertEqual(list(index.ids()), list(expected.ids()))
+            self.assertTrue(all(0 < len(bucket) <= 4 for bucket in index._lists))
+            self.assertEqual(index._maxes, [bucket[-1] for bucket in index._lists])
+
+    def test_reindex_and_remove(self):
+        index = SortedIndex('name')
+        entity1 = StubEntity(name='a')
+        entity2 = StubEntity(name='b')
+        index.add(entity1)
+        index.add(entity2)
+
+        entity1._set('name', 'c')
+        index.add(entity1)
+        self.assertEqual(list(index.ids()), [entity2.id, entity1.id])
+
+        index.remove(entity2.id)
+        index.remove(entity2.id)
+        self.assertEqual(list(index.ids()), [entity1.id])
+
+
+class TestTextIndex(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('Sci-Fi movies, 2nd_ed'), ['sci', 'fi', 'movies', '2nd_ed'])
+        self.assertEqual(tokenize(None), [])
+        self.assertEqual(tokenize('%'), [])
+
+    def test_search_tokens_and_prefixes(self):
+        index = TextIndex(('name',))
+        horror = StubEntity(name='Horror movies')
+        drama = StubEntity(name='Drama Movie')
+        index.add(horror)
+        index.add(drama)
+
+        self.assertEqual(index.search('MOV'), {horror.id, drama.id})
+        self.assertEqual(index.search('movie', prefix=False), {drama.id})
+        self.assertEqual(index.search('mov hor'), {horror.id})
+        self.assertEqual(index.search('ovie'), set())
+        self.assertIsNone(index.search('%'))
+
+    def test_reindex_and_remove(self):
+        index = TextIndex(('name',), merge_threshold=1)
+        entities = [StubEntity(name=f'word{position} common') for position in range(5)]
+        for entity in entities:
+            index.add(entity)
+
+        entities[0]._set('name', 'other')
+        index.add(entities[0])
+        index.remove(entities[1].id)
+        index.remove(entities[1].id)
+
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.search('word'), {entity.id for entity in entities[2:]})
+        self.assertEqual(index.search('common'), {entity.id for entity in entities[2:]})
+        self.assertEqual(index.search('other'), {entities[0].id})
+
+        entities[0]._set('name', 'word0')
+        index.add(entities[0])
+        self.assertEqual(index.search('word0'), {entities[0].id})
+        self.assertEqual(index._vocabulary, sorted(set(index._vocabulary)))
+
+    def test_add_many_matches_add(self):
+        entities = [StubEntity(name=f'word{position % 7} common{position}') for position in range(40)]
+        incremental = TextIndex(('name',), merge_threshold=4)
+        for entity in entities:
+            incremental.add(entity)
+
+        for merge_threshold in [4, 1000]:
+            bulk = TextIndex(('name',), merge_threshold=merge_threshold)
+            bulk.add_many(entities[:30])
+            entities[0]._set('name', 'renamed')
+            bulk.add_many(entities[:1] + entities[30:])
+            incremental.add(entities[0])
+            entities[0]._set('name', 'word0 common0')
+            incremental.add(entities[0])
+            bulk.add(entities[0])
+
+            self.assertEqual(len(bulk), 40)
+            for query in ['word', 'word3', 'common1', 'com', 'renamed', 'x']:
+                self.assertEqual(bulk.search(query), incremental.search(query), query)
+            vocabulary = sorted(bulk._vocabulary + bulk._recent)
+            self.assertEqual(vocabulary, sorted(set(vocabulary)))
+
+    def test_contains_terms_matches_search(self):
+        self.assertTrue(contains_terms('Horror movies', ['mov', 'hor']))
+        self.assertFalse(contains_terms('Horror movies', ['ovie']))
+        self.assertFalse(contains_terms(None, ['a']))
+        self.assertTrue(contains_terms('Horror movies', ['movies'], prefix=False))
+        self.assertFalse(contains_terms('Horror movies', ['mov'], prefix=False))
+
+    def test_verifies_few_candidates_against_their_tokens(self):
+        index = TextIndex(('name',), verify_below=1)
+        entities = [StubEntity(name=f'alpha beta{position}') for position in range(3)]
+        for entity in entities:
+            index.add(entity)
+
+        self.assertEqual(index.search('beta1 alpha'), {entities[1].id})
+        self.assertEqual(index.search('beta alpha'), {entity.id for entity in entities})
+
+
+class TestInMemoryRepository(unittest.TestCase):
+
+    repo: StubInMemoryRepository
+
+    def setUp(self) -> None:
+        self.repo = StubInMemoryRepository()
+
+    def test_items_prop_is_empty_on_init(self):
+        self.assertEqual(self.repo.items, {})
+        self.assertEqual(set(self.repo.indexes), {'name', 'price'})
+        self.assertIsNone(StubTextSearchableRepository().text_index)
+
+    def test_index_items_passed_in_constructor(self):
+        entity = StubEntity(name='test')
+        repo = StubInMemoryRepository(items={entity.id: entity})
+        self.assertEqual(repo.find_all_sorted('name'), [entity])
+
+    def test_insert(self):
+        entity = StubEntity(name='test', price=5)
+        self.repo.insert(entity)
+        self.assertEqual(self.repo.items[entity.id], entity)
+        self.assertEqual(list(self.repo.indexes['name'].ids()), [entity.id])
+
+    def test_bulk_insert(self):
+        entities = [StubEntity(name='b'), StubEntity(name='a')]
+        self.repo.bulk_insert(entities)
+        self.assertEqual(self.repo.find_all(), entities)
+        self.assertEqual(self.repo.find_all_sorted('name'), entities[::-1])
+
+    def test_throw_already_exists_exception_on_duplicate_ids(self):
+        entity = StubEntity(name='test')
+        self.repo.insert(entity)
+        with self.assertRaises(AlreadyExistsException) as assert_error:
+            self.repo.insert(StubEntity(unique_entity_id=entity.unique_entity_id, name='other'))
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity already exists using ID '{entity.id}'")
+
+        new = StubEntity(name='new')
+        for entities in [[new, entity], [new, new]]:
+            with self.assertRaises(AlreadyExistsException):
+                self.repo.bulk_insert(entities)
+        self.assertEqual(self.repo.find_all(), [entity])
+        self.assertEqual(len(self.repo.indexes['name']), 1)
+
+    def test_throw_not_found_exception_in_find_by_id(self):
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake id')
+        self.assertEqual(
+            assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+
+        unique_entity_id = UniqueEntityId('af46842e-027d-4c91-b259-3a3642144ba4')
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id(unique_entity_id)
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'"
+        )
+
+    def test_find_by_id(self):
+        entity = StubEntity(name='test')
+        self.repo.insert(entity)
+
+        self.assertEqual(self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(self.repo.find_by_id(entity.unique_entity_id), entity)
+
+    def test_find_all(self):
+        entity = StubEntity(name='test')
+        self.repo.insert(entity)
+        self.assertEqual(self.repo.find_all(), [entity])
+
+    def test_find_all_sorted(self):
+        entities = [
+            StubEntity(name='b', price=1),
+            StubEntity(name='a', price=3),
+            StubEntity(name='c', price=2),
+        ]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        self.assertEqual(
+            self.repo.find_all_sorted('name'),
+            [entities[1], entities[0], entities[2]]
+        )
+        self.assertEqual(
+            self.repo.find_all_sorted('price', 'desc'),
+            [entities[1], entities[2], entities[0]]
+        )
+        self.assertEqual(
+            self.repo.find_all_sorted('name', offset=1, limit=1),
+            [entities[0]]
+        )
+
+    def test_throw_error_when_sort_field_is_not_indexed(self):
+        with self.assertRaises(ValueError) as assert_error:
+            self.repo.find_all_sorted('fake')
+        self.assertEqual(
+            assert_error.exception.args[0], 'The fake field is not indexed')
+
+    def test_throw_not_found_exception_in_update(self):
+        entity = StubEntity(name='test')
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.update(entity)
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity not found using ID '{entity.id}'")
+
+    def test_update(self):
+        entity1 = StubEntity(name='a')
+        entity2 = StubEntity(name='b')
+        self.repo.insert(entity1)
+        self.repo.insert(entity2)
+
+        updated = StubEntity(unique_entity_id=entity1.unique_entity_id, name='c')
+        self.repo.update(updated)
+
+        self.assertEqual(self.repo.find_by_id(entity1.id), updated)
+        self.assertEqual(self.repo.find_all_sorted('name'), [entity2, updated])
+
+    def test_throw_not_found_exception_in_delete(self):
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.delete('fake id')
+        self.assertEqual(
+            assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+
+    def test_delete(self):
+        entity = StubEntity(name='test')
+        self.repo.insert(entity)
+
+        self.repo.delete(entity.unique_entity_id)
+
+        self.assertEqual(self.repo.items, {})
+        self.assertEqual(self.repo.find_all_sorted('name'), [])
+
+    def test_save_changes(self):
+        kept, changed = StubEntity(name='b', price=1), StubEntity(name='d', price=2)
+        removed = StubEntity(name='c')
+        self.repo.bulk_insert([kept, changed, removed])
+        new = StubEntity(name='e', price=3)
+        changed._set('name', 'a')  # pylint: disable=protected-access
+
+        self.repo.save_changes(ChangeSet(
+            inserted=[new], updated=[(changed, changed.dirty_fields)], deleted=[removed.id]))
+
+        self.assertEqual(self.repo.find_all_sorted('name'), [changed, kept, new])
+        self.assertEqual(self.repo.find_all_sorted('price'), [kept, changed, new])
+
+    def test_save_changes_writes_nothing_when_an_id_is_missing(self):
+        entity = StubEntity(name='a')
+        self.repo.insert(entity)
+        new = StubEntity(name='b')
+
+        with self.assertRaises(NotFoundException):
+            self.repo.save_changes(ChangeSet(inserted=[new], deleted=[entity.id, 'fake id']))
+        with self.assertRaises(NotFoundException):
+            self.repo.save_changes(ChangeSet(
+                inserted=[new], updated=[(StubEntity(name='c'), frozenset({'name'}))]))
+
+        self.assertEqual(self.repo.find_all(), [entity])
+
+
+class TestSearchParams(unittest.TestCase):
+
+    def test_props_annotations(self):
+        self.assertEqual(SearchParams.__annotations__, {
+            'page': Optional[int],
+            'per_page': Optional[int],
+            'sort': Optional[str],
+            'sort_dir': Optional[str],
+            'filter': Optional[Filter],
+        })
+
+    def test_page_prop(self):
+        arrange = [
+            {'page': None, 'expected': 1},
+            {'page': '', 'expected': 1},
+            {'page': 'fake', 'expected': 1},
+            {'page': 0, 'expected': 1},
+            {'page': -1, 'expected': 1},
+            {'page': '0', 'expected': 1},
+            {'page': 5.5, 'expected': 5},
+            {'page': True, 'expected': 1},
+            {'page': False, 'expected': 1},
+            {'page': {}, 'expected': 1},
+            {'page': 1, 'expected': 1},
+            {'page': 2, 'expected': 2},
+        ]
+
+        for item in arrange:
+            params = SearchParams(page=item['page'])
+            self.assertEqual(params.page, item['expected'], f"{item}")
+
+    def test_per_page_prop(self):
+        arrange = [
+            {'per_page': None, 'expected': 15},
+            {'per_page': '', 'expected': 15},
+            {'per_page': 'fake', 'expected': 15},
+            {'per_page': 0, 'expected': 15},
+            {'per_page': -1, 'expected': 15},
+            {'per_page': True, 'expected': 15},
+            {'per_page': 1, 'expected': 1},
+            {'per_page': '10', 'expected': 10},
+        ]
+
+        for item in arrange:
+            params = SearchParams(per_page=item['per_page'])
+            self.assertEqual(params.per_page, item['expected'], f"{item}")
+
+    def test_sort_prop(self):
+        self.assertIsNone(SearchParams().sort)
+
+        arrange = [
+            {'sort': None, 'expected': None},
+            {'sort': '', 'expected': None},
+            {'sort': 'fake', 'expected': 'fake'},
+            {'sort': 0, 'expected': '0'},
+            {'sort': True, 'expected': 'True'},
+        ]
+
+        for item in arrange:
+            params = SearchParams(sort=item['sort'])
+            self.assertEqual(params.sort, item['expected'], f"{item}")
+
+    def test_sort_dir_prop(self):
+        self.assertIsNone(SearchParams(sort_dir='desc').sort_dir)
+
+        arrange = [
+            {'sort_dir': None, 'expected': 'asc'},
+            {'sort_dir': '', 'expected': 'asc'},
+            {'sort_dir': 'fake', 'expected': 'asc'},
+            {'sort_dir': 'asc', 'expected': 'asc'},
+            {'sort_dir': 'ASC', 'expected': 'asc'},
+            {'sort_dir': 'desc', 'expected': 'desc'},
+            {'sort_dir': 'DESC', 'expected': 'desc'},
+        ]
+
+        for item in arrange:
+            params = SearchParams(sort='name', sort_dir=item['sort_dir'])
+            self.assertEqual(params.sort_dir, item['expected'], f"{item}")
+
+    def test_filter_prop(self):
+        arrange = [
+            {'filter': None, 'expected': None},
+            {'filter': '', 'expected': None},
+            {'filter': 'fake', 'expected': 'fake'},
+            {'filter': 0, 'expected': 0},
+        ]
+
+        for item in arrange:
+            params = SearchParams(filter=item['filter'])
+            self.assertEqual(params.filter, item['expected'], f"{item}")
+
+
+class TestSearchResult(unittest.TestCase):
+
+    def test_constructor_and_to_dict(self):
+        entity = StubEntity(name='test')
+        result = SearchResult(
+            items=[entity],
+            total=4,
+            current_page=1,
+            per_page=2,
+            sort='name',
+            sort_dir='asc',
+            filter='test'
+        )
+
+        self.assertDictEqual(result.to_dict(), {
+            'items': [entity],
+            'total': 4,
+            'current_page': 1,
+            'per_page': 2,
+            'last_page': 2,
+            'sort': 'name',
+            'sort_dir': 'asc',
+            'filter': 'test',
+        })
+
+    def test_when_per_page_is_greater_than_total(self):
+        result = SearchResult(items=[], total=4, current_page=1, per_page=15)
+        self.assertEqual(result.last_page, 1)
+
+    def test_when_per_page_is_less_than_total_and_not_multiple(self):
+        result = SearchResult(items=[], total=101, current_page=1, per_page=20)
+        self.assertEqual(result.last_page, 6)
+
+
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+    sorted_indexes = ['name']
+    sortable_fields = ['name', 'price']
+
+    def _apply_filter(self, items: Iterable[StubEntity], filter_param: str) -> Iterator[StubEntity]:
+        filter_lower = filter_param.lower()
+        return (item for item in items if filter_lower in item.name.lower())
+
+
+class StubTextSearchableRepository(StubInMemorySearchableRepository):
+    text_indexed_fields = ['name']
+
+    def _filter_ids(self, filter_param: str):
+        return self.text_index.search(filter_param)
+
+
+class TestSearchableRepositoryInterface(unittest.TestCase):
+
+    def test_sortable_fields_prop(self):
+        self.assertEqual(SearchableRepositoryInterface.sortable_fields, [])
+
+    def test_throw_error_when_search_not_implemented(self):
+        with self.assertRaises(TypeError):
+            # pylint: disable=abstract-class-instantiated
+            SearchableRepositoryInterface()
+
+
+class TestInMemorySearchableRepository(unittest.TestCase):
+
+    repo: StubInMemorySearchableRepository
+
+    def setUp(self) -> None:
+        self.repo = StubInMemorySearchableRepository()
+        self.entities = [
+            StubEntity(name='b', price=5),
+            StubEntity(name='a', price=2),
+            StubEntity(name='TEST', price=4),
+            StubEntity(name='e', price=1),
+            StubEntity(name='test', price=3),
+        ]
+        for entity in self.entities:
+            self.repo.insert(entity)
+
+    def test_search_without_params_keeps_insertion_order(self):
+        result = self.repo.search(SearchParams())
+        self.assertEqual(result, SearchResult(
+            items=self.entities,
+            total=5,
+            current_page=1,
+            per_page=15,
+        ))
+
+    def test_search_paginates(self):
+        result = self.repo.search(SearchParams(page=2, per_page=2))
+        self.assertEqual(result.items, self.entities[2:4])
+        self.assertEqual(result.total, 5)
+        self.assertEqual(result.last_page, 3)
+
+    def test_search_sorted_by_indexed_field(self):
+        by_name = sorted(self.entities, key=lambda entity: entity.name)
+
+        result = self.repo.search(SearchParams(sort='name', per_page=2, page=2))
+        self.assertEqual(result.items, by_name[2:4])
+        self.assertEqual(result.sort, 'name')
+        self.assertEqual(result.sort_dir, 'asc')
+
+        result = self.repo.search(SearchParams(sort='name', sort_dir='desc', per_page=2))
+        self.assertEqual(result.items, by_name[::-1][:2])
+
+    def test_search_sorted_by_not_indexed_field(self):
+        by_price = sorted(self.entities, key=lambda entity: entity.price)
+
+        result = self.repo.search(SearchParams(sort='price', per_page=2, page=2))
+        self.assertEqual(result.items, by_price[2:4])
+
+        result = self.repo.search(SearchParams(sort='price', sort_dir='desc', per_page=3))
+        self.assertEqual(result.items, by_price[::-1][:3])
+
+    def test_search_ignores_not_sortable_fields(self):
+        result = self.repo.search(SearchParams(sort='id', per_page=2))
+        self.assertEqual(result.items, self.entities[:2])
+
+    def test_search_filtered(self):
+        result = self.repo.search(SearchParams(filter='TEST'))
+        self.assertEqual(result.items, [self.entities[2], self.entities[4]])
+        self.assertEqual(result.total, 2)
+        self.assertEqual(result.filter, 'TEST')
+
+    def test_search_filtered_and_sorted(self):
+        result = self.repo.search(
+            SearchParams(filter='test', sort='name', sort_dir='desc', per_page=1, page=2))
+        self.assertEqual(result.items, [self.entities[2]])
+        self.assertEqual(result.total, 2)
+
+        result = self.repo.search(
+            SearchParams(filter='test', sort='price', per_page=1))
+        self.assertEqual(result.items, [self.entities[4]])
+        self.assertEqual(result.total, 2)
+
+    def test_search_default_sort(self):
+        self.repo.default_sort = 'price'
+        self.repo.default_sort_dir = 'desc'
+        result = self.repo.search(SearchParams(per_page=1))
+        self.assertEqual(result.items, [self.entities[0]])
+        self.assertIsNone(result.sort)
+
+    def test_update_many(self):
+        b, a, _, e, _ = self.entities
+
+        self.assertEqual(self.repo.update_many({'price': 10}, filter_param='A'), 1)
+        self.assertEqual(a.price, 10)
+
+        ids = [b.unique_entity_id, e.id, e.id, 'fake id']
+        self.assertEqual(self.repo.update_many({'name': 'z', 'price': 0}, ids), 2)
+        self.assertEqual((b.name, b.price, e.name, e.price), ('z', 0, 'z', 0))
+        self.assertEqual(self.repo.update_many({'price': 5}, ids, 'test'), 0)
+
+        result = self.repo.search(SearchParams(sort='name'))
+        self.assertEqual([item.name for item in result.items], ['TEST', 'a', 'test', 'z', 'z'])
+        self.assertEqual(self.repo.update_many({'price': 1}), 5)
+
+    def test_update_many_keeps_only_unsaved_fields_dirty(self):
+        b, a, *_ = self.entities
+        b._set('name', 'unsaved')  # pylint: disable=protected-access
+
+        self.repo.update_many({'price': 10})
+
+        self.assertEqual((a.price, b.price), (10, 10))
+        self.assertEqual(a.dirty_fields, frozenset())
+        self.assertEqual(b.dirty_fields, frozenset({'name'}))
+
+    def test_update_many_requires_values(self):
+        with self.assertRaises(ValueError) as assert_error:
+            self.repo.update_many({})
+        self.assertEqual(assert_error.exception.args[0], 'There are no values to update')
+
+
+class TestInMemorySearchableRepositoryWithTextIndex(unittest.TestCase):
+
+    repo: StubTextSearchableRepository
+
+    def setUp(self) -> None:
+        self.repo = StubTextSearchableRepository(use_text_index=True)
+        self.entities = [
+            StubEntity(name=f'{word} {position}', price=position)
+            for position, word in enumerate(['test', 'other', 'Testing', 'tests', 'x'] * 4)
+        ]
+        self.repo.bulk_insert(self.entities)
+
+    def test_search_uses_the_text_index(self):
+        expected = [entity for entity in self.entities if entity.name.lower().startswith('test')]
+
+        result = self.repo.search(SearchParams(filter='TEST', per_page=50))
+        self.assertEqual(result.items, expected)
+        self.assertEqual(result.total, 12)
+
+        for sort, sort_dir in [('name', 'asc'), ('name', 'desc'), ('price', 'desc')]:
+            ordered = sorted(expected, key=lambda entity, sort=sort: getattr(entity, sort),
+                             reverse=sort_dir == 'desc')
+            for per_page in [1, 5, 20]:
+                result = self.repo.search(SearchParams(
+                    filter='test', sort=sort, sort_dir=sort_dir, page=2, per_page=per_page))
+                self.assertEqual(result.items, ordered[per_page:2 * per_page], (sort, per_page))
+
+    def test_index_follows_writes(self):
+        first, second = self.entities[:2]
+        self.repo.delete(first.id)
+        self.repo.save_changes(ChangeSet(updated=[(second, frozenset({'price'}))]))
+        self.assertEqual(self.repo.search(SearchParams(filter='other')).total, 4)
+
+        second._set('name', 'renamed')
+        self.repo.save_changes(ChangeSet(updated=[(second, frozenset({'name'}))]))
+        self.assertEqual(self.repo.search(SearchParams(filter='other')).total, 3)
+
+        self.assertEqual(self.repo.update_many({'name': 'done'}, filter_param='ren'), 1)
+        self.assertEqual(self.repo.update_many({'price': 0}, [second.id, self.entities[2].id], 'done'), 1)
+        self.assertEqual(self.repo.search(SearchParams(filter='done')).items, [second])
+        self.assertEqual(self.repo.search(SearchParams(filter='ren')).total, 0)
@@ -3,7 +3,20 @@ from unittest.mock import patch, PropertyMock, MagicMock
 
 from rest_framework.serializers import Serializer
 
-from __seedwork.domain.validators import ValidatorRules, ValidatorFieldsInterface, DRFValidator
+from __seedwork.domain.validators import (
+    BatchValidationResult,
+    BooleanField,
+    CharField,
+    FieldError,
+    IntegerField,
+    NativeValidator,
+    empty,
+    BatchValidatorRules,
+    ValidatorRules,
+    ValidatorSchema,
+    ValidatorFieldsInterface,
+    DRFValidator
+)
 from __seedwork.domain.exceptions import ValidationException
 
 from dataclasses import fields
@@ -143,6 +156,152 @@ class TestValidatorRules(unittest.TestCase):
         self.assertTrue(True)  # pylint: disable=redundant-unittest-assert
 
 
+class TestBatchValidationResult(unittest.TestCase):
+
+    def test_init_with_empty_mask(self):
+        result = BatchValidationResult(3)
+        self.assertEqual(result.mask, bytearray(3))
+        self.assertEqual(result.errors, {})
+        self.assertTrue(result.is_valid)
+        self.assertEqual(list(result.valid_rows()), [0, 1, 2])
+
+    def test_add_error(self):
+        result = BatchValidationResult(3)
+        result.add_error(1, 'prop', 'some error')
+        result.add_error(1, 'prop', 'other error')
+        result.add_error(1, 'prop2', 'some error')
+
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.mask, bytearray([0, 1, 0]))
+        self.assertEqual(result.errors, {
+            1: {'prop': ['some error', 'other error'], 'prop2': ['some error']}
+        })
+        self.assertEqual(list(result.valid_rows()), [0, 2])
+
+
+class TestBatchValidatorRules(unittest.TestCase):
+
+    def test_values_method(self):
+        validator = BatchValidatorRules.values(['a', 'b'], 'prop')
+        self.assertIsInstance(validator, BatchValidatorRules)
+        self.assertEqual(validator.result.size, 2)
+
+        result = BatchValidationResult(2)
+        self.assertIs(BatchValidatorRules.values(['a', 'b'], 'prop', result).result, result)
+
+    def test_required_rule(self):
+        result = BatchValidatorRules.values(['value', None, '', 0], 'prop').required().result
+        self.assertEqual(result.mask, bytearray([0, 1, 1, 0]))
+        self.assertEqual(result.errors, {
+            1: {'prop': ['The prop is required']},
+            2: {'prop': ['The prop is required']},
+        })
+
+    def test_string_rule(self):
+        result = BatchValidatorRules.values(
+            ['String', '', None, 5, True, {}], 'prop').string().result
+        self.assertEqual(result.mask, bytearray([0, 0, 0, 1, 1, 1]))
+        for row in [3, 4, 5]:
+            self.assertEqual(result.errors[row], {'prop': ['The prop must be a string']})
+
+    def test_max_length_rule(self):
+        result = BatchValidatorRules.values(['t' * 5, 't' * 4, None], 'prop').max_length(4).result
+        self.assertEqual(result.mask, bytearray([1, 0, 0]))
+        self.assertEqual(result.errors, {0: {'prop': ['The prop must be less than 4']}})
+
+    def test_boolean_rule(self):
+        result = BatchValidatorRules.values(
+            [True, False, None, 5, 'True', '', {}], 'prop').boolean().result
+        self.assertEqual(result.mask, bytearray([0, 0, 0, 1, 1, 1, 1]))
+        for row in [3, 4, 5, 6]:
+            self.assertEqual(result.errors[row], {'prop': ['The prop must be a boolean']})
+
+    def test_report_only_the_first_failed_rule_per_row(self):
+        result = BatchValidatorRules.values(
+            [None, True, 'Values', 'V'], 'prop1').required().string().max_length(2).result
+
+        self.assertEqual(result.mask, bytearray([1, 1, 1, 0]))
+        self.assertEqual(result.errors, {
+            0: {'prop1': ['The prop1 is required']},
+            1: {'prop1': ['The prop1 must be a string']},
+            2: {'prop1': ['The prop1 must be less than 2']},
+        })
+
+    def test_share_result_between_props(self):
+        result = BatchValidationResult(2)
+        BatchValidatorRules.values([None, 'value'], 'prop1', result).required()
+        BatchValidatorRules.values([5, 'value'], 'prop2', result).string()
+
+        self.assertEqual(result.errors, {
+            0: {'prop1': ['The prop1 is required'], 'prop2': ['The prop2 must be a string']}
+        })
+
+
+class TestValidatorSchema(unittest.TestCase):
+
+    schema = ValidatorSchema({
+        'prop1': ('required', 'string', ('max_length', 5)),
+        'prop2': ('boolean',),
+    })
+
+    def test_compile_returns_a_named_function(self):
+        validate = self.schema.compile('validate_stub')
+        self.assertEqual(validate.__name__, 'validate_stub')
+        self.assertIsNone(validate(prop1='value', prop2=True))
+        self.assertIsNone(validate('value'))
+
+    def test_compiled_function_raises_the_same_messages_as_validator_rules(self):
+        validate = self.schema.compile()
+
+        def validate_with_rules(prop1=None, prop2=None):
+            ValidatorRules.values(prop1, 'prop1').required().string().max_length(5)
+            ValidatorRules.values(prop2, 'prop2').boolean()
+
+        arrange = [
+            {'prop1': None}, {'prop1': ''}, {'prop1': True}, {'prop1': 5},
+            {'prop1': 't' * 6}, {'prop1': 't' * 5, 'prop2': 'True'},
+            {'prop1': None, 'prop2': 'True'}, {'prop1': 'value', 'prop2': 0},
+        ]
+
+        for props in arrange:
+            with self.assertRaises(ValidationException, msg=f"{props}") as expected_error:
+                validate_with_rules(**props)
+            with self.assertRaises(ValidationException, msg=f"{props}") as assert_error:
+                validate(**props)
+            self.assertEqual(
+                assert_error.exception.args, expected_error.exception.args, f"{props}")
+
+    def test_throw_error_when_prop_is_not_an_identifier(self):
+        for prop in ['some prop', 'class']:
+            with self.assertRaises(ValueError) as assert_error:
+                ValidatorSchema({prop: ('required',)}).compile()
+            self.assertEqual(
+                assert_error.exception.args[0], f"The {prop} prop can not be compiled")
+
+    def test_validate_batch(self):
+        result = self.schema.validate_batch(
+            prop1=['value', None, 't' * 6], prop2=[True, 'True', False])
+        self.assertEqual(result.mask, bytearray([0, 1, 1]))
+        self.assertEqual(result.errors, {
+            1: {'prop1': ['The prop1 is required'], 'prop2': ['The prop2 must be a boolean']},
+            2: {'prop1': ['The prop1 must be less than 5']},
+        })
+
+    def test_validate_batch_skips_missing_columns(self):
+        result = self.schema.validate_batch(prop1=['value', None], prop2=None)
+        self.assertEqual(result.errors, {1: {'prop1': ['The prop1 is required']}})
+
+    def test_subset(self):
+        subset = self.schema.subset(['prop2'])
+        self.assertEqual(subset.rules, {'prop2': ('boolean',)})
+        self.assertIsNone(subset.compile()(prop2=True))
+        self.assertEqual(self.schema.subset([]).rules, {})
+
+        with self.assertRaises(ValueError) as assert_error:
+            self.schema.subset(['prop2', 'fake'])
+        self.assertEqual(assert_error.exception.args[0], 'The fake prop is not in the schema')
+
+
 class TestValidatorFieldsInterface(unittest.TestCase):
 
     def test_throw_error_when_validate_method_is_not_implemented(self):
@@ -183,3 +342,101 @@ class TestDRFValidatorUnit(unittest.TestCase):
         self.assertFalse(is_valid)
         mock_is_valid.assert_called()
         self.assertEqual(validator.errors, {'field': ['some error']})
+
+
+class TestNativeFields(unittest.TestCase):
+
+    def assert_field_error(self, native_field, data, expected_errors):
+        with self.assertRaises(FieldError, msg=f"{data}") as assert_error:
+            native_field.run_validation(data)
+        self.assertEqual(assert_error.exception.args[0], expected_errors, f"{data}")
+
+    def test_required_and_null(self):
+        self.assert_field_error(IntegerField(), empty, ['This field is required.'])
+        self.assertIs(IntegerField(required=False).run_validation(empty), empty)
+        self.assert_field_error(IntegerField(), None, ['This field may not be null.'])
+        self.assertIsNone(IntegerField(allow_null=True).run_validation(None))
+
+    def test_char_field(self):
+        self.assertEqual(CharField().run_validation('  value '), 'value')
+        self.assertEqual(CharField(trim_whitespace=False).run_validation(' value '), ' value ')
+        self.assertEqual(CharField().run_validation(10), '10')
+        self.assertEqual(CharField(allow_blank=True).run_validation('  '), '')
+
+        self.assert_field_error(CharField(), '', ['This field may not be blank.'])
+        self.assert_field_error(CharField(), '   ', ['This field may not be blank.'])
+        for data in [True, {}, []]:
+            self.assert_field_error(CharField(), data, ['Not a valid string.'])
+        self.assert_field_error(
+            CharField(max_length=2), 'value',
+            ['Ensure this field has no more than 2 characters.'])
+        self.assert_field_error(
+            CharField(min_length=6), 'value',
+            ['Ensure this field has at least 6 characters.'])
+        self.assert_field_error(
+            CharField(max_length=2), 'va\x00ue',
+            ['Ensure this field has no more than 2 characters.',
+             'Null characters are not allowed.'])
+        self.assert_field_error(
+            CharField(), 'va\ud800ue', ['Surrogate characters are not allowed: U+D800.'])
+
+    def test_boolean_field(self):
+        for data in [True, 1, 'true', 'True', 'YES', 'on', '1']:
+            self.assertIs(BooleanField().run_validation(data), True, f"{data}")
+        for data in [False, 0, 0.0, 'false', 'No', 'OFF', '0']:
+            self.assertIs(BooleanField().run_validation(data), False, f"{data}")
+        self.assertIsNone(BooleanField(allow_null=True).run_validation('null'))
+
+        for data in ['null', 'fake', 5, {}, []]:
+            self.assert_field_error(BooleanField(), data, ['Must be a valid boolean.'])
+
+    def test_integer_field(self):
+        self.assertEqual(IntegerField().run_validation(10), 10)
+        self.assertEqual(IntegerField().run_validation('10'), 10)
+        self.assertEqual(IntegerField().run_validation('10.00'), 10)
+
+        for data in ['fake', '1.5', 1.5, True, '', {}]:
+            self.assert_field_error(IntegerField(), data, ['A valid integer is required.'])
+        self.assert_field_error(IntegerField(), '1' * 1001, ['String value too large.'])
+        self.assert_field_error(
+            IntegerField(max_value=5), 6, ['Ensure this value is less than or equal to 5.'])
+        self.assert_field_error(
+            IntegerField(min_value=5), 4, ['Ensure this value is greater than or equal to 5.'])
+
+
+class StubNativeValidator(NativeValidator):
+    fields = {
+        'name': CharField(max_length=10),
+        'price': IntegerField(),
+        'is_active': BooleanField(required=False),
+    }
+
+
+class TestNativeValidatorUnit(unittest.TestCase):
+
+    def test_validation_with_error(self):
+        validator = StubNativeValidator()
+        is_valid = validator.validate({'name': '', 'is_active': 'fake'})
+
+        self.assertFalse(is_valid)
+        self.assertIsNone(validator.validated_data)
+        self.assertEqual(validator.errors, {
+            'name': ['This field may not be blank.'],
+            'price': ['This field is required.'],
+            'is_active': ['Must be a valid boolean.'],
+        })
+
+    def test_validation_without_error(self):
+        validator = StubNativeValidator()
+        is_valid = validator.validate({'name': ' dudu ', 'price': '10', 'unknown': 'value'})
+
+        self.assertTrue(is_valid)
+        self.assertIsNone(validator.errors)
+        self.assertEqual(validator.validated_data, {'name': 'dudu', 'price': 10})
+
+    def test_validation_with_invalid_data_type(self):
+        validator = StubNativeValidator()
+        self.assertFalse(validator.validate(['name']))
+        self.assertEqual(validator.errors, {
+            'non_field_errors': ['Invalid data. Expected a dictionary, but got list.']
+        })
@@ -7,7 +7,13 @@ import uuid
 
 from dataclasses import dataclass, is_dataclass, FrozenInstanceError
 
-from __seedwork.domain.value_objects import ValueObject, UniqueEntityId
+from __seedwork.domain.value_objects import (
+    CompactUniqueEntityId,
+    ValueObject,
+    UniqueEntityId,
+    generate_uuid4,
+    generate_uuid7
+)
 
 from __seedwork.domain.exceptions import InvalidUuidException
 
@@ -51,6 +57,46 @@ class TestValueObject(unittest.TestCase):
             value_object = StubOneProp(prop="prop")
             value_object.prop = "New Value"
 
+    def test_str_is_generated_once_per_class(self):
+        @dataclass(frozen=True, slots=True)
+        class StubSlots(ValueObject):
+            prop: str
+
+        self.assertIs(StubSlots.__dict__['__str__'], ValueObject.__str__)
+        self.assertEqual(str(StubSlots(prop='a')), 'a')
+        generated = StubSlots.__dict__['__str__']
+        self.assertTrue(generated.generated)
+
+        with patch('__seedwork.domain.value_objects.fields') as fields_mock:
+            self.assertEqual(str(StubSlots(prop='b')), 'b')
+            fields_mock.assert_not_called()
+        self.assertIs(StubSlots.__dict__['__str__'], generated)
+
+        self.assertEqual(str(ValueObject()), '{}')
+        self.assertFalse(hasattr(ValueObject.__str__, 'generated'))
+
+    def test_subclasses_do_not_inherit_a_generated_str(self):
+        @dataclass(frozen=True)
+        class StubParent(ValueObject):
+            prop1: str
+
+        @dataclass(frozen=True)
+        class StubChild(StubParent):
+            prop2: str
+
+        @dataclass(frozen=True)
+        class StubCustom(StubChild):
+            def __str__(self):
+                return 'custom'
+
+        @dataclass(frozen=True)
+        class StubCustomChild(StubCustom):
+            pass
+
+        self.assertEqual(str(StubParent(prop1='a')), 'a')
+        self.assertEqual(str(StubChild(prop1='a', prop2='b')), '{"prop1": "a", "prop2": "b"}')
+        self.assertEqual(str(StubCustomChild(prop1='a', prop2='b')), 'custom')
+
 
 class TestUniqueEntityIdUnit(unittest.TestCase):
 
@@ -65,6 +111,10 @@ class TestUniqueEntityIdUnit(unittest.TestCase):
             self.assertEqual(
                 assert_error.exception.args[0], 'ID must be a valid UUID')
 
+    def test_throws_except_when_id_is_none(self):
+        with self.assertRaises(InvalidUuidException):
+            UniqueEntityId(None)
+
     def test_accept_uuid_passed_in_constructor(self):
         with patch.object(UniqueEntityId, '_UniqueEntityId__validate', autospec=True, side_effect=UniqueEntityId._UniqueEntityId__validate) as mock_validate:
             expected_uuid = '3aefc22e-8006-4024-a239-a27084c5133e'
@@ -84,8 +134,55 @@ class TestUniqueEntityIdUnit(unittest.TestCase):
     def test_generate_id_when_no_passed_id_in_constructor(self):
         with patch.object(UniqueEntityId, '_UniqueEntityId__validate', autospec=True, side_effect=UniqueEntityId._UniqueEntityId__validate) as mock_validate:
             value_object = UniqueEntityId()
-            self.assertTrue(uuid.UUID(value_object.id))
-            mock_validate.assert_called_once()
+            self.assertEqual(uuid.UUID(value_object.id).version, 4)
+            self.assertEqual(str(uuid.UUID(value_object.id)), value_object.id)
+            mock_validate.assert_not_called()
+
+    def test_uuid_object_is_not_revalidated(self):
+        with patch.object(UniqueEntityId, '_UniqueEntityId__validate', autospec=True, side_effect=UniqueEntityId._UniqueEntityId__validate) as mock_validate:
+            uuid_value = uuid.uuid4()
+            value_object = UniqueEntityId(uuid_value)
+            mock_validate.assert_not_called()
+        self.assertEqual(value_object.id, str(uuid_value))
+
+    def test_accept_non_canonical_uuid_strings(self):
+        for id_value in [
+            '3AEFC22E-8006-4024-A239-A27084C5133E',
+            '3aefc22e80064024a239a27084c5133e',
+            '{3aefc22e-8006-4024-a239-a27084c5133e}',
+            'urn:uuid:3aefc22e-8006-4024-a239-a27084c5133e',
+        ]:
+            self.assertEqual(UniqueEntityId(id_value).id, id_value)
+
+    def test_throws_except_when_id_is_not_a_string(self):
+        for id_value in [5, b'3aefc22e-8006-4024-a239-a27084c5133e', {}]:
+            with self.assertRaises(InvalidUuidException, msg=f"{id_value}"):
+                UniqueEntityId(id_value)
+
+    def test_generate_uuid4(self):
+        ids = {generate_uuid4() for _ in range(100)}
+        self.assertEqual(len(ids), 100)
+        for id_value in ids:
+            parsed = uuid.UUID(id_value)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+            self.assertEqual(str(parsed), id_value)
+
+    def test_generate_uuid7(self):
+        with patch('time.time_ns', return_value=1_700_000_000_123_456_789):
+            id_value = generate_uuid7()
+        parsed = uuid.UUID(id_value)
+        self.assertEqual(parsed.version, 7)
+        self.assertEqual(parsed.variant, uuid.RFC_4122)
+        self.assertEqual(parsed.int >> 80, 1_700_000_000_123)
+
+        with patch('time.time_ns', return_value=1_700_000_000_124_000_000):
+            self.assertGreater(generate_uuid7(), id_value)
+
+    def test_time_ordered(self):
+        value_object = UniqueEntityId.time_ordered()
+        self.assertIsInstance(value_object, UniqueEntityId)
+        self.assertEqual(uuid.UUID(value_object.id).version, 7)
 
     def test_is_imutable(self):
         with self.assertRaises(FrozenInstanceError):
@@ -95,3 +192,86 @@ class TestUniqueEntityIdUnit(unittest.TestCase):
     def test_if_return_string(self):
         value_object = UniqueEntityId()
         self.assertEqual(str(value_object), value_object.id)
+
+    def test_from_trusted_does_not_validate(self):
+        with patch.object(UniqueEntityId, '_UniqueEntityId__validate') as mock_validate:
+            value_object = UniqueEntityId.from_trusted('3aefc22e-8006-4024-a239-a27084c5133e')
+            mock_validate.assert_not_called()
+        self.assertEqual(value_object, UniqueEntityId('3aefc22e-8006-4024-a239-a27084c5133e'))
+
+
+class TestCompactUniqueEntityIdUnit(unittest.TestCase):
+
+    id_value = '3aefc22e-8006-4024-a239-a27084c5133e'
+
+    def test_if_is_a_dataclass(self):
+        self.assertTrue(is_dataclass(CompactUniqueEntityId))
+
+    def test_store_the_uuid_as_int(self):
+        value_object = CompactUniqueEntityId.from_id(self.id_value)
+        self.assertEqual(value_object.value, uuid.UUID(self.id_value).int)
+        self.assertEqual(value_object.id, self.id_value)
+        self.assertEqual(str(value_object), self.id_value)
+
+    def test_from_id_accepts_non_canonical_uuid_strings(self):
+        for id_value in [self.id_value.upper(), '{' + self.id_value + '}', self.id_value.replace('-', '')]:
+            self.assertEqual(CompactUniqueEntityId.from_id(id_value).id, self.id_value)
+
+    def test_throws_except_when_uuid_is_invalid(self):
+        for id_value in ['fake id', 5, None]:
+            with self.assertRaises(InvalidUuidException, msg=f"{id_value}"):
+                CompactUniqueEntityId.from_id(id_value)
+
+    def test_throws_except_when_value_is_not_a_128_bit_int(self):
+        for value in [-1, 1 << 128, 'abc', None, True, 1.0]:
+            with self.assertRaises(InvalidUuidException, msg=f"{value!r}"):
+                CompactUniqueEntityId(value)
+        self.assertEqual(CompactUniqueEntityId(0).id, '00000000-0000-0000-0000-000000000000')
+        self.assertEqual(CompactUniqueEntityId((1 << 128) - 1).id, 'ffffffff-ffff-ffff-ffff-ffffffffffff')
+
+    def test_from_trusted(self):
+        self.assertEqual(CompactUniqueEntityId.from_trusted(self.id_value).id, self.id_value)
+
+    def test_generate_uuid4_when_no_value_is_passed(self):
+        parsed = uuid.UUID(CompactUniqueEntityId().id)
+        self.assertEqual(parsed.version, 4)
+        self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+    def test_equality_and_hash_match_unique_entity_id(self):
+        unique_entity_id = UniqueEntityId(self.id_value)
+        value_object = unique_entity_id.compact()
+
+        self.assertIsInstance(value_object, CompactUniqueEntityId)
+        self.assertEqual(value_object, unique_entity_id)
+        self.assertEqual(unique_entity_id, value_object)
+        self.assertEqual(value_object, CompactUniqueEntityId.from_id(self.id_value))
+        self.assertEqual(hash(value_object), hash(unique_entity_id))
+        self.assertEqual({unique_entity_id: 'entity'}[value_object], 'entity')
+        self.assertNotEqual(value_object, CompactUniqueEntityId())
+        self.assertNotEqual(value_object, self.id_value)
+
+    def test_non_canonical_ids_are_not_compacted(self):
+        for id_value in [
+            self.id_value.upper(),
+            '{' + self.id_value + '}',
+            'urn:uuid:' + self.id_value,
+            self.id_value.replace('-', ''),
+        ]:
+            unique_entity_id = UniqueEntityId(id_value)
+            for value_object in [unique_entity_id.compact(), CompactUniqueEntityId.from_trusted(id_value)]:
+                self.assertIsInstance(value_object, UniqueEntityId, id_value)
+                self.assertEqual(str(value_object), id_value)
+                self.assertEqual(value_object, unique_entity_id)
+                self.assertEqual(hash(value_object), hash(unique_entity_id))
+        self.assertIsInstance(UniqueEntityId(self.id_value).compact(), CompactUniqueEntityId)
+
+    def test_expand(self):
+        value_object = CompactUniqueEntityId.from_id(self.id_value)
+        expanded = value_object.expand()
+        self.assertIsInstance(expanded, UniqueEntityId)
+        self.assertEqual(expanded.id, self.id_value)
+
+    def test_is_imutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            value_object = CompactUniqueEntityId()
+            value_object.value = 5
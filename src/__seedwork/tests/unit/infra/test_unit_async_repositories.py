@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.repositories import AsyncSearchableRepositoryInterface, ChangeSet
+from __seedwork.infra.async_repositories import ThreadOffloadedRepository
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+
+class TestThreadOffloadedRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repository = MagicMock()
+        self.repository.sortable_fields = ['name']
+
+    def test_is_an_async_searchable_repository(self):
+        repo = ThreadOffloadedRepository(self.repository)
+        self.assertIsInstance(repo, AsyncSearchableRepositoryInterface)
+        self.assertEqual(repo.sortable_fields, ['name'])
+
+    def test_delegates_calls_to_the_wrapped_repository(self):
+        repo = ThreadOffloadedRepository(self.repository)
+        entity = StubEntity(name='some')
+        self.repository.find_by_id.return_value = entity
+        self.repository.search.return_value = 'result'
+
+        async def scenario():
+            await repo.insert(entity)
+            await repo.bulk_insert([entity])
+            await repo.update(entity)
+            await repo.delete(entity.id)
+            await repo.save_changes(ChangeSet(inserted=[entity]))
+            return await repo.find_by_id(entity.id), await repo.search('params')
+
+        self.assertEqual(asyncio.run(scenario()), (entity, 'result'))
+        self.repository.insert.assert_called_once_with(entity)
+        self.repository.bulk_insert.assert_called_once_with([entity])
+        self.repository.update.assert_called_once_with(entity)
+        self.repository.delete.assert_called_once_with(entity.id)
+        self.repository.search.assert_called_once_with('params')
+        self.repository.save_changes.assert_called_once_with(ChangeSet(inserted=[entity]))
+
+    def test_runs_calls_outside_the_event_loop_thread(self):
+        self.repository.find_all.side_effect = threading.get_ident
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            repo = ThreadOffloadedRepository(self.repository, executor=executor)
+
+            async def scenario():
+                return threading.get_ident(), await repo.find_all()
+
+            loop_thread, call_thread = asyncio.run(scenario())
+        self.assertNotEqual(loop_thread, call_thread)
+
+    def test_serializes_calls_when_repository_is_not_thread_safe(self):
+        running = 0
+        max_running = 0
+        counter_lock = threading.Lock()
+        barrier = threading.Event()
+
+        def find_all():
+            nonlocal running, max_running
+            with counter_lock:
+                running += 1
+                max_running = max(max_running, running)
+            barrier.wait(0.01)
+            with counter_lock:
+                running -= 1
+            return []
+
+        self.repository.find_all.side_effect = find_all
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            repo = ThreadOffloadedRepository(
+                self.repository, executor=executor, thread_safe=False)
+
+            async def scenario():
+                await asyncio.gather(*(repo.find_all() for _ in range(8)))
+
+            asyncio.run(scenario())
+        self.assertEqual(max_running, 1)
+
+    def test_propagates_exceptions(self):
+        self.repository.find_by_id.side_effect = KeyError('missing')
+        repo = ThreadOffloadedRepository(self.repository)
+        with self.assertRaises(KeyError):
+            asyncio.run(repo.find_by_id('id'))
@@ -0,0 +1,242 @@
+import asyncio
+import threading
+import unittest
+
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import ChangeSet, InMemoryRepository, SearchableRepositoryInterface
+from __seedwork.infra.cached_repositories import CachedRepository, CacheStats, LruCache
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: float
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    search = None
+    sortable_fields = []
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheStats(unittest.TestCase):
+
+    def test_hit_ratio(self):
+        self.assertEqual(CacheStats().hit_ratio, 0.0)
+        self.assertEqual(CacheStats(hits=3, misses=1).hit_ratio, 0.75)
+
+
+class TestLruCache(unittest.TestCase):
+
+    def test_get_and_put(self):
+        cache = LruCache()
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_evicts_least_recently_used(self):
+        cache = LruCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_expires_entries_after_ttl(self):
+        clock = FakeClock()
+        cache = LruCache(ttl=10, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 10
+        self.assertEqual(cache.get('a'), 1)
+        clock.now = 10.5
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_pop_and_clear(self):
+        cache = LruCache()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.pop('a')
+        cache.pop('missing')
+        self.assertIsNone(cache.get('a'))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestCachedRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.inner = StubInMemoryRepository()
+        self.repo = CachedRepository(self.inner)
+        self.entity = StubEntity(name='some', price=5)
+        self.repo.insert(self.entity)
+
+    def test_is_a_searchable_repository(self):
+        self.assertIsInstance(self.repo, SearchableRepositoryInterface)
+
+    def test_find_by_id_reads_through_the_cache(self):
+        inner = MagicMock(wraps=self.inner)
+        repo = CachedRepository(inner)
+
+        first = repo.find_by_id(self.entity.id)
+        second = repo.find_by_id(self.entity.unique_entity_id)
+
+        inner.find_by_id.assert_called_once_with(self.entity.id)
+        self.assertEqual(first, self.entity)
+        self.assertEqual(second, self.entity)
+        self.assertEqual(repo.stats, CacheStats(hits=1, misses=1))
+
+    def test_hits_return_independent_copies(self):
+        self.repo.find_by_id(self.entity.id)
+        cached = self.repo.find_by_id(self.entity.id)
+        cached._set('name', 'changed')  # pylint: disable=protected-access
+
+        self.assertEqual(self.repo.find_by_id(self.entity.id).name, 'some')
+
+    def test_misses_return_a_copy_of_the_stored_entity(self):
+        found = self.repo.find_by_id(self.entity.id)
+        self.assertIsNot(found, self.inner.find_by_id(self.entity.id))
+        found._set('name', 'changed')  # pylint: disable=protected-access
+
+        self.assertEqual(self.inner.find_by_id(self.entity.id).name, 'some')
+
+    def test_does_not_cache_missing_entities(self):
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                self.repo.find_by_id('fake id')
+        self.assertEqual(self.repo.stats.misses, 2)
+        self.assertEqual(len(self.repo.cache), 0)
+
+    def test_update_invalidates_the_cached_entry(self):
+        self.repo.find_by_id(self.entity.id)
+        updated = StubEntity(unique_entity_id=self.entity.unique_entity_id, name='other', price=1)
+
+        self.repo.update(updated)
+
+        self.assertEqual(self.repo.find_by_id(self.entity.id), updated)
+        self.assertEqual(self.repo.stats.misses, 2)
+
+    def test_delete_invalidates_the_cached_entry(self):
+        self.repo.find_by_id(self.entity.id)
+
+        self.repo.delete(self.entity.unique_entity_id)
+
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(self.entity.id)
+
+    def test_identity_map_returns_the_same_instance(self):
+        with self.repo.identity_map():
+            first = self.repo.find_by_id(self.entity.id)
+            self.assertIs(self.repo.find_by_id(self.entity.id), first)
+            with self.repo.identity_map():
+                self.assertIs(self.repo.find_by_id(self.entity.id), first)
+        self.assertIsNot(self.repo.find_by_id(self.entity.id), first)
+        self.assertEqual(self.repo.stats.identity_hits, 2)
+
+    def test_identity_map_tracks_writes(self):
+        other = StubEntity(name='other', price=1)
+        with self.repo.identity_map() as entities:
+            self.repo.insert(other)
+            self.assertIs(self.repo.find_by_id(other.id), other)
+            self.repo.delete(other.id)
+            self.assertNotIn(other.id, entities)
+
+    def test_identity_map_tracks_bulk_inserts(self):
+        others = [StubEntity(name='first', price=1), StubEntity(name='second', price=2)]
+        with self.repo.identity_map() as entities:
+            self.repo.bulk_insert(others)
+            self.assertEqual(set(entities), {other.id for other in others})
+            for other in others:
+                self.assertIs(self.repo.find_by_id(other.id), other)
+
+    def test_identity_map_is_per_repository(self):
+        other_repo = CachedRepository(self.repo.repository)
+        with self.repo.identity_map() as entities:
+            first = self.repo.find_by_id(self.entity.id)
+            with other_repo.identity_map() as other_entities:
+                self.assertIsNot(other_repo.find_by_id(self.entity.id), first)
+                self.assertIs(self.repo.find_by_id(self.entity.id), first)
+            self.assertIsNot(entities, other_entities)
+            self.assertIsNot(other_repo.find_by_id(self.entity.id), first)
+
+    def test_save_changes_invalidates_written_entries(self):
+        removed = StubEntity(name='removed', price=1)
+        self.repo.insert(removed)
+        self.repo.find_by_id(self.entity.id)
+        self.repo.find_by_id(removed.id)
+        updated = StubEntity(unique_entity_id=self.entity.unique_entity_id, name='other', price=1)
+        new = StubEntity(name='new', price=1)
+
+        with self.repo.identity_map():
+            self.repo.save_changes(ChangeSet(
+                inserted=[new], updated=[(updated, frozenset({'name'}))], deleted=[removed.id]))
+            self.assertIs(self.repo.find_by_id(new.id), new)
+            self.assertIs(self.repo.find_by_id(updated.id), updated)
+
+        self.assertEqual(self.repo.find_by_id(self.entity.id), updated)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(removed.id)
+
+    def test_identity_map_is_per_thread(self):
+        seen = []
+
+        def lookup():
+            with self.repo.identity_map():
+                seen.append(self.repo.find_by_id(self.entity.id))
+
+        with self.repo.identity_map():
+            outer = self.repo.find_by_id(self.entity.id)
+            thread = threading.Thread(target=lookup)
+            thread.start()
+            thread.join()
+
+        self.assertIsNot(seen[0], outer)
+
+    def test_identity_map_is_per_task(self):
+        async def lookup():
+            with self.repo.identity_map():
+                first = self.repo.find_by_id(self.entity.id)
+                await asyncio.sleep(0)
+                self.assertIs(self.repo.find_by_id(self.entity.id), first)
+                return first
+
+        async def scenario():
+            return await asyncio.gather(lookup(), lookup())
+
+        first, second = asyncio.run(scenario())
+        self.assertIsNot(first, second)
+
+    def test_delegates_other_calls(self):
+        inner = MagicMock()
+        inner.sortable_fields = ['name']
+        repo = CachedRepository(inner)
+
+        repo.bulk_insert([self.entity])
+        repo.find_all()
+        repo.search('params')
+
+        self.assertEqual(repo.sortable_fields, ['name'])
+        inner.bulk_insert.assert_called_once_with([self.entity])
+        inner.find_all.assert_called_once_with()
+        inner.search.assert_called_once_with('params')
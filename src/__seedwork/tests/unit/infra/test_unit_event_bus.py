@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import unittest
+
+from dataclasses import dataclass
+
+from __seedwork.domain.events import DomainEvent
+from __seedwork.infra.event_bus import (
+    AsyncQueueEventBus,
+    EventBusStats,
+    HandlerRegistry,
+    SyncEventBus,
+    ThreadPoolEventBus
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StubCreated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StubDeleted(DomainEvent):
+    pass
+
+
+class Recorder:
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, events):
+        with self.lock:
+            self.batches.append(list(events))
+
+    @property
+    def events(self):
+        return [event for batch in self.batches for event in batch]
+
+
+def failing_handler(events):
+    raise RuntimeError('boom')
+
+
+def created(count: int, start: int = 0):
+    return [StubCreated(aggregate_id=str(position)) for position in range(start, start + count)]
+
+
+class TestHandlerRegistry(unittest.TestCase):
+
+    def test_handlers_for_includes_base_class_subscriptions(self):
+        registry = HandlerRegistry()
+        every, only_created = Recorder(), Recorder()
+        registry.subscribe(DomainEvent, every)
+        registry.subscribe(StubCreated, only_created)
+
+        self.assertEqual(registry.handlers_for(StubCreated), (every, only_created))
+        self.assertEqual(registry.handlers_for(StubDeleted), (every,))
+
+        later = Recorder()
+        registry.subscribe(StubDeleted, later)
+        self.assertEqual(registry.handlers_for(StubDeleted), (every, later))
+
+    def test_group_keeps_event_order_per_handler(self):
+        registry = HandlerRegistry()
+        every, only_created = Recorder(), Recorder()
+        registry.subscribe(DomainEvent, every)
+        registry.subscribe(StubCreated, only_created)
+        events = [StubCreated(aggregate_id='1'), StubDeleted(aggregate_id='2'),
+                  StubCreated(aggregate_id='3')]
+
+        self.assertEqual(registry.group(events), {
+            every: events,
+            only_created: [events[0], events[2]],
+        })
+        self.assertEqual(registry.group([StubDeleted(aggregate_id='1')]).keys(), {every})
+
+
+class TestSyncEventBus(unittest.TestCase):
+
+    def test_publish_runs_one_batch_per_handler(self):
+        bus = SyncEventBus()
+        recorder = Recorder()
+        bus.subscribe(StubCreated, recorder)
+        events = created(3)
+
+        bus.publish(iter(events))
+
+        self.assertEqual(recorder.batches, [events])
+        self.assertEqual(bus.stats, EventBusStats(published=3, delivered=3, batches=1))
+
+    def test_failing_handler_does_not_stop_the_others(self):
+        bus = SyncEventBus()
+        recorder = Recorder()
+        bus.subscribe(StubCreated, failing_handler)
+        bus.subscribe(StubCreated, recorder)
+
+        with self.assertLogs('__seedwork.infra.event_bus', 'ERROR'):
+            bus.publish(created(2))
+
+        self.assertEqual(len(recorder.events), 2)
+        self.assertEqual(bus.stats, EventBusStats(published=2, delivered=2, failed=2, batches=2))
+
+
+class TestThreadPoolEventBus(unittest.TestCase):
+
+    def test_delivers_every_event_in_batches(self):
+        recorder = Recorder()
+        with ThreadPoolEventBus(workers=2, batch_size=100) as bus:
+            bus.subscribe(DomainEvent, recorder)
+            bus.publish(created(1000))
+
+        self.assertEqual(
+            sorted(int(event.aggregate_id) for event in recorder.events), list(range(1000)))
+        self.assertTrue(all(len(batch) <= 100 for batch in recorder.batches))
+        self.assertEqual(bus.stats.published, 1000)
+        self.assertEqual(bus.stats.delivered, 1000)
+
+    def test_publish_blocks_when_the_queue_is_full(self):
+        release = threading.Event()
+        recorder = Recorder()
+
+        def slow_handler(events):
+            release.wait(5)
+            recorder(events)
+
+        bus = ThreadPoolEventBus(workers=1, batch_size=1, max_pending=2)
+        bus.subscribe(StubCreated, slow_handler)
+        publisher = threading.Thread(target=bus.publish, args=(created(10),))
+        publisher.start()
+        publisher.join(0.2)
+
+        self.assertTrue(publisher.is_alive())
+        release.set()
+        publisher.join(5)
+        bus.close()
+        self.assertEqual(len(recorder.events), 10)
+
+    def test_publish_after_close_raises(self):
+        recorder = Recorder()
+        bus = ThreadPoolEventBus(workers=1, max_pending=1)
+        bus.subscribe(StubCreated, recorder)
+        bus.publish(created(1))
+        bus.close()
+        bus.close()
+
+        with self.assertRaises(RuntimeError) as assert_error:
+            bus.publish(created(3))
+        self.assertEqual(assert_error.exception.args[0], 'event bus is closed')
+        self.assertEqual(len(recorder.events), 1)
+        self.assertEqual(bus.stats.published, 1)
+
+    def test_counts_failures(self):
+        with ThreadPoolEventBus(workers=1) as bus:
+            bus.subscribe(StubCreated, failing_handler)
+            with self.assertLogs('__seedwork.infra.event_bus', 'ERROR'):
+                bus.publish(created(5))
+                bus.close()
+        self.assertEqual(bus.stats.failed, 5)
+        self.assertEqual(bus.stats.delivered, 0)
+
+
+class TestAsyncQueueEventBus(unittest.TestCase):
+
+    def test_delivers_to_sync_and_coroutine_handlers(self):
+        recorder, async_events = Recorder(), []
+
+        async def async_handler(events):
+            await asyncio.sleep(0)
+            async_events.extend(events)
+
+        async def scenario():
+            async with AsyncQueueEventBus(workers=2, batch_size=10) as bus:
+                bus.subscribe(StubCreated, recorder)
+                bus.subscribe(DomainEvent, async_handler)
+                await bus.publish(created(50))
+                await bus.publish([StubDeleted(aggregate_id='x')])
+            return bus
+
+        bus = asyncio.run(scenario())
+        self.assertEqual(len(recorder.events), 50)
+        self.assertEqual(len(async_events), 51)
+        self.assertTrue(all(len(batch) <= 10 for batch in recorder.batches))
+        self.assertEqual(bus.stats.published, 51)
+        self.assertEqual(bus.stats.delivered, 101)
+
+    def test_publish_waits_when_the_queue_is_full(self):
+        async def scenario():
+            release = asyncio.Event()
+            received = []
+
+            async def slow_handler(events):
+                await release.wait()
+                received.extend(events)
+
+            bus = AsyncQueueEventBus(workers=1, batch_size=1, max_pending=2)
+            bus.subscribe(StubCreated, slow_handler)
+            publishing = asyncio.create_task(bus.publish(created(10)))
+            await asyncio.sleep(0.05)
+            blocked = not publishing.done()
+            release.set()
+            await publishing
+            await bus.close()
+            return blocked, received
+
+        blocked, received = asyncio.run(scenario())
+        self.assertTrue(blocked)
+        self.assertEqual(len(received), 10)
+
+    def test_counts_failures(self):
+        async def scenario():
+            async with AsyncQueueEventBus() as bus:
+                bus.subscribe(StubCreated, failing_handler)
+                await bus.publish(created(3))
+            return bus
+
+        with self.assertLogs('__seedwork.infra.event_bus', 'ERROR'):
+            bus = asyncio.run(scenario())
+        self.assertEqual(bus.stats.failed, 3)
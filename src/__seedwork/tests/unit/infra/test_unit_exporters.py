@@ -0,0 +1,87 @@
+import io
+import json
+import unittest
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.exporters import JsonArrayExporter, NdjsonExporter, json_default
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntity(Entity):
+    name: str
+    created_at: Optional[datetime] = None
+
+
+class TestJsonDefault(unittest.TestCase):
+
+    def test_serialize_dates_and_value_objects(self):
+        unique_entity_id = UniqueEntityId('3aefc22e-8006-4024-a239-a27084c5133e')
+        self.assertEqual(json_default(datetime(2023, 1, 2, 3, 4, 5)), '2023-01-02T03:04:05')
+        self.assertEqual(json_default(date(2023, 1, 2)), '2023-01-02')
+        self.assertEqual(json_default(unique_entity_id), '3aefc22e-8006-4024-a239-a27084c5133e')
+
+    def test_throw_type_error_for_unknown_types(self):
+        with self.assertRaises(TypeError) as assert_error:
+            json_default(object())
+        self.assertEqual(
+            assert_error.exception.args[0], 'Object of type object is not JSON serializable')
+
+
+class TestExporters(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.entities = [
+            StubEntity(name=f'entity {position}', created_at=datetime(2023, 1, 1, position))
+            for position in range(5)
+        ]
+        self.expected = [
+            {
+                'name': entity.name,
+                'created_at': entity.created_at.isoformat(),
+                'id': entity.id,
+            }
+            for entity in self.entities
+        ]
+
+    def test_ndjson_exporter(self):
+        output = io.StringIO()
+        total = NdjsonExporter(output, chunk_size=2).export(iter(self.entities))
+
+        self.assertEqual(total, 5)
+        lines = output.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.expected)
+        self.assertTrue(output.getvalue().endswith('\n'))
+
+    def test_json_array_exporter(self):
+        output = io.StringIO()
+        total = JsonArrayExporter(output, chunk_size=2).export(iter(self.entities))
+
+        self.assertEqual(total, 5)
+        self.assertEqual(json.loads(output.getvalue()), self.expected)
+
+    def test_export_without_entities(self):
+        output = io.StringIO()
+        self.assertEqual(NdjsonExporter(output).export([]), 0)
+        self.assertEqual(output.getvalue(), '')
+
+        output = io.StringIO()
+        self.assertEqual(JsonArrayExporter(output).export([]), 0)
+        self.assertEqual(json.loads(output.getvalue()), [])
+
+    def test_write_one_chunk_at_a_time(self):
+        output = io.StringIO()
+        exporter = NdjsonExporter(output, chunk_size=2)
+
+        def entities():
+            for position, entity in enumerate(self.entities):
+                if position == 4:
+                    self.assertEqual(len(output.getvalue().splitlines()), 4)
+                yield entity
+
+        exporter.export(entities())
+        self.assertEqual(len(output.getvalue().splitlines()), 5)
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+from __seedwork.infra.file_store import LOG_NAME, SNAPSHOT_NAME, FileStore
+
+
+def row(entity_id: str, name: str = 'Movie'):
+    return {'id': entity_id, 'name': name}
+
+
+class TestFileStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = FileStore(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.directory.cleanup()
+
+    def reopen(self, **kwargs) -> FileStore:
+        self.store.close()
+        self.store = FileStore(self.directory.name, **kwargs)
+        return self.store
+
+    def test_empty_store(self):
+        self.assertEqual(self.store.rows(), [])
+        self.assertIsNone(self.store.get('1'))
+        self.store.compact()
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, SNAPSHOT_NAME)))
+
+    def test_put_get_and_delete(self):
+        self.store.put_many([row('1'), row('2', 'Série')])
+        self.store.put(row('1', 'Documentary'))
+        self.store.delete('2')
+
+        self.assertEqual(self.store.get('1'), row('1', 'Documentary'))
+        self.assertIsNone(self.store.get('2'))
+        self.assertEqual(self.store.rows(), [row('1', 'Documentary')])
+        self.assertEqual(self.store.log_records, 4)
+
+    def test_replay_log_on_open(self):
+        self.store.put_many([row('1'), row('2', 'Série')])
+        self.store.delete('1')
+
+        store = self.reopen()
+        self.assertEqual(store.rows(), [row('2', 'Série')])
+        self.assertEqual(store.get('2'), row('2', 'Série'))
+        self.assertEqual(store.log_records, 3)
+
+    def test_cut_off_torn_record(self):
+        self.store.put_many([row('1'), row('2')])
+        log_path = os.path.join(self.directory.name, LOG_NAME)
+        size = os.path.getsize(log_path)
+        self.store.close()
+        with open(log_path, 'r+b') as file:
+            file.truncate(size - 3)
+
+        store = self.reopen()
+        self.assertEqual(store.rows(), [row('1')])
+        self.assertEqual(store.log_records, 1)
+
+        store.put(row('3'))
+        self.assertEqual(self.reopen().rows(), [row('1'), row('3')])
+
+    def test_cut_off_corrupted_record(self):
+        self.store.put_many([row('1'), row('2')])
+        log_path = os.path.join(self.directory.name, LOG_NAME)
+        self.store.close()
+        with open(log_path, 'r+b') as file:
+            file.seek(-2, os.SEEK_END)
+            file.write(b'XX')
+
+        self.assertEqual(self.reopen().rows(), [row('1')])
+
+    def test_compact(self):
+        self.store.put_many([row(str(number), f'category {number}') for number in range(20)])
+        self.store.compact()
+        self.store.put(row('3', 'changed'))
+        self.store.delete('4')
+        self.store.put(row('long-id-20'))
+
+        store = self.reopen()
+        self.assertEqual(store.log_records, 3)
+        self.assertEqual(store.get('0'), row('0', 'category 0'))
+        self.assertEqual(store.get('19'), row('19', 'category 19'))
+        self.assertEqual(store.get('3'), row('3', 'changed'))
+        self.assertIsNone(store.get('4'))
+        self.assertIsNone(store.get('20'))
+        self.assertIsNone(store.get('a-very-long-missing-id'))
+
+        store.compact()
+        self.assertEqual(store.log_records, 0)
+        self.assertEqual(os.path.getsize(os.path.join(self.directory.name, LOG_NAME)), 0)
+        expected = {str(number): f'category {number}' for number in range(20) if number != 4}
+        expected.update({'3': 'changed', 'long-id-20': 'Movie'})
+        for reopen in [False, True]:
+            if reopen:
+                store = self.reopen()
+            self.assertEqual({item['id']: item['name'] for item in store.rows()}, expected)
+            self.assertEqual(store.get('long-id-20'), row('long-id-20'))
+            self.assertEqual(store.get('3'), row('3', 'changed'))
+            self.assertIsNone(store.get('4'))
+
+    def test_compact_after(self):
+        store = self.reopen(compact_after=3)
+        store.put_many([row('1'), row('2')])
+        self.assertEqual(store.log_records, 2)
+        store.delete('1')
+        self.assertEqual(store.log_records, 0)
+        self.assertEqual(store.rows(), [row('2')])
+
+    def test_reject_unknown_snapshot(self):
+        self.store.close()
+        with open(os.path.join(self.directory.name, SNAPSHOT_NAME), 'wb') as file:
+            file.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            FileStore(self.directory.name)
@@ -0,0 +1,203 @@
+import io
+import unittest
+
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.repositories import InMemoryRepository
+from __seedwork.domain.validators import ValidatorSchema
+from __seedwork.infra.importers import (
+    EntityImporter,
+    ImportReport,
+    ParallelValidator,
+    RejectedRow,
+    UnreadableRow,
+    ValidationReport,
+    chunked,
+    read_csv,
+    read_ndjson,
+    to_columns,
+    validate_chunk
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[str] = None
+
+    validator_schema: ClassVar[ValidatorSchema] = ValidatorSchema({
+        'name': ('required', 'string', ('max_length', 5)),
+        'price': ('string',),
+    })
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    pass
+
+
+class StubImporter(EntityImporter):
+    entity_class = StubEntity
+
+
+class TestReaders(unittest.TestCase):
+
+    def test_read_csv(self):
+        source = io.StringIO('name,price\nfirst,10\nsecond,\n')
+        self.assertEqual(list(read_csv(source)), [
+            {'name': 'first', 'price': '10'},
+            {'name': 'second', 'price': ''},
+        ])
+
+    def test_read_ndjson_skips_blank_lines(self):
+        source = io.StringIO('{"name": "first"}\n\n{"name": "second", "price": null}\n')
+        self.assertEqual(list(read_ndjson(source)), [
+            {'name': 'first'},
+            {'name': 'second', 'price': None},
+        ])
+
+    def test_read_ndjson_marks_unreadable_lines(self):
+        source = io.StringIO('{"name": "first"}\n{"name": \n\n[1, 2]\n{"name": "last"}\n')
+        rows = list(read_ndjson(source))
+        self.assertEqual(rows[0], {'name': 'first'})
+        self.assertIsInstance(rows[1], UnreadableRow)
+        self.assertEqual((rows[1].line, rows[1].text), (2, '{"name": '))
+        self.assertTrue(rows[1].error.startswith('Line 2 is not valid JSON: '))
+        self.assertEqual(rows[2], UnreadableRow(4, '[1, 2]', 'Line 4 is not a JSON object'))
+        self.assertEqual(rows[3], {'name': 'last'})
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked(iter(range(5)), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 2)), [])
+
+
+class TestImportReport(unittest.TestCase):
+
+    def test_total(self):
+        report = ImportReport(imported=2, rejected=[RejectedRow(0, {}, {})])
+        self.assertEqual(report.total, 3)
+
+
+class TestValidateChunk(unittest.TestCase):
+
+    def test_return_only_errors(self):
+        errors = validate_chunk(StubEntity, [
+            {'name': 'first'},
+            {'price': 10},
+            {'name': 'too long'},
+        ])
+        self.assertEqual(errors, {
+            1: {'name': ['The name is required'], 'price': ['The price must be a string']},
+            2: {'name': ['The name must be less than 5']},
+        })
+
+
+class TestParallelValidator(unittest.TestCase):
+
+    rows = [
+        {'name': 'too long', 'price': 1},
+        {'name': 'a'},
+        {'price': '1'},
+        {'name': 'b', 'price': '2'},
+        {'name': 'c', 'price': 3},
+    ]
+    expected_errors = {
+        0: {'name': ['The name must be less than 5'], 'price': ['The price must be a string']},
+        2: {'name': ['The name is required']},
+        4: {'price': ['The price must be a string']},
+    }
+
+    def test_to_columns(self):
+        self.assertEqual(to_columns(self.rows[:2], ['name', 'price']), {
+            'name': ['too long', 'a'],
+            'price': [1, None],
+        })
+
+    def test_chunk_errors_are_ordered_by_row(self):
+        errors = validate_chunk(StubEntity, [{'name': 'a', 'price': 1}, {}])
+        self.assertEqual(list(errors), [0, 1])
+
+    def test_validate_in_process(self):
+        report = ParallelValidator(StubEntity, chunk_size=2).validate(iter(self.rows))
+        self.assertEqual(report, ValidationReport(5, self.expected_errors))
+        self.assertEqual(list(report.errors), [0, 2, 4])
+        self.assertFalse(report.is_valid)
+        self.assertTrue(ParallelValidator(StubEntity).validate([]).is_valid)
+
+    def test_validate_with_process_pool(self):
+        validator = ParallelValidator(StubEntity, workers=2, chunk_size=1)
+        report = validator.validate(self.rows)
+        self.assertEqual(report, ValidationReport(5, self.expected_errors))
+        self.assertEqual(list(report.errors), [0, 2, 4])
+
+        chunks = list(validator.validate_chunks(chunked(self.rows, 2)))
+        self.assertEqual([(start, len(chunk)) for start, chunk, _ in chunks], [(0, 2), (2, 2), (4, 1)])
+        self.assertEqual(chunks[1][2], {0: {'name': ['The name is required']}})
+
+
+class TestEntityImporter(unittest.TestCase):
+
+    rows = [
+        {'name': 'a', 'price': '1'},
+        {'name': '', 'price': '2'},
+        {'name': 'b'},
+        {'name': 'c', 'price': 3},
+        {'name': 'd'},
+    ]
+
+    def assert_import(self, importer: StubImporter, repository: StubInMemoryRepository):
+        report = importer.import_rows(iter(self.rows))
+
+        self.assertEqual(report.imported, 3)
+        self.assertEqual(report.rejected, [
+            RejectedRow(1, {'name': '', 'price': '2'}, {'name': ['The name is required']}),
+            RejectedRow(3, {'name': 'c', 'price': 3}, {'price': ['The price must be a string']}),
+        ])
+        self.assertEqual(
+            [(entity.name, entity.price) for entity in repository.find_all()],
+            [('a', '1'), ('b', None), ('d', None)]
+        )
+
+    def test_import_in_process(self):
+        repository = StubInMemoryRepository()
+        self.assert_import(StubImporter(repository, chunk_size=2), repository)
+
+    def test_import_with_process_pool(self):
+        repository = StubInMemoryRepository()
+        self.assert_import(StubImporter(repository, chunk_size=1, workers=2), repository)
+
+    def test_reject_unreadable_lines_and_go_on(self):
+        source = io.StringIO(
+            '{"name": "a"}\n'
+            '{"name": ""}\n'
+            '{"name": "b"}\n'
+            'not json\n'
+            '"c"\n'
+            '{"name": "d"}\n'
+            '{"name": "e"\n'
+        )
+        for workers in [None, 2]:
+            repository = StubInMemoryRepository()
+            report = StubImporter(repository, chunk_size=2, workers=workers).import_rows(
+                read_ndjson(source))
+            source.seek(0)
+
+            self.assertEqual(report.imported, 3)
+            self.assertEqual(report.total, 7)
+            self.assertEqual(
+                [(rejected.row, list(rejected.errors)) for rejected in report.rejected],
+                [(1, ['name']), (3, ['line']), (4, ['line']), (6, ['line'])]
+            )
+            self.assertEqual(report.rejected[1].data, {'line': 'not json'})
+            self.assertEqual(report.rejected[2].errors, {'line': ['Line 5 is not a JSON object']})
+            self.assertEqual(sorted(entity.name for entity in repository.find_all()), ['a', 'b', 'd'])
+
+    def test_parse_row_hook(self):
+        class UpperImporter(StubImporter):
+            def parse_row(self, row):
+                return {**row, 'name': row['name'].upper()}
+
+        repository = StubInMemoryRepository()
+        UpperImporter(repository).import_rows([{'name': 'a'}])
+        self.assertEqual(repository.find_all()[0].name, 'A')
@@ -0,0 +1,163 @@
+import io
+import itertools
+import unittest
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Optional
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.validators import CharField, NativeValidator, ValidatorRules, ValidatorSchema
+from __seedwork.infra.instrumentation import (
+    Histogram,
+    InMemorySink,
+    Instrumentation,
+    PrometheusTextExporter,
+    render_prometheus
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    is_active: Optional[bool] = True
+
+    validator_schema: ClassVar[ValidatorSchema] = ValidatorSchema({
+        'name': ('required', 'string', ('max_length', 255)),
+        'is_active': ('boolean',),
+    })
+
+    validate = staticmethod(validator_schema.compile())
+
+    def __new__(cls, **kwargs):
+        cls.validate(name=kwargs.get('name'), is_active=kwargs.get('is_active'))
+        return super(StubEntity, cls).__new__(cls)
+
+
+class StubValidator(NativeValidator[Dict[str, Any]]):
+    fields = {'name': CharField(max_length=255)}
+
+
+def fake_clock():
+    """Advances one microsecond per call, so every timed call lasts 1 µs."""
+    ticks = itertools.count()
+    return lambda: next(ticks) * 1e-6
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_observe(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in [0.05, 0.1, 0.5, 3.0]:
+            histogram.observe(value)
+
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.total, 3.65)
+        self.assertEqual(histogram.cumulative(), [(0.1, 2), (1.0, 3), (float('inf'), 4)])
+
+
+class TestInMemorySink(unittest.TestCase):
+
+    def test_counters_and_histograms(self):
+        sink = InMemorySink(buckets=(0.5,))
+        labels = (('entity', 'Category'),)
+        sink.increment('created_total', labels)
+        sink.increment('created_total', labels, 2)
+        sink.observe('init_seconds', labels, 0.25)
+
+        self.assertEqual(sink.counter('created_total', entity='Category'), 3)
+        self.assertEqual(sink.counter('created_total', entity='Genre'), 0)
+        self.assertEqual(sink.histogram('init_seconds', entity='Category').counts, [1, 0])
+        self.assertIsNone(sink.histogram('init_seconds'))
+
+        sink.clear()
+        self.assertEqual((sink.counters, sink.histograms), ({}, {}))
+
+    def test_render_prometheus(self):
+        sink = InMemorySink(buckets=(0.5,))
+        sink.increment('invalid_total', (('validator', 'CategoryValidator'),))
+        sink.observe('init_seconds', (('entity', 'Category'),), 0.25)
+        sink.observe('init_seconds', (('entity', 'Category'),), 2.0)
+
+        self.assertEqual(render_prometheus(sink), (
+            '# TYPE invalid_total counter\n'
+            'invalid_total{validator="CategoryValidator"} 1\n'
+            '# TYPE init_seconds histogram\n'
+            'init_seconds_bucket{entity="Category",le="0.5"} 1\n'
+            'init_seconds_bucket{entity="Category",le="+Inf"} 2\n'
+            'init_seconds_sum{entity="Category"} 2.25\n'
+            'init_seconds_count{entity="Category"} 2\n'
+        ))
+        self.assertEqual(render_prometheus(InMemorySink()), '')
+
+        output = io.StringIO()
+        PrometheusTextExporter(output).export(sink)
+        self.assertEqual(output.getvalue(), render_prometheus(sink))
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.sink = InMemorySink()
+        self.instrumentation = Instrumentation(self.sink, clock=fake_clock())
+
+    def tearDown(self) -> None:
+        self.instrumentation.uninstrument()
+
+    def test_instrument_entity(self):
+        original_init, original_validate = StubEntity.__init__, StubEntity.__dict__['validate']
+        self.instrumentation.instrument_entity(StubEntity)
+
+        StubEntity(name='Movie')
+        with self.assertRaises(ValidationException) as assert_error:
+            StubEntity(name='t' * 256)
+        self.assertEqual(assert_error.exception.args[0], 'The name must be less than 255')
+
+        self.assertEqual(self.sink.histogram(
+            'seedwork_entity_init_seconds', entity='StubEntity').count, 1)
+        self.assertEqual(self.sink.histogram(
+            'seedwork_entity_validate_seconds', entity='StubEntity').count, 2)
+        self.assertEqual(self.sink.histogram(
+            'seedwork_rule_seconds', owner='StubEntity', prop='name', rule='max_length').count, 2)
+        self.assertEqual(self.sink.histogram(
+            'seedwork_rule_seconds', owner='StubEntity', prop='is_active', rule='boolean').count, 1)
+        self.assertEqual(self.sink.counter(
+            'seedwork_rule_failures_total', owner='StubEntity', prop='name', rule='max_length'), 1)
+        self.assertAlmostEqual(self.sink.histogram(
+            'seedwork_entity_init_seconds', entity='StubEntity').total, 1e-6)
+
+        self.instrumentation.uninstrument()
+        self.assertIs(StubEntity.__init__, original_init)
+        self.assertIs(StubEntity.__dict__['validate'], original_validate)
+
+    def test_instrument_validator(self):
+        with Instrumentation(self.sink, clock=fake_clock()) as instrumentation:
+            instrumentation.instrument_validator(StubValidator)
+            self.assertTrue(StubValidator().validate({'name': 'Movie'}))
+            self.assertFalse(StubValidator().validate({'name': ''}))
+
+        self.assertNotIn('validate', StubValidator.__dict__)
+        self.assertEqual(self.sink.histogram(
+            'seedwork_validator_seconds', validator='StubValidator').count, 2)
+        self.assertEqual(self.sink.counter(
+            'seedwork_validator_invalid_total', validator='StubValidator'), 1)
+
+    def test_instrument_rules(self):
+        original_required = ValidatorRules.required
+        self.instrumentation.instrument_rules()
+
+        ValidatorRules.values('Movie', 'name').required().string().max_length(5)
+        with self.assertRaises(ValidationException):
+            ValidatorRules.values(None, 'name').required()
+
+        labels = {'owner': 'ValidatorRules', 'prop': 'name'}
+        self.assertEqual(self.sink.histogram(
+            'seedwork_rule_seconds', rule='required', **labels).count, 2)
+        self.assertEqual(self.sink.histogram(
+            'seedwork_rule_seconds', rule='max_length', **labels).count, 1)
+        self.assertEqual(self.sink.counter(
+            'seedwork_rule_failures_total', rule='required', **labels), 1)
+
+        self.instrumentation.uninstrument()
+        self.assertIs(ValidatorRules.required, original_required)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+
+class TestSqliteConnectionPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.pool = SqliteConnectionPool(os.path.join(self.directory.name, 'db.sqlite3'), size=2)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+        self.directory.cleanup()
+
+    def test_apply_pragmas_to_every_connection(self):
+        connections = []
+        with self.pool.connection() as first, self.pool.connection() as second:
+            connections = [first, second]
+        self.assertIsNot(connections[0], connections[1])
+        for connection in connections:
+            self.assertEqual(connection.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            self.assertEqual(connection.execute('PRAGMA synchronous').fetchone()[0], 1)
+
+    def test_reuse_returned_connections(self):
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            self.assertIs(first, second)
+
+    def test_transaction_commits_or_rolls_back(self):
+        with self.pool.transaction() as connection:
+            connection.execute('CREATE TABLE stub (value INTEGER)')
+            connection.execute('INSERT INTO stub VALUES (1)')
+
+        with self.assertRaises(RuntimeError):
+            with self.pool.transaction() as connection:
+                connection.execute('INSERT INTO stub VALUES (2)')
+                raise RuntimeError()
+
+        with self.pool.connection() as connection:
+            self.assertEqual(connection.execute('SELECT value FROM stub').fetchall(), [(1,)])
+
+    def test_share_connections_between_threads(self):
+        with self.pool.transaction() as connection:
+            connection.execute('CREATE TABLE stub (value INTEGER)')
+
+        def insert(value):
+            with self.pool.transaction() as connection:
+                connection.execute('INSERT INTO stub VALUES (?)', (value,))
+
+        threads = [threading.Thread(target=insert, args=(value,)) for value in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.pool.connection() as connection:
+            self.assertEqual(connection.execute('SELECT COUNT(*) FROM stub').fetchone()[0], 8)
+
+    def test_shared_in_memory_database(self):
+        pool = SqliteConnectionPool('file:test_shared?mode=memory&cache=shared', size=2,
+                                    pragmas={})
+        with pool.transaction() as connection:
+            connection.execute('CREATE TABLE stub (value INTEGER)')
+        with pool.connection() as first, pool.connection() as second:
+            self.assertIsNot(first, second)
+            second.execute('SELECT * FROM stub')
+        pool.close()
@@ -0,0 +1,237 @@
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from __seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
+from __seedwork.application.use_cases import AsyncUseCase, UseCase
+from __seedwork.domain.events import AsyncEventBusInterface, EventBusInterface
+
+from category.application.dto import CategoryOutput, CategoryOutputMapper
+from category.domain.entities import Category
+from category.domain.events import CategoriesBulkUpdated
+from category.domain.repositories import AsyncCategoryRepository, CategoryRepository
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoryInput:
+    name: str
+    description: Optional[str] = None
+    is_active: Optional[bool] = True
+
+
+@dataclass(slots=True, frozen=True)
+class GetCategoryInput:
+    id: str
+
+
+@dataclass(slots=True, frozen=True)
+class UpdateCategoryInput:
+    id: str
+    name: str
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DeleteCategoryInput:
+    id: str
+
+
+@dataclass(slots=True, frozen=True)
+class BulkUpdateCategoriesInput:
+    """Props to set on every category in ``ids`` and/or matching ``filter`` (all when both are ``None``)."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    ids: Optional[List[str]] = None
+    filter: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class BulkUpdateCategoriesOutput:
+    updated: int
+
+
+class ListCategoriesInput(SearchInput[str]):  # pylint: disable=too-few-public-methods
+    pass
+
+
+ListCategoriesOutput = PaginationOutput[CategoryOutput]
+
+
+def _create(input_param: CreateCategoryInput) -> Category:
+    return Category.create(
+        name=input_param.name,
+        description=input_param.description,
+        is_active=input_param.is_active,
+    )
+
+
+def _update(category: Category, input_param: UpdateCategoryInput) -> Category:
+    category.update(input_param.name, input_param.description)
+    if input_param.is_active is True:
+        category.activate()
+    elif input_param.is_active is False:
+        category.deactivate()
+    return category
+
+
+def _publish_events(category: Category, event_bus: Optional[EventBusInterface]) -> None:
+    events = category.pull_events()
+    if event_bus is not None and events:
+        event_bus.publish(events)
+
+
+async def _publish_events_async(
+    category: Category, event_bus: Optional[AsyncEventBusInterface]
+) -> None:
+    events = category.pull_events()
+    if event_bus is not None and events:
+        await event_bus.publish(events)
+
+
+def _bulk_updated(input_param: BulkUpdateCategoriesInput, updated: int) -> CategoriesBulkUpdated:
+    return CategoriesBulkUpdated(
+        values=dict(input_param.values),
+        ids=None if input_param.ids is None else tuple(input_param.ids),
+        filter=input_param.filter,
+        updated=updated,
+    )
+
+
+def _search_params(input_param: ListCategoriesInput) -> CategoryRepository.SearchParams:
+    return CategoryRepository.SearchParams(**{
+        name: value for name, value in asdict(input_param).items() if value is not None
+    })
+
+
+def _list_output(result: CategoryRepository.SearchResult) -> ListCategoriesOutput:
+    items = [CategoryOutputMapper.to_output(category) for category in result.items]
+    return PaginationOutputMapper.to_output(items, result)
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoryUseCase(UseCase[CreateCategoryInput, CategoryOutput]):
+    category_repo: CategoryRepository
+    event_bus: Optional[EventBusInterface] = None
+
+    def execute(self, input_param: CreateCategoryInput) -> CategoryOutput:
+        category = _create(input_param)
+        self.category_repo.insert(category)
+        _publish_events(category, self.event_bus)
+        return CategoryOutputMapper.to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class GetCategoryUseCase(UseCase[GetCategoryInput, CategoryOutput]):
+    category_repo: CategoryRepository
+
+    def execute(self, input_param: GetCategoryInput) -> CategoryOutput:
+        category = self.category_repo.find_by_id(input_param.id)
+        return CategoryOutputMapper.to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class ListCategoriesUseCase(UseCase[ListCategoriesInput, ListCategoriesOutput]):
+    category_repo: CategoryRepository
+
+    def execute(self, input_param: ListCategoriesInput) -> ListCategoriesOutput:
+        result = self.category_repo.search(_search_params(input_param))
+        return _list_output(result)
+
+
+@dataclass(slots=True, frozen=True)
+class UpdateCategoryUseCase(UseCase[UpdateCategoryInput, CategoryOutput]):
+    category_repo: CategoryRepository
+    event_bus: Optional[EventBusInterface] = None
+
+    def execute(self, input_param: UpdateCategoryInput) -> CategoryOutput:
+        category = _update(self.category_repo.find_by_id(input_param.id), input_param)
+        self.category_repo.update(category)
+        _publish_events(category, self.event_bus)
+        return CategoryOutputMapper.to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class DeleteCategoryUseCase(UseCase[DeleteCategoryInput, None]):
+    category_repo: CategoryRepository
+
+    def execute(self, input_param: DeleteCategoryInput) -> None:
+        self.category_repo.delete(input_param.id)
+
+
+@dataclass(slots=True, frozen=True)
+class BulkUpdateCategoriesUseCase(UseCase[BulkUpdateCategoriesInput, BulkUpdateCategoriesOutput]):
+    """Publishes one ``CategoriesBulkUpdated`` instead of an event per category."""
+    category_repo: CategoryRepository
+    event_bus: Optional[EventBusInterface] = None
+
+    def execute(self, input_param: BulkUpdateCategoriesInput) -> BulkUpdateCategoriesOutput:
+        updated = self.category_repo.update_many(
+            input_param.values, input_param.ids, input_param.filter)
+        if self.event_bus is not None and updated:
+            self.event_bus.publish([_bulk_updated(input_param, updated)])
+        return BulkUpdateCategoriesOutput(updated)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncCreateCategoryUseCase(AsyncUseCase[CreateCategoryInput, CategoryOutput]):
+    category_repo: AsyncCategoryRepository
+    event_bus: Optional[AsyncEventBusInterface] = None
+
+    async def execute(self, input_param: CreateCategoryInput) -> CategoryOutput:
+        category = _create(input_param)
+        await self.category_repo.insert(category)
+        await _publish_events_async(category, self.event_bus)
+        return CategoryOutputMapper.to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncGetCategoryUseCase(AsyncUseCase[GetCategoryInput, CategoryOutput]):
+    category_repo: AsyncCategoryRepository
+
+    async def execute(self, input_param: GetCategoryInput) -> CategoryOutput:
+        category = await self.category_repo.find_by_id(input_param.id)
+        return CategoryOutputMapper.to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncListCategoriesUseCase(AsyncUseCase[ListCategoriesInput, ListCategoriesOutput]):
+    category_repo: AsyncCategoryRepository
+
+    async def execute(self, input_param: ListCategoriesInput) -> ListCategoriesOutput:
+        result = await self.category_repo.search(_search_params(input_param))
+        return _list_output(result)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncUpdateCategoryUseCase(AsyncUseCase[UpdateCategoryInput, CategoryOutput]):
+    category_repo: AsyncCategoryRepository
+    event_bus: Optional[AsyncEventBusInterface] = None
+
+    async def execute(self, input_param: UpdateCategoryInput) -> CategoryOutput:
+        category = _update(await self.category_repo.find_by_id(input_param.id), input_param)
+        await self.category_repo.update(category)
+        await _publish_events_async(category, self.event_bus)
+        return CategoryOutputMapper.to_output(category)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncDeleteCategoryUseCase(AsyncUseCase[DeleteCategoryInput, None]):
+    category_repo: AsyncCategoryRepository
+
+    async def execute(self, input_param: DeleteCategoryInput) -> None:
+        await self.category_repo.delete(input_param.id)
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncBulkUpdateCategoriesUseCase(
+    AsyncUseCase[BulkUpdateCategoriesInput, BulkUpdateCategoriesOutput]
+):
+    """Publishes one ``CategoriesBulkUpdated`` instead of an event per category."""
+    category_repo: AsyncCategoryRepository
+    event_bus: Optional[AsyncEventBusInterface] = None
+
+    async def execute(self, input_param: BulkUpdateCategoriesInput) -> BulkUpdateCategoriesOutput:
+        updated = await self.category_repo.update_many(
+            input_param.values, input_param.ids, input_param.filter)
+        if self.event_bus is not None and updated:
+            await self.event_bus.publish([_bulk_updated(input_param, updated)])
+        return BulkUpdateCategoriesOutput(updated)
@@ -1,9 +1,18 @@
+import functools
+
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, ClassVar, FrozenSet, Optional, Sequence
 from dataclasses import dataclass, field
 
 from __seedwork.domain.entities import Entity
-from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.validators import BatchValidationResult, ValidatorSchema
+
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryUpdated
+)
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -15,6 +24,14 @@ class Category(Entity):
         default_factory=lambda: datetime.now()
     )
 
+    validator_schema: ClassVar[ValidatorSchema] = ValidatorSchema({
+        'name': ('required', 'string', ('max_length', 255)),
+        'description': ('string',),
+        'is_active': ('boolean',),
+    })
+
+    validate = staticmethod(validator_schema.compile('validate_category'))
+
     def __new__(cls, **kwargs):
         cls.validate(
             name=kwargs.get('name', None),
@@ -24,19 +41,58 @@ class Category(Entity):
 
         return super(Category, cls).__new__(cls)
 
+    @classmethod
+    def create(cls, **props: Any) -> 'Category':
+        """Builds a new category and records ``CategoryCreated``.
+
+        The constructor records nothing, since fixtures and rebuilt
+        categories go through it as well.
+        """
+        category = cls(**props)
+        category._record(CategoryCreated(
+            aggregate_id=category.id,
+            occurred_at=category.created_at,
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            created_at=category.created_at,
+        ))
+        return category
+
     def update(self, name: str, description: str) -> None:
         self.validate(name=name, description=description)
-        self._set('name', name)
-        self._set('description', description)
+        if name != self.name or description != self.description:
+            self._set('name', name)
+            self._set('description', description)
+            self._record(CategoryUpdated(
+                aggregate_id=self.id, name=name, description=description))
 
     def activate(self) -> None:
-        self._set('is_active', True)
+        if self.is_active is not True:
+            self._set('is_active', True)
+            self._record(CategoryActivated(aggregate_id=self.id))
 
     def deactivate(self) -> None:
-        self._set('is_active', False)
+        if self.is_active is not False:
+            self._set('is_active', False)
+            self._record(CategoryDeactivated(aggregate_id=self.id))
+
+    @classmethod
+    def validate_batch(
+        cls,
+        name: Sequence[Any],
+        description: Sequence[Any],
+        is_active: Optional[Sequence[Any]] = None
+    ) -> BatchValidationResult:
+        return cls.validator_schema.validate_batch(
+            name=name, description=description, is_active=is_active)
+
+    @classmethod
+    def validate_changes(cls, **changes: Any) -> None:
+        """Validates only the props a bulk update sets, with the same messages as ``validate``."""
+        cls._changes_validator(frozenset(changes))(**changes)
 
     @classmethod
-    def validate(cls, name: str, description: str, is_active: bool = None) -> None:
-        ValidatorRules.values(name, 'name').required().string().max_length(255)
-        ValidatorRules.values(description, 'description').string()
-        ValidatorRules.values(is_active, 'is_active').boolean()
+    @functools.cache
+    def _changes_validator(cls, props: FrozenSet[str]) -> Callable[..., None]:
+        return cls.validator_schema.subset(props).compile('validate_category_changes')
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from __seedwork.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryCreated(DomainEvent):
+    name: str
+    description: Optional[str]
+    is_active: Optional[bool]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryUpdated(DomainEvent):
+    name: str
+    description: Optional[str]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryActivated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryDeactivated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoriesBulkUpdated(DomainEvent):
+    """``values`` were set on the categories in ``ids`` and/or matching ``filter``
+    (all when both are ``None``) by one set-based update. It covers many
+    categories, so ``aggregate_id`` is empty."""
+    aggregate_id: str = ''
+    values: Dict[str, Any]
+    ids: Optional[Tuple[str, ...]] = None
+    filter: Optional[str] = None
+    updated: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoriesImported(DomainEvent):
+    """A batch of new categories stored by an importer; ``aggregate_id`` is empty."""
+    aggregate_id: str = ''
+    ids: Tuple[str, ...]
@@ -0,0 +1,89 @@
+import abc
+from abc import ABC
+
+from typing import Any, Dict, Iterable, Optional
+
+from __seedwork.domain.repositories import (
+    AsyncSearchableRepositoryInterface,
+    EntityId,
+    SearchableRepositoryInterface,
+    SearchParams as DefaultSearchParams,
+    SearchResult as DefaultSearchResult
+)
+
+from category.domain.entities import Category
+
+
+class _SearchParams(DefaultSearchParams[str]):  # pylint: disable=too-few-public-methods
+    pass
+
+
+class _SearchResult(DefaultSearchResult[Category, str]):  # pylint: disable=too-few-public-methods
+    pass
+
+
+class CategoryRepository(
+    SearchableRepositoryInterface[Category, _SearchParams, _SearchResult],
+    ABC
+):
+    """A filter matches categories whose name contains it, ignoring case.
+
+    Repositories created with ``use_text_index`` match it through a text
+    index instead: a category matches when its name or description has a
+    word starting with each word of the filter, ignoring case, so
+    ``'mov sci'`` matches "Sci-Fi Movies". A filter without any word, such
+    as ``'-'``, is still matched as a substring of the name.
+    """
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+
+    @abc.abstractmethod
+    def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[str] = None
+    ) -> int:
+        """Sets ``values`` on every category matching ``ids`` and the filter
+        ``filter_param`` (all categories when both are ``None``) in one pass,
+        after checking them with ``Category.validate_changes``. Returns the
+        number of matched categories.
+        """
+        raise NotImplementedError()
+
+    def activate_many(
+        self, ids: Optional[Iterable[EntityId]] = None, filter_param: Optional[str] = None
+    ) -> int:
+        return self.update_many({'is_active': True}, ids, filter_param)
+
+    def deactivate_many(
+        self, ids: Optional[Iterable[EntityId]] = None, filter_param: Optional[str] = None
+    ) -> int:
+        return self.update_many({'is_active': False}, ids, filter_param)
+
+
+class AsyncCategoryRepository(
+    AsyncSearchableRepositoryInterface[Category, _SearchParams, _SearchResult],
+    ABC
+):
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+
+    @abc.abstractmethod
+    async def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[str] = None
+    ) -> int:
+        raise NotImplementedError()
+
+    async def activate_many(
+        self, ids: Optional[Iterable[EntityId]] = None, filter_param: Optional[str] = None
+    ) -> int:
+        return await self.update_many({'is_active': True}, ids, filter_param)
+
+    async def deactivate_many(
+        self, ids: Optional[Iterable[EntityId]] = None, filter_param: Optional[str] = None
+    ) -> int:
+        return await self.update_many({'is_active': False}, ids, filter_param)
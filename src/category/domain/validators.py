@@ -0,0 +1,18 @@
+from typing import Any, Dict
+
+from __seedwork.domain.validators import BooleanField, CharField, NativeValidator
+
+
+class CategoryValidator(NativeValidator[Dict[str, Any]]):
+    fields = {
+        'name': CharField(max_length=255),
+        'description': CharField(required=False, allow_null=True, allow_blank=True),
+        'is_active': BooleanField(required=False),
+    }
+
+
+class CategoryValidatorFactory:  # pylint: disable=too-few-public-methods
+
+    @staticmethod
+    def create() -> CategoryValidator:
+        return CategoryValidator()
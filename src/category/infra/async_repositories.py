@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from __seedwork.domain.repositories import EntityId
+from __seedwork.infra.async_repositories import ThreadOffloadedRepository
+
+from category.domain.entities import Category
+from category.domain.repositories import AsyncCategoryRepository, CategoryRepository
+
+
+@dataclass(slots=True)
+class CategoryThreadOffloadedRepository(
+    ThreadOffloadedRepository[
+        Category,
+        CategoryRepository.SearchParams,
+        CategoryRepository.SearchResult
+    ],
+    AsyncCategoryRepository
+):
+    repository: CategoryRepository
+
+    async def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[str] = None
+    ) -> int:
+        return await self._run(self.repository.update_many, values, ids, filter_param)
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from __seedwork.domain.repositories import EntityId
+from __seedwork.infra.cached_repositories import CachedRepository
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+
+
+@dataclass(slots=True)
+class CategoryCachedRepository(
+    CachedRepository[
+        Category,
+        CategoryRepository.SearchParams,
+        CategoryRepository.SearchResult
+    ],
+    CategoryRepository
+):
+    repository: CategoryRepository
+
+    def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[str] = None
+    ) -> int:
+        if ids is not None:
+            ids = list(map(str, ids))
+        count = self.repository.update_many(values, ids, filter_param)
+        self._forget(ids)
+        return count
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.repositories import ChangeSet, EntityId
+from __seedwork.infra.file_store import FileStore, Row
+
+from category.domain.entities import Category
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class CategoryFileStoreRepository(CategoryInMemoryRepository):
+    """A ``CategoryInMemoryRepository`` that writes every change to a ``FileStore``.
+
+    All categories are loaded from the store when the repository is
+    created, through ``Category.hydrate_many``, and reads are served from
+    memory. Writes go to memory first, so a change the repository rejects
+    is never written to the store.
+    """
+
+    def __init__(self, store: FileStore, use_text_index: bool = False):
+        self.store = store
+        categories = self._hydrate(store.rows())
+        super().__init__(
+            items={category.id: category for category in categories},
+            use_text_index=use_text_index
+        )
+
+    def insert(self, entity: Category) -> None:
+        super().insert(entity)
+        self.store.put_many(self._to_rows([entity]))
+
+    def bulk_insert(self, entities: List[Category]) -> None:
+        super().bulk_insert(entities)
+        self.store.put_many(self._to_rows(entities))
+
+    def update(self, entity: Category) -> None:
+        super().update(entity)
+        self.store.put_many(self._to_rows([entity]))
+
+    def delete(self, entity_id: EntityId) -> None:
+        super().delete(entity_id)
+        self.store.delete(str(entity_id))
+
+    def save_changes(self, changes: ChangeSet[Category]) -> None:
+        """Inserts and deletes are written by ``bulk_insert`` and ``delete``."""
+        super().save_changes(changes)
+        updated = [entity for entity, dirty_fields in changes.updated if dirty_fields]
+        if updated:
+            self.store.put_many(self._to_rows(updated))
+
+    def _set_values(self, entities: List[Category], values: Dict[str, Any]) -> None:
+        super()._set_values(entities, values)
+        self.store.put_many(self._to_rows(entities))
+
+    @staticmethod
+    def _to_rows(entities: Iterable[Category]) -> List[Row]:
+        rows = Entity.to_dicts(entities)
+        for row in rows:
+            if row['created_at'] is not None:
+                row['created_at'] = row['created_at'].isoformat()
+        return rows
+
+    @staticmethod
+    def _hydrate(rows: Iterable[Row]) -> List[Category]:
+        from_iso = datetime.fromisoformat
+        for row in rows:
+            if row['created_at'] is not None:
+                row['created_at'] = from_iso(row['created_at'])
+        return Category.hydrate_many(rows)
@@ -0,0 +1,48 @@
+from typing import Any, List
+
+from __seedwork.domain.events import DomainEvent
+from __seedwork.infra.importers import EntityImporter, Row
+
+from category.domain.entities import Category
+from category.domain.events import CategoriesImported
+
+TRUE_VALUES = {'true', 't', 'yes', 'y', 'on', '1'}
+FALSE_VALUES = {'false', 'f', 'no', 'n', 'off', '0'}
+
+
+class CategoryImporter(EntityImporter):
+    """Imports categories from CSV or NDJSON rows.
+
+    Only ``name``, ``description`` and ``is_active`` are read, so every
+    imported category gets a new id and ``created_at``.
+    """
+    entity_class = Category
+
+    def parse_row(self, row: Row) -> Row:
+        parsed = {'name': row.get('name')}
+
+        description = row.get('description')
+        if description not in (None, ''):
+            parsed['description'] = description
+
+        is_active = self._parse_boolean(row.get('is_active'))
+        if is_active is not None:
+            parsed['is_active'] = is_active
+
+        return parsed
+
+    def imported_events(self, entities: List[Category]) -> List[DomainEvent]:
+        return [CategoriesImported(ids=tuple(category.id for category in entities))]
+
+    @staticmethod
+    def _parse_boolean(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        lower_value = value.strip().lower()
+        if lower_value == '':
+            return None
+        if lower_value in TRUE_VALUES:
+            return True
+        if lower_value in FALSE_VALUES:
+            return False
+        return value
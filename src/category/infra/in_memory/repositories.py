@@ -0,0 +1,37 @@
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from __seedwork.domain.repositories import EntityId, InMemorySearchableRepository
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+
+
+class CategoryInMemoryRepository(InMemorySearchableRepository[Category, str], CategoryRepository):
+    """Matches filters as described in ``CategoryRepository``, by scanning
+    or, with ``use_text_index``, through the ``TextIndex``."""
+    sorted_indexes = ['name', 'created_at']
+    text_indexed_fields = ['name', 'description']
+    sortable_fields = ['name', 'created_at']
+    default_sort = 'created_at'
+    default_sort_dir = 'desc'
+
+    def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[str] = None
+    ) -> int:
+        Category.validate_changes(**values)
+        return super().update_many(values, ids, filter_param)
+
+    def _apply_filter(self, items: Iterable[Category], filter_param: str) -> Iterator[Category]:
+        matched = self._filter_ids(filter_param)
+        if matched is not None:
+            return (item for item in items if item.id in matched)
+        filter_lower = filter_param.lower()
+        return (item for item in items if filter_lower in item.name.lower())
+
+    def _filter_ids(self, filter_param: str) -> Optional[Set[str]]:
+        if self.text_index is None:
+            return None
+        return self.text_index.search(filter_param)
@@ -0,0 +1,381 @@
+import json
+import sqlite3
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from __seedwork.domain.exceptions import AlreadyExistsException, NotFoundException
+from __seedwork.domain.repositories import (
+    ChangeSet,
+    EntityId,
+    SearchParams,
+    SearchResult,
+    tokenize
+)
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+
+SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS categories (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        is_active INTEGER,
+        created_at TEXT
+    )''',
+    'CREATE INDEX IF NOT EXISTS categories_name ON categories (name, id)',
+    'CREATE INDEX IF NOT EXISTS categories_created_at ON categories (created_at, id)',
+)
+
+# Indexes name and description, read from ``categories`` by rowid, with
+# the word tokens ``tokenize`` produces.
+TEXT_SCHEMA = (
+    '''CREATE VIRTUAL TABLE categories_fts USING fts5(
+        name, description, content='categories', content_rowid='rowid',
+        tokenize="unicode61 remove_diacritics 0 tokenchars '_'"
+    )''',
+    "INSERT INTO categories_fts (categories_fts) VALUES ('rebuild')",
+)
+
+COLUMNS = 'id, name, description, is_active, created_at'
+
+INSERT = f'INSERT INTO categories ({COLUMNS}) VALUES (?, ?, ?, ?, ?)'
+UPDATE = ('UPDATE categories SET name = ?, description = ?, is_active = ?, created_at = ? '
+          'WHERE id = ?')
+SELECT_BY_ID = f'SELECT {COLUMNS} FROM categories WHERE id = ?'
+SELECT_ALL = f'SELECT {COLUMNS} FROM categories'
+DELETE = 'DELETE FROM categories WHERE id = ?'
+
+TEXT_COLUMNS = frozenset({'name', 'description'})
+BY_IDS = 'id IN (SELECT value FROM json_each(?))'
+BY_ROWIDS = 'rowid IN (SELECT value FROM json_each(?))'
+UNINDEX_TEXT = ("INSERT INTO categories_fts (categories_fts, rowid, name, description) "
+                "SELECT 'delete', rowid, name, description FROM categories WHERE {}")
+INDEX_TEXT = ('INSERT INTO categories_fts (rowid, name, description) '
+              'SELECT rowid, name, description FROM categories WHERE {}')
+
+Row = Tuple[str, str, Optional[str], Optional[int], Optional[str]]
+
+
+def _format_bool(value: Optional[bool]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return None if value is None else value.isoformat(sep=' ', timespec='microseconds')
+
+
+COLUMN_ADAPTERS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    'name': None,
+    'description': None,
+    'is_active': _format_bool,
+    'created_at': _format_datetime,
+}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _filter_condition(filter_param: str, use_text_index: bool) -> Tuple[str, str]:
+    terms = tokenize(filter_param) if use_text_index else None
+    if terms:
+        return (
+            'rowid IN (SELECT rowid FROM categories_fts WHERE categories_fts MATCH ?)',
+            ' '.join(f'"{term}"*' for term in terms)
+        )
+    return "name LIKE ? ESCAPE '\\'", f'%{_escape_like(filter_param)}%'
+
+
+@dataclass(slots=True)
+class CategorySqliteRepository(CategoryRepository):
+    """Stores categories in SQLite through a ``SqliteConnectionPool``.
+
+    Writes use constant SQL so ``sqlite3`` reuses its prepared statements,
+    and the bulk methods send all rows through one ``executemany`` inside
+    one transaction. Rows are read back with ``Category.hydrate_many``,
+    since they were validated before they were written.
+
+    Filters are matched with ``LIKE`` on the name. With ``use_text_index``
+    they are matched through the FTS5 table ``categories_fts`` instead,
+    which is built on first use and dropped by repositories created without
+    it, so it is never left stale. It roughly halves single-insert
+    throughput, hence opt-in. The write methods update it with one
+    statement per batch rather than with triggers, since FTS5 flushes its
+    pending changes after every statement an ``executemany`` runs. It is
+    keyed by rowid, so after a ``VACUUM``, which may renumber the rows, or
+    after writing ``categories`` by other means, run
+    ``INSERT INTO categories_fts (categories_fts) VALUES ('rebuild')``.
+    """
+    pool: SqliteConnectionPool
+    use_text_index: bool = False
+
+    sortable_fields = ['name', 'created_at']
+
+    def __post_init__(self):
+        with self.pool.transaction() as connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+            if not self.use_text_index:
+                connection.execute('DROP TABLE IF EXISTS categories_fts')
+            elif connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'categories_fts'"
+            ).fetchone() is None:
+                for statement in TEXT_SCHEMA:
+                    connection.execute(statement)
+
+    def insert(self, entity: Category) -> None:
+        with self.pool.transaction() as connection:
+            self._insert_new(connection, [self._to_row(entity)])
+
+    def bulk_insert(self, entities: List[Category]) -> None:
+        with self.pool.transaction() as connection:
+            self._insert_new(connection, [self._to_row(entity) for entity in entities])
+
+    def find_by_id(self, entity_id: EntityId) -> Category:
+        entity_id = str(entity_id)
+        with self.pool.connection() as connection:
+            row = connection.execute(SELECT_BY_ID, (entity_id,)).fetchone()
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return self._hydrate((row,))[0]
+
+    def find_all(self) -> List[Category]:
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_ALL).fetchall()
+        return self._hydrate(rows)
+
+    def update(self, entity: Category) -> None:
+        with self.pool.transaction() as connection:
+            self._reindex_text(connection, UNINDEX_TEXT, [entity.id])
+            cursor = connection.execute(UPDATE, self._to_update_row(entity))
+            self._reindex_text(connection, INDEX_TEXT, [entity.id])
+        if cursor.rowcount == 0:
+            raise NotFoundException(f"Entity not found using ID '{entity.id}'")
+
+    def bulk_update(self, entities: List[Category]) -> None:
+        entity_ids = [entity.id for entity in entities]
+        with self.pool.transaction() as connection:
+            self._reindex_text(connection, UNINDEX_TEXT, entity_ids)
+            connection.executemany(UPDATE, map(self._to_update_row, entities))
+            self._reindex_text(connection, INDEX_TEXT, entity_ids)
+
+    def delete(self, entity_id: EntityId) -> None:
+        entity_id = str(entity_id)
+        with self.pool.transaction() as connection:
+            self._reindex_text(connection, UNINDEX_TEXT, [entity_id])
+            cursor = connection.execute(DELETE, (entity_id,))
+        if cursor.rowcount == 0:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[Iterable[EntityId]] = None,
+        filter_param: Optional[str] = None
+    ) -> int:
+        """Runs one ``UPDATE`` over the matching rows, without loading any
+        category. When ``values`` has text columns and ``use_text_index`` is
+        set, the matching rowids are read first so ``categories_fts`` is
+        updated for exactly those rows.
+        """
+        Category.validate_changes(**values)
+        if not values:
+            raise ValueError('There are no values to update')
+
+        columns = sorted(values)
+        params = [
+            values[column] if COLUMN_ADAPTERS[column] is None
+            else COLUMN_ADAPTERS[column](values[column])
+            for column in columns
+        ]
+        statement = f"UPDATE categories SET {', '.join(f'{column} = ?' for column in columns)}"
+        conditions, condition_params = [], []
+        if ids is not None:
+            conditions.append(BY_IDS)
+            condition_params.append(json.dumps(list(map(str, ids))))
+        if filter_param is not None:
+            condition, filter_value = _filter_condition(filter_param, self.use_text_index)
+            conditions.append(condition)
+            condition_params.append(filter_value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+
+        with self.pool.transaction() as connection:
+            if not self.use_text_index or TEXT_COLUMNS.isdisjoint(columns):
+                cursor = connection.execute(statement + where, [*params, *condition_params])
+            else:
+                rowids = json.dumps([rowid for rowid, in connection.execute(
+                    f'SELECT rowid FROM categories{where}', condition_params)])
+                connection.execute(UNINDEX_TEXT.format(BY_ROWIDS), (rowids,))
+                cursor = connection.execute(f'{statement} WHERE {BY_ROWIDS}', [*params, rowids])
+                connection.execute(INDEX_TEXT.format(BY_ROWIDS), (rowids,))
+        return cursor.rowcount
+
+    def save_changes(self, changes: ChangeSet[Category]) -> None:
+        """Writes a ``ChangeSet`` in one transaction.
+
+        Updates are grouped by their dirty fields and each group is sent as
+        one ``executemany`` that sets only those columns. If any updated or
+        deleted id is missing, nothing is written.
+        """
+        updates: Dict[FrozenSet[str], List[Category]] = {}
+        for entity, dirty_fields in changes.updated:
+            if dirty_fields:
+                updates.setdefault(frozenset(dirty_fields), []).append(entity)
+
+        with self.pool.transaction() as connection:
+            if changes.inserted:
+                self._insert_new(connection, [self._to_row(entity) for entity in changes.inserted])
+            for dirty_fields, entities in updates.items():
+                columns = sorted(dirty_fields)
+                entity_ids = [entity.id for entity in entities]
+                text_changed = self.use_text_index and not TEXT_COLUMNS.isdisjoint(columns)
+                if text_changed:
+                    self._reindex_text(connection, UNINDEX_TEXT, entity_ids)
+                self._write_existing(
+                    connection,
+                    f"UPDATE categories SET {', '.join(f'{column} = ?' for column in columns)} "
+                    'WHERE id = ?',
+                    [self._to_partial_row(entity, columns) for entity in entities]
+                )
+                if text_changed:
+                    self._reindex_text(connection, INDEX_TEXT, entity_ids)
+            if changes.deleted:
+                self._reindex_text(connection, UNINDEX_TEXT, list(changes.deleted))
+                self._write_existing(
+                    connection, DELETE, [(entity_id,) for entity_id in changes.deleted])
+
+    def search(self, input_params: SearchParams[str]) -> SearchResult[Category, str]:
+        where, params = '', []
+        if input_params.filter is not None:
+            condition, filter_value = _filter_condition(input_params.filter, self.use_text_index)
+            where = f' WHERE {condition}'
+            params.append(filter_value)
+
+        if input_params.sort in self.sortable_fields:
+            order = f'{input_params.sort} {input_params.sort_dir.upper()}, id {input_params.sort_dir.upper()}'
+        elif input_params.sort is None:
+            order = 'created_at DESC, id DESC'
+        else:
+            order = 'rowid'
+
+        offset = (input_params.page - 1) * input_params.per_page
+        with self.pool.connection() as connection:
+            total = connection.execute(
+                f'SELECT COUNT(*) FROM categories{where}', params).fetchone()[0]
+            rows = connection.execute(
+                f'{SELECT_ALL}{where} ORDER BY {order} LIMIT ? OFFSET ?',
+                [*params, input_params.per_page, offset]
+            ).fetchall()
+
+        return SearchResult(
+            items=self._hydrate(rows),
+            total=total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    @staticmethod
+    def _to_row(entity: Category) -> Row:
+        return (
+            entity.id,
+            entity.name,
+            entity.description,
+            _format_bool(entity.is_active),
+            _format_datetime(entity.created_at),
+        )
+
+    @staticmethod
+    def _to_update_row(entity: Category) -> Tuple[Any, ...]:
+        return (
+            entity.name,
+            entity.description,
+            _format_bool(entity.is_active),
+            _format_datetime(entity.created_at),
+            entity.id,
+        )
+
+    @staticmethod
+    def _to_partial_row(entity: Category, columns: List[str]) -> Tuple[Any, ...]:
+        values = []
+        for column in columns:
+            value = getattr(entity, column)
+            adapter = COLUMN_ADAPTERS[column]
+            values.append(value if adapter is None else adapter(value))
+        values.append(entity.id)
+        return tuple(values)
+
+    def _insert_new(self, connection, rows: List[Row]) -> None:
+        """Inserts rows whose ids must not exist yet, in the database or among ``rows``.
+
+        New rows get rowids above the largest one before them, so they are
+        added to ``categories_fts`` with one range scan.
+        """
+        connection.execute('SAVEPOINT insert_new')
+        if self.use_text_index:
+            last_rowid = connection.execute(
+                'SELECT coalesce(max(rowid), 0) FROM categories').fetchone()[0]
+        try:
+            connection.executemany(INSERT, rows)
+        except sqlite3.IntegrityError as ex:
+            connection.execute('ROLLBACK TO insert_new')
+            entity_ids = [row[0] for row in rows]
+            found = set()
+            for position in range(0, len(entity_ids), 500):
+                batch = entity_ids[position:position + 500]
+                found.update(row[0] for row in connection.execute(
+                    f"SELECT id FROM categories WHERE id IN ({', '.join('?' * len(batch))})", batch))
+            seen = set()
+            for entity_id in entity_ids:
+                if entity_id in found or entity_id in seen:
+                    raise AlreadyExistsException(
+                        f"Entity already exists using ID '{entity_id}'") from ex
+                seen.add(entity_id)
+            raise
+        if self.use_text_index:
+            connection.execute(INDEX_TEXT.format('rowid > ?'), (last_rowid,))
+        connection.execute('RELEASE insert_new')
+
+    def _reindex_text(self, connection, statement: str, entity_ids: List[str]) -> None:
+        """Runs ``UNINDEX_TEXT`` or ``INDEX_TEXT`` for the rows with ``entity_ids``."""
+        if self.use_text_index:
+            connection.execute(statement.format(BY_IDS), (json.dumps(entity_ids),))
+
+    @staticmethod
+    def _write_existing(connection, statement: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Runs ``statement`` for rows whose last value is an id that must exist."""
+        connection.execute('SAVEPOINT write_existing')
+        cursor = connection.executemany(statement, rows)
+        if cursor.rowcount == len(rows):
+            connection.execute('RELEASE write_existing')
+            return
+
+        connection.execute('ROLLBACK TO write_existing')
+        entity_ids = [row[-1] for row in rows]
+        found = set()
+        for position in range(0, len(entity_ids), 500):
+            batch = entity_ids[position:position + 500]
+            found.update(row[0] for row in connection.execute(
+                f"SELECT id FROM categories WHERE id IN ({', '.join('?' * len(batch))})", batch))
+        missing = next(entity_id for entity_id in entity_ids if entity_id not in found)
+        raise NotFoundException(f"Entity not found using ID '{missing}'")
+
+    @staticmethod
+    def _hydrate(rows: Iterable[Row]) -> List[Category]:
+        from_iso = datetime.fromisoformat
+        return Category.hydrate_many(
+            {
+                'id': entity_id,
+                'name': name,
+                'description': description,
+                'is_active': None if is_active is None else bool(is_active),
+                'created_at': None if created_at is None else from_iso(created_at),
+            }
+            for entity_id, name, description, is_active, created_at in rows
+        )
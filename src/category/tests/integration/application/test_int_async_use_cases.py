@@ -0,0 +1,79 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.application.use_cases import (
+    AsyncCreateCategoryUseCase,
+    AsyncDeleteCategoryUseCase,
+    AsyncGetCategoryUseCase,
+    AsyncListCategoriesUseCase,
+    AsyncUpdateCategoryUseCase,
+    CreateCategoryInput,
+    DeleteCategoryInput,
+    GetCategoryInput,
+    ListCategoriesInput,
+    UpdateCategoryInput
+)
+from category.domain.repositories import AsyncCategoryRepository
+from category.infra.async_repositories import CategoryThreadOffloadedRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+async def run_crud(test: unittest.TestCase, repo: AsyncCategoryRepository):
+    names = [f'Category {position:02}' for position in range(20)]
+    created = await asyncio.gather(*(
+        AsyncCreateCategoryUseCase(repo).execute(CreateCategoryInput(name=name))
+        for name in names
+    ))
+
+    listed = await AsyncListCategoriesUseCase(repo).execute(
+        ListCategoriesInput(sort='name', per_page=5, filter='category 1'))
+    test.assertEqual(
+        [item.name for item in listed.items], names[10:15])
+    test.assertEqual(listed.total, 10)
+
+    updated = await AsyncUpdateCategoryUseCase(repo).execute(
+        UpdateCategoryInput(id=created[0].id, name='Movie', is_active=False))
+    found = await AsyncGetCategoryUseCase(repo).execute(
+        GetCategoryInput(created[0].id))
+    test.assertEqual(found, updated)
+
+    deactivated = await repo.deactivate_many(filter_param='category 0')
+    test.assertEqual(deactivated, 9)
+    listed = await AsyncListCategoriesUseCase(repo).execute(ListCategoriesInput(filter='category 0'))
+    test.assertFalse(any(item.is_active for item in listed.items))
+
+    await asyncio.gather(*(
+        AsyncDeleteCategoryUseCase(repo).execute(DeleteCategoryInput(output.id))
+        for output in created
+    ))
+    test.assertEqual(await repo.find_all(), [])
+
+
+class TestAsyncUseCasesInMemoryIntegration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryThreadOffloadedRepository(
+            CategoryInMemoryRepository(), thread_safe=False)
+
+    def test_crud(self):
+        asyncio.run(run_crud(self, self.repo))
+
+
+class TestAsyncUseCasesSqliteIntegration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.pool = SqliteConnectionPool(os.path.join(self.directory.name, 'db.sqlite3'), size=4)
+        self.repo = CategoryThreadOffloadedRepository(CategorySqliteRepository(self.pool))
+
+    def tearDown(self) -> None:
+        self.pool.close()
+        self.directory.cleanup()
+
+    def test_crud(self):
+        asyncio.run(run_crud(self, self.repo))
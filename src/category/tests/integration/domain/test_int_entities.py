@@ -105,3 +105,51 @@ class TestCategoryIntegrations(unittest.TestCase):
 
         except ValidationException as exception:
             self.fail(f'Some prop is not valid. Error: {exception.args[0]}')
+
+    def test_validate_changes(self):
+        try:
+            Category.validate_changes(description=None)
+            Category.validate_changes(is_active=False)
+            Category.validate_changes(name=self.valid_name, description='some')
+        except ValidationException as exception:
+            self.fail(f'Some prop is not valid. Error: {exception.args[0]}')
+
+        arrange = [
+            ({'name': None}, 'The name is required'),
+            ({'name': 't' * 256}, 'The name must be less than 255'),
+            ({'description': 5}, 'The description must be a string'),
+            ({'is_active': 'true'}, 'The is_active must be a boolean'),
+        ]
+        for changes, message in arrange:
+            with self.assertRaises(ValidationException, msg=f'{changes}') as assert_error:
+                Category.validate_changes(**changes)
+            self.assertEqual(assert_error.exception.args[0], message)
+
+        with self.assertRaises(ValueError):
+            Category.validate_changes(created_at=None)
+
+    def test_validate_batch(self):
+        result = Category.validate_batch(
+            name=[self.valid_name, None, True, 't' * 256, self.valid_name],
+            description=[None, 5, '', None, self.valid_description],
+            is_active=[True, None, False, 'Invalid IsActive', False],
+        )
+
+        self.assertEqual(result.mask, bytearray([0, 1, 1, 1, 0]))
+        self.assertEqual(list(result.valid_rows()), [0, 4])
+        self.assertEqual(result.errors, {
+            1: {
+                'name': ['The name is required'],
+                'description': ['The description must be a string'],
+            },
+            2: {'name': ['The name must be a string']},
+            3: {
+                'name': ['The name must be less than 255'],
+                'is_active': ['The is_active must be a boolean'],
+            },
+        })
+
+    def test_validate_batch_without_is_active_column(self):
+        result = Category.validate_batch(
+            name=[self.valid_name, ''], description=[None, None])
+        self.assertEqual(result.errors, {1: {'name': ['The name is required']}})
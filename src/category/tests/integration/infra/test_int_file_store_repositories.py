@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+
+from datetime import datetime
+
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import ChangeSet
+from __seedwork.infra.file_store import FileStore
+
+from category.domain.entities import Category
+from category.infra.file_store.repositories import CategoryFileStoreRepository
+
+
+class TestCategoryFileStoreRepositoryIntegration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = FileStore(self.directory.name)
+        self.repo = CategoryFileStoreRepository(self.store)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.directory.cleanup()
+
+    def reopen(self) -> CategoryFileStoreRepository:
+        self.store.close()
+        self.store = FileStore(self.directory.name)
+        return CategoryFileStoreRepository(self.store)
+
+    def test_persist_writes(self):
+        movie = Category(name='Movie', description='Films', created_at=datetime(2023, 1, 1))
+        series = Category(name='Series', is_active=False)
+        documentary = Category(name='Documentary')
+        self.repo.insert(movie)
+        self.repo.bulk_insert([series, documentary])
+        movie.update('Movies', 'All films')
+        self.repo.update(movie)
+        self.repo.delete(documentary.id)
+
+        repo = self.reopen()
+        self.assertCountEqual(repo.find_all(), [movie, series])
+        self.assertEqual(repo.find_by_id(movie.id).created_at, datetime(2023, 1, 1))
+        self.assertEqual(self.store.get(series.id)['name'], 'Series')
+        with self.assertRaises(NotFoundException):
+            repo.find_by_id(documentary.id)
+        self.assertEqual(repo.search(repo.SearchParams(filter='ovies')).items, [movie])
+        self.store.close()
+        self.store = FileStore(self.directory.name)
+        repo = CategoryFileStoreRepository(self.store, use_text_index=True)
+        self.assertEqual(repo.search(repo.SearchParams(filter='films')).items, [movie])
+
+    def test_persist_none_is_active_and_created_at(self):
+        category = Category(name='Movie', is_active=None, created_at=None)
+        self.repo.insert(category)
+
+        found = self.reopen().find_by_id(category.id)
+        self.assertIsNone(found.is_active)
+        self.assertIsNone(found.created_at)
+
+    def test_do_not_write_rejected_changes(self):
+        category = Category(name='Movie')
+        with self.assertRaises(NotFoundException):
+            self.repo.update(category)
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(category.id)
+        self.assertEqual(self.store.log_records, 0)
+
+    def test_save_changes_and_update_many(self):
+        movie, series, documentary = (
+            Category(name='Movie'), Category(name='Series'), Category(name='Documentary'))
+        self.repo.bulk_insert([movie, series])
+        movie.deactivate()
+        self.repo.save_changes(ChangeSet(
+            inserted=[documentary],
+            updated=[(movie, frozenset({'is_active'}))],
+            deleted=[series.id],
+        ))
+        self.assertEqual(self.repo.update_many({'description': 'Some description'},
+                                               filter_param='doc'), 1)
+
+        self.store.compact()
+        repo = self.reopen()
+        self.assertEqual(len(repo.find_all()), 2)
+        self.assertFalse(repo.find_by_id(movie.id).is_active)
+        self.assertEqual(repo.find_by_id(documentary.id).description, 'Some description')
+        with self.assertRaises(NotFoundException):
+            repo.find_by_id(series.id)
@@ -0,0 +1,78 @@
+import io
+import unittest
+
+from unittest.mock import MagicMock
+
+from __seedwork.infra.importers import read_csv, read_ndjson
+
+from category.domain.events import CategoriesImported
+from category.infra.importers import CategoryImporter
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class TestCategoryImporterIntegration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryInMemoryRepository()
+        self.importer = CategoryImporter(self.repo, chunk_size=2)
+
+    def test_publish_one_event_per_stored_chunk(self):
+        bus = MagicMock()
+        importer = CategoryImporter(self.repo, chunk_size=2, event_bus=bus)
+        rows = [{'name': 'Movie'}, {'name': ''}, {'name': 'Documentary'}, {'name': 'Anime'}]
+
+        importer.import_rows(rows)
+
+        events = [call.args[0] for call in bus.publish.call_args_list]
+        self.assertTrue(all(
+            isinstance(event, CategoriesImported) for batch in events for event in batch))
+        self.assertEqual(
+            [[len(event.ids) for event in batch] for batch in events], [[1], [2]])
+        self.assertEqual({category_id for batch in events for category_id in batch[0].ids},
+                         {category.id for category in self.repo.find_all()})
+
+    def test_import_csv(self):
+        source = io.StringIO(
+            'name,description,is_active\n'
+            'Movie,,true\n'
+            ',Missing name,false\n'
+            'Documentary,Some description,NO\n'
+            'Anime,,maybe\n'
+            f"{'t' * 256},,\n"
+        )
+
+        report = self.importer.import_rows(read_csv(source))
+
+        self.assertEqual(report.imported, 2)
+        self.assertEqual(
+            [(rejected.row, rejected.errors) for rejected in report.rejected],
+            [
+                (1, {'name': ['The name is required']}),
+                (3, {'is_active': ['The is_active must be a boolean']}),
+                (4, {'name': ['The name must be less than 255']}),
+            ]
+        )
+
+        movie, documentary = self.repo.find_all()
+        self.assertEqual(
+            (movie.name, movie.description, movie.is_active), ('Movie', None, True))
+        self.assertEqual(
+            (documentary.name, documentary.description, documentary.is_active),
+            ('Documentary', 'Some description', False)
+        )
+
+    def test_import_ndjson_ignores_ids_and_unknown_props(self):
+        source = io.StringIO(
+            '{"id": "fake id", "name": "Movie", "is_active": false, "other": 1}\n'
+            '{"name": true}\n'
+        )
+
+        report = self.importer.import_rows(read_ndjson(source))
+
+        self.assertEqual(report.imported, 1)
+        self.assertEqual(report.rejected[0].errors, {'name': ['The name must be a string']})
+
+        category = self.repo.find_all()[0]
+        self.assertNotEqual(category.id, 'fake id')
+        self.assertFalse(category.is_active)
+        self.assertNotIn('other', category.to_dict())
@@ -0,0 +1,322 @@
+import os
+import tempfile
+import unittest
+
+from datetime import datetime, timedelta
+
+from __seedwork.domain.exceptions import AlreadyExistsException, NotFoundException, ValidationException
+from __seedwork.domain.repositories import ChangeSet
+from __seedwork.infra.sqlite import SqliteConnectionPool
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.sqlite.repositories import INSERT, CategorySqliteRepository
+
+
+class TestCategorySqliteRepositoryIntegration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.pool = SqliteConnectionPool(os.path.join(self.directory.name, 'db.sqlite3'), size=2)
+        self.repo = CategorySqliteRepository(self.pool)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+        self.directory.cleanup()
+
+    def test_create_table_and_indexes(self):
+        with self.pool.connection() as connection:
+            indexes = {
+                row[0] for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'categories'")
+            }
+        self.assertTrue({'categories_name', 'categories_created_at'} <= indexes)
+        CategorySqliteRepository(self.pool)
+
+    def test_insert_and_find_by_id(self):
+        category = Category(name='Movie', description='Some description', is_active=False,
+                            created_at=datetime(2023, 1, 1))
+        self.repo.insert(category)
+
+        found = self.repo.find_by_id(category.unique_entity_id)
+        self.assertEqual(found, category)
+        self.assertIsInstance(found.created_at, datetime)
+        self.assertIs(found.is_active, False)
+
+    def test_store_none_is_active_and_created_at(self):
+        category = Category(name='Movie', is_active=None, created_at=None)
+        self.repo.insert(category)
+        found = self.repo.find_by_id(category.id)
+        self.assertIsNone(found.is_active)
+        self.assertIsNone(found.created_at)
+
+        other = Category(name='Anime')
+        self.repo.bulk_insert([other])
+        other._set('is_active', None)
+        self.repo.bulk_update([other])
+        self.assertIsNone(self.repo.find_by_id(other.id).is_active)
+
+        self.repo.activate_many()
+        self.assertEqual(self.repo.update_many({'is_active': None}), 2)
+        self.assertEqual([found.is_active for found in self.repo.find_all()], [None, None])
+
+        category.activate()
+        self.repo.save_changes(ChangeSet(updated=[(category, frozenset({'is_active'}))]))
+        self.assertIs(self.repo.find_by_id(category.id).is_active, True)
+
+    def test_throw_not_found_exception(self):
+        category = Category(name='Movie')
+        for method, argument in [
+            (self.repo.find_by_id, 'fake id'),
+            (self.repo.delete, 'fake id'),
+            (self.repo.update, category),
+        ]:
+            with self.assertRaises(NotFoundException) as assert_error:
+                method(argument)
+            expected_id = argument if isinstance(argument, str) else category.id
+            self.assertEqual(
+                assert_error.exception.args[0], f"Entity not found using ID '{expected_id}'")
+
+    def test_bulk_insert_and_find_all(self):
+        categories = [Category(name=f'Category {position}') for position in range(10)]
+        self.repo.bulk_insert(categories)
+        self.assertEqual(self.repo.find_all(), categories)
+
+    def test_update_and_bulk_update(self):
+        categories = [Category(name='Movie'), Category(name='Anime')]
+        self.repo.bulk_insert(categories)
+
+        categories[0].update(name='Documentary', description='Updated')
+        self.repo.update(categories[0])
+        self.assertEqual(self.repo.find_by_id(categories[0].id), categories[0])
+
+        for category in categories:
+            category.deactivate()
+        self.repo.bulk_update(categories)
+        self.assertEqual(
+            [category.is_active for category in self.repo.find_all()], [False, False])
+
+    def test_delete(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        self.repo.delete(category.id)
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_update_many(self):
+        movie, movies, documentary = (
+            Category(name=name, description='some') for name in ['Movie', 'MOVIES', 'Documentary'])
+        self.repo.bulk_insert([movie, movies, documentary])
+
+        self.assertEqual(self.repo.deactivate_many(filter_param='movie'), 2)
+        self.assertEqual(self.repo.activate_many([movie.id, movie.id, 'fake id']), 1)
+        self.assertEqual(self.repo.update_many(
+            {'name': 'Film', 'description': None}, [movie.id, documentary.id], 'movie'), 1)
+
+        found = {category.id: category for category in self.repo.find_all()}
+        self.assertEqual(
+            (found[movie.id].name, found[movie.id].description, found[movie.id].is_active),
+            ('Film', None, True))
+        self.assertFalse(found[movies.id].is_active)
+        self.assertEqual(found[movies.id].description, 'some')
+        self.assertEqual(found[documentary.id], documentary)
+
+        self.assertEqual(self.repo.deactivate_many(), 3)
+        self.assertFalse(any(category.is_active for category in self.repo.find_all()))
+        self.assertEqual(self.repo.activate_many([]), 0)
+        self.assertEqual(self.repo.update_many({'description': 'x'}, filter_param='%'), 0)
+
+    def test_update_many_validates_values(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        with self.assertRaises(ValidationException) as assert_error:
+            self.repo.update_many({'name': None})
+        self.assertEqual(assert_error.exception.args[0], 'The name is required')
+        with self.assertRaises(ValueError):
+            self.repo.update_many({'id': 'other'})
+        with self.assertRaises(ValueError):
+            self.repo.update_many({})
+
+        self.assertEqual(self.repo.find_all(), [category])
+
+    def test_save_changes_writes_only_dirty_columns(self):
+        movie, documentary, removed = (
+            Category(name=name) for name in ['Movie', 'Documentary', 'Removed'])
+        self.repo.bulk_insert([movie, documentary, removed])
+        with self.pool.transaction() as connection:
+            connection.execute(
+                "UPDATE categories SET description = 'changed elsewhere' WHERE id = ?", (movie.id,))
+        new = Category(name='New')
+        movie.deactivate()
+        documentary.update(name='Docs', description=None)
+
+        self.repo.save_changes(ChangeSet(
+            inserted=[new],
+            updated=[(movie, movie.dirty_fields), (documentary, documentary.dirty_fields)],
+            deleted=[removed.id],
+        ))
+
+        found = self.repo.find_by_id(movie.id)
+        self.assertFalse(found.is_active)
+        self.assertEqual(found.description, 'changed elsewhere')
+        self.assertEqual(self.repo.find_by_id(documentary.id).name, 'Docs')
+        self.assertEqual(self.repo.find_by_id(new.id), new)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(removed.id)
+
+    def test_save_changes_writes_nothing_when_an_id_is_missing(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        category.deactivate()
+        missing = Category(name='Missing')
+        missing.deactivate()
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.save_changes(ChangeSet(updated=[
+                (category, category.dirty_fields), (missing, missing.dirty_fields)]))
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity not found using ID '{missing.id}'")
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.save_changes(ChangeSet(
+                inserted=[Category(name='New')], deleted=[category.id, 'fake id']))
+        self.assertEqual(
+            assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+
+        self.assertEqual(self.repo.find_all(), [Category.from_trusted(**{
+            **category.to_dict(), 'is_active': True})])
+
+    def test_throw_already_exists_exception_on_duplicate_ids(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        duplicate = Category(unique_entity_id=category.unique_entity_id, name='Other')
+        new = Category(name='New')
+
+        with self.assertRaises(AlreadyExistsException) as assert_error:
+            self.repo.insert(duplicate)
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity already exists using ID '{category.id}'")
+        for entities in [[new, duplicate], [new, new]]:
+            with self.assertRaises(AlreadyExistsException):
+                self.repo.bulk_insert(entities)
+        with self.assertRaises(AlreadyExistsException):
+            self.repo.save_changes(ChangeSet(inserted=[new, duplicate]))
+
+        self.assertEqual(self.repo.find_all(), [category])
+
+    def test_save_changes_rolls_back_every_update_group(self):
+        first, second = Category(name='A'), Category(name='B')
+        self.repo.bulk_insert([first, second])
+        first.update(name='A changed', description=None)
+        second.deactivate()
+        missing = Category(name='Missing')
+        missing.deactivate()
+
+        with self.assertRaises(NotFoundException):
+            self.repo.save_changes(ChangeSet(updated=[
+                (first, first.dirty_fields),
+                (second, second.dirty_fields),
+                (missing, missing.dirty_fields),
+            ]))
+
+        self.assertEqual(self.repo.find_by_id(first.id).name, 'A')
+        self.assertTrue(self.repo.find_by_id(second.id).is_active)
+
+    def test_search(self):
+        created_at = datetime(2023, 1, 1)
+        categories = [
+            Category(name=name, created_at=created_at + timedelta(seconds=position))
+            for position, name in enumerate(['b', 'a', 'TEST', 'e', 'test', '100%'])
+        ]
+        self.repo.bulk_insert(categories)
+
+        result = self.repo.search(CategoryRepository.SearchParams(per_page=2))
+        self.assertEqual(result.items, [categories[5], categories[4]])
+        self.assertEqual(result.total, 6)
+        self.assertEqual(result.last_page, 3)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            sort='name', page=2, per_page=2))
+        self.assertEqual(result.items, [categories[1], categories[0]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='TeSt', sort='name', sort_dir='desc'))
+        self.assertEqual(result.items, [categories[4], categories[2]])
+        self.assertEqual(result.total, 2)
+
+        result = self.repo.search(CategoryRepository.SearchParams(filter='%'))
+        self.assertEqual(result.items, [categories[5]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(sort='is_active', per_page=1))
+        self.assertEqual(result.items, [categories[0]])
+
+    def test_search_filters_name_substrings_without_text_index(self):
+        horror = Category(name='Horror', description='Scary movies')
+        sci_fi = Category(name='Sci-Fi Movies', description='Space and robots')
+        self.repo.bulk_insert([horror, sci_fi])
+
+        def search(filter_param):
+            return self.repo.search(CategoryRepository.SearchParams(filter=filter_param)).items
+
+        self.assertEqual(search('OVIE'), [sci_fi])
+        self.assertEqual(search('scary'), [])
+        self.assertEqual(search('mov sci'), [])
+        self.assertEqual(self.repo.deactivate_many(filter_param='rr'), 1)
+        with self.pool.connection() as connection:
+            self.assertIsNone(connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'categories_fts'").fetchone())
+
+    def test_search_filters_by_word_prefixes_of_name_and_description(self):
+        self.repo = CategorySqliteRepository(self.pool, use_text_index=True)
+        horror = Category(name='Horror', description='Scary movies')
+        sci_fi = Category(name='Sci-Fi Movies', description='Space and robots')
+        drama = Category(name='Drama', description=None)
+        self.repo.bulk_insert([horror, sci_fi, drama])
+
+        def search(filter_param):
+            result = self.repo.search(CategoryRepository.SearchParams(
+                filter=filter_param, sort='name'))
+            return result.items
+
+        self.assertEqual(search('MOV'), [horror, sci_fi])
+        self.assertEqual(search('movies sc'), [horror, sci_fi])
+        self.assertEqual(search('fi rob'), [sci_fi])
+        self.assertEqual(search('ovies'), [])
+        self.assertEqual(search('-'), [sci_fi])
+        self.assertEqual(self.repo.deactivate_many(filter_param='mov'), 2)
+
+        sci_fi.update(name='Sci-Fi', description=None)
+        self.repo.update(sci_fi)
+        self.repo.delete(horror.id)
+        self.assertEqual(search('mov'), [])
+        self.assertEqual(search('sci'), [sci_fi])
+
+        self.assertEqual(self.repo.update_many({'description': 'Old movies'}, [drama.id]), 1)
+        self.assertEqual([category.id for category in search('mov')], [drama.id])
+        drama.update(name='Drama', description='Stage plays')
+        self.repo.bulk_update([drama])
+        sci_fi.update(name='Space opera', description=None)
+        self.repo.save_changes(ChangeSet(updated=[(sci_fi, frozenset({'name'}))]))
+        self.assertEqual(search('old'), [])
+        self.assertEqual(search('stage'), [drama])
+        self.assertEqual(search('op'), [sci_fi])
+        self.repo.save_changes(ChangeSet(deleted=[sci_fi.id]))
+        self.assertEqual(search('space'), [])
+        with self.pool.transaction() as connection:
+            connection.execute(
+                "INSERT INTO categories_fts (categories_fts, rank) VALUES ('integrity-check', 1)")
+
+    def test_index_existing_rows_for_filters(self):
+        horror = Category(name='Horror', description='Scary movies')
+        with self.pool.transaction() as connection:
+            connection.execute(INSERT, CategorySqliteRepository._to_row(horror))
+
+        repo = CategorySqliteRepository(self.pool, use_text_index=True)
+        result = repo.search(CategoryRepository.SearchParams(filter='scary'))
+        self.assertEqual(result.items, [horror])
+
+        drama = Category(name='Drama', description='Scary plays')
+        CategorySqliteRepository(self.pool).insert(drama)
+        repo = CategorySqliteRepository(self.pool, use_text_index=True)
+        result = repo.search(CategoryRepository.SearchParams(filter='scary', sort='name'))
+        self.assertEqual(result.items, [drama, horror])
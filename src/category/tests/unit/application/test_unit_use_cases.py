@@ -0,0 +1,290 @@
+import asyncio
+import unittest
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from __seedwork.application.use_cases import AsyncUseCase, UseCase
+from __seedwork.domain.exceptions import NotFoundException
+
+from category.application.dto import CategoryOutput, CategoryOutputMapper
+from category.application.use_cases import (
+    AsyncBulkUpdateCategoriesUseCase,
+    AsyncCreateCategoryUseCase,
+    AsyncDeleteCategoryUseCase,
+    AsyncGetCategoryUseCase,
+    AsyncListCategoriesUseCase,
+    AsyncUpdateCategoryUseCase,
+    BulkUpdateCategoriesInput,
+    BulkUpdateCategoriesOutput,
+    BulkUpdateCategoriesUseCase,
+    CreateCategoryInput,
+    CreateCategoryUseCase,
+    DeleteCategoryInput,
+    DeleteCategoryUseCase,
+    GetCategoryInput,
+    GetCategoryUseCase,
+    ListCategoriesInput,
+    ListCategoriesUseCase,
+    UpdateCategoryInput,
+    UpdateCategoryUseCase
+)
+from category.domain.entities import Category
+from category.domain.events import (
+    CategoriesBulkUpdated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryUpdated
+)
+from category.domain.repositories import AsyncCategoryRepository, CategoryRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class TestCategoryOutputMapper(unittest.TestCase):
+
+    def test_to_output(self):
+        category = Category(name='Movie', description='some', is_active=False)
+        self.assertEqual(CategoryOutputMapper.to_output(category), CategoryOutput(
+            id=category.id,
+            name='Movie',
+            description='some',
+            is_active=False,
+            created_at=category.created_at,
+        ))
+
+
+class TestCategoryUseCases(unittest.TestCase):
+
+    repo: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryInMemoryRepository()
+
+    def test_are_use_cases(self):
+        for use_case in [CreateCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase,
+                         UpdateCategoryUseCase, DeleteCategoryUseCase]:
+            self.assertTrue(issubclass(use_case, UseCase))
+
+    def test_create(self):
+        output = CreateCategoryUseCase(self.repo).execute(
+            CreateCategoryInput(name='Movie', description='some'))
+
+        category = self.repo.find_by_id(output.id)
+        self.assertEqual(output, CategoryOutputMapper.to_output(category))
+        self.assertTrue(output.is_active)
+
+    def test_create_publishes_events(self):
+        bus = MagicMock()
+        output = CreateCategoryUseCase(self.repo, bus).execute(CreateCategoryInput(name='Movie'))
+
+        events = bus.publish.call_args.args[0]
+        self.assertEqual([type(event) for event in events], [CategoryCreated])
+        self.assertEqual(events[0].aggregate_id, output.id)
+        self.assertEqual(self.repo.find_by_id(output.id).events, ())
+
+    def test_update_publishes_events(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        category.pull_events()
+        bus = MagicMock()
+
+        UpdateCategoryUseCase(self.repo, bus).execute(UpdateCategoryInput(
+            id=category.id, name='Documentary', is_active=False))
+        events = bus.publish.call_args.args[0]
+        self.assertEqual(
+            [type(event) for event in events], [CategoryUpdated, CategoryDeactivated])
+
+        bus.reset_mock()
+        UpdateCategoryUseCase(self.repo, bus).execute(UpdateCategoryInput(
+            id=category.id, name='Documentary', is_active=False))
+        bus.publish.assert_not_called()
+
+    def test_get(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        output = GetCategoryUseCase(self.repo).execute(GetCategoryInput(category.id))
+
+        self.assertEqual(output, CategoryOutputMapper.to_output(category))
+        with self.assertRaises(NotFoundException):
+            GetCategoryUseCase(self.repo).execute(GetCategoryInput('fake id'))
+
+    def test_list_uses_repository_defaults_for_missing_params(self):
+        created_at = datetime.now()
+        categories = [
+            Category(name=f'Category {position}',
+                     created_at=created_at + timedelta(seconds=position))
+            for position in range(3)
+        ]
+        self.repo.bulk_insert(categories)
+
+        output = ListCategoriesUseCase(self.repo).execute(ListCategoriesInput(per_page=2))
+
+        self.assertEqual(output.items, [
+            CategoryOutputMapper.to_output(category) for category in categories[:0:-1]
+        ])
+        self.assertEqual(output.total, 3)
+        self.assertEqual(output.current_page, 1)
+        self.assertEqual(output.last_page, 2)
+        self.assertEqual(output.per_page, 2)
+
+    def test_list_passes_search_params(self):
+        repo = MagicMock(spec=CategoryRepository)
+        repo.search.return_value = CategoryRepository.SearchResult(
+            items=[], total=0, current_page=2, per_page=5,
+            sort='name', sort_dir='asc', filter='movie')
+
+        ListCategoriesUseCase(repo).execute(ListCategoriesInput(
+            page=2, per_page=5, sort='name', sort_dir='asc', filter='movie'))
+
+        repo.search.assert_called_once_with(CategoryRepository.SearchParams(
+            page=2, per_page=5, sort='name', sort_dir='asc', filter='movie'))
+
+    def test_update(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        output = UpdateCategoryUseCase(self.repo).execute(UpdateCategoryInput(
+            id=category.id, name='Documentary', description='some', is_active=False))
+
+        self.assertEqual(output.name, 'Documentary')
+        self.assertEqual(output.description, 'some')
+        self.assertFalse(output.is_active)
+        self.assertEqual(self.repo.find_by_id(category.id).name, 'Documentary')
+
+        output = UpdateCategoryUseCase(self.repo).execute(UpdateCategoryInput(
+            id=category.id, name='Documentary'))
+        self.assertFalse(output.is_active)
+
+        output = UpdateCategoryUseCase(self.repo).execute(UpdateCategoryInput(
+            id=category.id, name='Documentary', is_active=True))
+        self.assertTrue(output.is_active)
+
+    def test_delete(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        DeleteCategoryUseCase(self.repo).execute(DeleteCategoryInput(category.id))
+
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_bulk_update(self):
+        movie, documentary = Category(name='Movie'), Category(name='Documentary')
+        self.repo.bulk_insert([movie, documentary])
+
+        output = BulkUpdateCategoriesUseCase(self.repo).execute(
+            BulkUpdateCategoriesInput(values={'is_active': False}, filter='mov'))
+        self.assertEqual(output, BulkUpdateCategoriesOutput(updated=1))
+        self.assertFalse(movie.is_active)
+
+        output = BulkUpdateCategoriesUseCase(self.repo).execute(BulkUpdateCategoriesInput(
+            values={'description': 'some'}, ids=[movie.id, documentary.id]))
+        self.assertEqual(output.updated, 2)
+        self.assertEqual([movie.description, documentary.description], ['some', 'some'])
+
+    def test_bulk_update_publishes_one_event(self):
+        movie = Category(name='Movie')
+        self.repo.insert(movie)
+        bus = MagicMock()
+        use_case = BulkUpdateCategoriesUseCase(self.repo, bus)
+
+        use_case.execute(BulkUpdateCategoriesInput(values={'is_active': False}, ids=[movie.id]))
+        use_case.execute(BulkUpdateCategoriesInput(values={'is_active': False}, filter='none'))
+
+        bus.publish.assert_called_once()
+        [event] = bus.publish.call_args.args[0]
+        self.assertIsInstance(event, CategoriesBulkUpdated)
+        self.assertEqual((event.values, event.ids, event.filter, event.updated),
+                         ({'is_active': False}, (movie.id,), None, 1))
+        self.assertEqual(movie.events, ())
+
+
+class TestAsyncCategoryUseCases(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = AsyncMock(spec=AsyncCategoryRepository)
+
+    def test_are_async_use_cases(self):
+        for use_case in [AsyncBulkUpdateCategoriesUseCase, AsyncCreateCategoryUseCase,
+                         AsyncGetCategoryUseCase,
+                         AsyncListCategoriesUseCase, AsyncUpdateCategoryUseCase,
+                         AsyncDeleteCategoryUseCase]:
+            self.assertTrue(issubclass(use_case, AsyncUseCase))
+
+    def test_create(self):
+        output = asyncio.run(AsyncCreateCategoryUseCase(self.repo).execute(
+            CreateCategoryInput(name='Movie')))
+
+        self.repo.insert.assert_awaited_once()
+        category = self.repo.insert.await_args.args[0]
+        self.assertEqual(output, CategoryOutputMapper.to_output(category))
+
+    def test_get(self):
+        category = Category(name='Movie')
+        self.repo.find_by_id.return_value = category
+
+        output = asyncio.run(AsyncGetCategoryUseCase(self.repo).execute(
+            GetCategoryInput(category.id)))
+
+        self.repo.find_by_id.assert_awaited_once_with(category.id)
+        self.assertEqual(output, CategoryOutputMapper.to_output(category))
+
+    def test_list(self):
+        category = Category(name='Movie')
+        self.repo.search.return_value = CategoryRepository.SearchResult(
+            items=[category], total=1, current_page=1, per_page=15,
+            sort=None, sort_dir=None, filter='mov')
+
+        output = asyncio.run(AsyncListCategoriesUseCase(self.repo).execute(
+            ListCategoriesInput(filter='mov')))
+
+        self.repo.search.assert_awaited_once_with(
+            CategoryRepository.SearchParams(filter='mov'))
+        self.assertEqual(output.items, [CategoryOutputMapper.to_output(category)])
+        self.assertEqual(output.total, 1)
+
+    def test_publishes_events(self):
+        bus = AsyncMock()
+        category = Category(name='Movie')
+        self.repo.find_by_id.return_value = category
+
+        asyncio.run(AsyncCreateCategoryUseCase(self.repo, bus).execute(
+            CreateCategoryInput(name='Other')))
+        asyncio.run(AsyncUpdateCategoryUseCase(self.repo, bus).execute(
+            UpdateCategoryInput(id=category.id, name='Documentary')))
+
+        self.assertEqual(
+            [[type(event) for event in call.args[0]] for call in bus.publish.await_args_list],
+            [[CategoryCreated], [CategoryUpdated]])
+
+    def test_update(self):
+        category = Category(name='Movie')
+        self.repo.find_by_id.return_value = category
+
+        output = asyncio.run(AsyncUpdateCategoryUseCase(self.repo).execute(
+            UpdateCategoryInput(id=category.id, name='Documentary', is_active=False)))
+
+        self.repo.update.assert_awaited_once_with(category)
+        self.assertEqual(output.name, 'Documentary')
+        self.assertFalse(output.is_active)
+
+    def test_delete(self):
+        asyncio.run(AsyncDeleteCategoryUseCase(self.repo).execute(
+            DeleteCategoryInput('some id')))
+
+        self.repo.delete.assert_awaited_once_with('some id')
+
+    def test_bulk_update(self):
+        self.repo.update_many.return_value = 3
+
+        output = asyncio.run(AsyncBulkUpdateCategoriesUseCase(self.repo).execute(
+            BulkUpdateCategoriesInput(values={'is_active': True}, ids=['a', 'b', 'c'])))
+
+        self.repo.update_many.assert_awaited_once_with({'is_active': True}, ['a', 'b', 'c'], None)
+        self.assertEqual(output.updated, 3)
+
+        bus = AsyncMock()
+        asyncio.run(AsyncBulkUpdateCategoriesUseCase(self.repo, bus).execute(
+            BulkUpdateCategoriesInput(values={'is_active': True}, filter='mov')))
+        [event] = bus.publish.await_args.args[0]
+        self.assertEqual((event.ids, event.filter, event.updated), (None, 'mov', 3))
@@ -4,6 +4,12 @@ import unittest
 from unittest.mock import patch
 
 from category.domain.entities import Category
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryUpdated
+)
 
 from datetime import datetime
 
@@ -74,3 +80,82 @@ class TestCategory(unittest.TestCase):
         with patch.object(Category, 'validate') as mock_validate:
             category = Category(name="Category")
             self.assertTrue(category.is_active)
+
+    def test_from_trusted_skips_validation(self):
+        created_at = datetime.now()
+        with patch.object(Category, 'validate') as mock_validate:
+            category = Category.from_trusted(
+                id='3aefc22e-8006-4024-a239-a27084c5133e',
+                name='Movie',
+                description='Some Description',
+                is_active=False,
+                created_at=created_at
+            )
+            mock_validate.assert_not_called()
+
+        self.assertEqual(category.id, '3aefc22e-8006-4024-a239-a27084c5133e')
+        self.assertEqual(category.name, 'Movie')
+        self.assertEqual(category.description, 'Some Description')
+        self.assertFalse(category.is_active)
+        self.assertEqual(category.created_at, created_at)
+
+    def test_hydrate_many_fills_defaults(self):
+        with patch.object(Category, 'validate') as mock_validate:
+            categories = Category.hydrate_many([{'name': 'Movie'}, {'name': 'Anime'}])
+            mock_validate.assert_not_called()
+
+        self.assertEqual([category.name for category in categories], ['Movie', 'Anime'])
+        for category in categories:
+            self.assertIsNone(category.description)
+            self.assertTrue(category.is_active)
+            self.assertIsInstance(category.created_at, datetime)
+
+    def test_to_dict(self):
+        created_at = datetime.now()
+        category = Category(
+            name='Movie', description='Some Description', is_active=False, created_at=created_at)
+
+        self.assertEqual(list(category.to_dict().items()), [
+            ('name', 'Movie'),
+            ('description', 'Some Description'),
+            ('is_active', False),
+            ('created_at', created_at),
+            ('id', category.id),
+        ])
+
+    def test_create_records_created_event(self):
+        self.assertEqual(Category(name='Movie').events, ())
+        category = Category.create(name='Movie', description='some', is_active=False)
+
+        self.assertEqual(len(category.events), 1)
+        event = category.events[0]
+        self.assertIsInstance(event, CategoryCreated)
+        self.assertEqual(
+            (event.aggregate_id, event.name, event.description, event.is_active, event.created_at),
+            (category.id, 'Movie', 'some', False, category.created_at))
+
+    def test_hydrated_categories_have_no_events(self):
+        category = Category.create(name='Movie')
+        self.assertEqual(Category.from_trusted(**category.to_dict()).events, ())
+
+    def test_records_events_only_for_changes(self):
+        category = Category(name='Movie')
+        category.pull_events()
+
+        category.update(name='Movie', description=None)
+        category.activate()
+        self.assertEqual(category.events, ())
+        self.assertEqual(category.dirty_fields, frozenset())
+
+        category.update(name='Documentary', description='some')
+        category.deactivate()
+        category.deactivate()
+        category.activate()
+
+        self.assertEqual([type(event) for event in category.events], [
+            CategoryUpdated, CategoryDeactivated, CategoryActivated])
+        updated = category.events[0]
+        self.assertEqual(
+            (updated.aggregate_id, updated.name, updated.description),
+            (category.id, 'Documentary', 'some'))
+        self.assertEqual(category.dirty_fields, {'name', 'description', 'is_active'})
@@ -0,0 +1,56 @@
+import unittest
+
+from category.domain.validators import CategoryValidator, CategoryValidatorFactory
+
+
+class TestCategoryValidatorUnit(unittest.TestCase):
+
+    validator: CategoryValidator
+
+    def setUp(self) -> None:
+        self.validator = CategoryValidatorFactory.create()
+
+    def test_factory_creates_a_category_validator(self):
+        self.assertIsInstance(self.validator, CategoryValidator)
+
+    def test_invalidation_cases_for_name_field(self):
+        arrange = [
+            {'data': {}, 'expected': 'This field is required.'},
+            {'data': {'name': None}, 'expected': 'This field may not be null.'},
+            {'data': {'name': ''}, 'expected': 'This field may not be blank.'},
+            {'data': {'name': True}, 'expected': 'Not a valid string.'},
+            {'data': {'name': 'a' * 256},
+             'expected': 'Ensure this field has no more than 255 characters.'},
+        ]
+
+        for item in arrange:
+            is_valid = self.validator.validate(item['data'])
+            self.assertFalse(is_valid, f"{item}")
+            self.assertListEqual(self.validator.errors['name'], [item['expected']], f"{item}")
+
+    def test_invalidation_cases_for_description_field(self):
+        is_valid = self.validator.validate({'name': 'Movie', 'description': {}})
+        self.assertFalse(is_valid)
+        self.assertListEqual(self.validator.errors['description'], ['Not a valid string.'])
+
+    def test_invalidation_cases_for_is_active_field(self):
+        for is_active in [None, 'fake', 5]:
+            validator = CategoryValidatorFactory.create()
+            is_valid = validator.validate({'name': 'Movie', 'is_active': is_active})
+            self.assertFalse(is_valid, f"{is_active}")
+
+    def test_valid_cases(self):
+        arrange = [
+            {'name': 'Movie'},
+            {'name': 'Movie', 'description': None},
+            {'name': 'Movie', 'description': ''},
+            {'name': 'Movie', 'is_active': True},
+            {'name': 'Movie', 'is_active': False},
+            {'name': 'Movie', 'description': 'Some description', 'is_active': False},
+        ]
+
+        for data in arrange:
+            validator = CategoryValidatorFactory.create()
+            self.assertTrue(validator.validate(data), f"{data}")
+            self.assertIsNone(validator.errors, f"{data}")
+            self.assertDictEqual(validator.validated_data, data)
@@ -0,0 +1,47 @@
+import unittest
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.cached_repositories import CategoryCachedRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class TestCategoryCachedRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryCachedRepository(CategoryInMemoryRepository())
+
+    def test_is_a_category_repository(self):
+        self.assertIsInstance(self.repo, CategoryRepository)
+        self.assertEqual(self.repo.sortable_fields, ['name', 'created_at'])
+
+    def test_unsaved_changes_do_not_leak_into_the_cache(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+
+        found = self.repo.find_by_id(category.id)
+        found.deactivate()
+        self.assertTrue(self.repo.find_by_id(category.id).is_active)
+
+        found.update(name='Documentary', description=None)
+        self.repo.update(found)
+        cached = self.repo.find_by_id(category.id)
+        self.assertEqual(cached.name, 'Documentary')
+        self.assertFalse(cached.is_active)
+        self.assertEqual(cached, found)
+
+    def test_update_many_invalidates_cached_entries(self):
+        movie, documentary = Category(name='Movie'), Category(name='Documentary')
+        self.repo.bulk_insert([movie, documentary])
+        self.repo.find_by_id(movie.id)
+        self.repo.find_by_id(documentary.id)
+
+        self.assertEqual(self.repo.deactivate_many([movie.unique_entity_id]), 1)
+        self.assertFalse(self.repo.find_by_id(movie.id).is_active)
+        self.assertEqual(len(self.repo.cache), 2)
+
+        with self.repo.identity_map():
+            self.repo.find_by_id(documentary.id)
+            self.assertEqual(self.repo.update_many({'name': 'Docs'}, filter_param='doc'), 1)
+            self.assertEqual(len(self.repo.cache), 0)
+            self.assertEqual(self.repo.find_by_id(documentary.id).name, 'Docs')
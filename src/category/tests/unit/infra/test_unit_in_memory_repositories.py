@@ -0,0 +1,131 @@
+import unittest
+
+from __seedwork.domain.exceptions import ValidationException
+
+from datetime import datetime, timedelta
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class TestCategoryInMemoryRepository(unittest.TestCase):
+
+    repo: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryInMemoryRepository()
+
+    def test_is_a_category_repository(self):
+        self.assertIsInstance(self.repo, CategoryRepository)
+
+    def test_index_name_and_created_at(self):
+        self.assertEqual(list(self.repo.indexes), ['name', 'created_at'])
+
+    def test_ordered_listing_follows_updates(self):
+        created_at = datetime.now()
+        movie = Category(name='Movie', created_at=created_at)
+        documentary = Category(
+            name='Documentary', created_at=created_at + timedelta(seconds=1))
+        self.repo.insert(movie)
+        self.repo.insert(documentary)
+
+        self.assertEqual(self.repo.find_all_sorted('name'), [documentary, movie])
+        self.assertEqual(
+            self.repo.find_all_sorted('created_at', 'desc'), [documentary, movie])
+
+        movie.update(name='Anime', description=None)
+        self.repo.update(movie)
+
+        self.assertEqual(self.repo.find_all_sorted('name'), [movie, documentary])
+
+    def test_search_sorts_by_created_at_desc_by_default(self):
+        created_at = datetime.now()
+        categories = [
+            Category(name=f'Category {position}',
+                     created_at=created_at + timedelta(seconds=position))
+            for position in range(3)
+        ]
+        for category in categories:
+            self.repo.insert(category)
+
+        result = self.repo.search(CategoryRepository.SearchParams())
+        self.assertEqual(result.items, categories[::-1])
+        self.assertEqual(result.total, 3)
+
+    def test_search_filters_name_ignoring_case(self):
+        movie = Category(name='Movie')
+        movies = Category(name='MOVIES')
+        documentary = Category(name='Documentary')
+        for category in [movie, movies, documentary]:
+            self.repo.insert(category)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='movie', sort='name', sort_dir='desc'))
+
+        self.assertEqual(result.items, [movie, movies])
+        self.assertEqual(result.total, 2)
+        self.assertEqual(result.filter, 'movie')
+
+    def test_search_filters_name_substrings_without_text_index(self):
+        horror = Category(name='Horror', description='Scary movies')
+        sci_fi = Category(name='Sci-Fi Movies', description='Space and robots')
+        self.repo.bulk_insert([horror, sci_fi])
+        self.assertIsNone(self.repo.text_index)
+
+        def search(filter_param):
+            return self.repo.search(CategoryRepository.SearchParams(filter=filter_param)).items
+
+        self.assertEqual(search('OVIE'), [sci_fi])
+        self.assertEqual(search('scary'), [])
+        self.assertEqual(search('mov sci'), [])
+        self.assertEqual(self.repo.deactivate_many(filter_param='rr'), 1)
+
+    def test_search_filters_by_word_prefixes_of_name_and_description(self):
+        repo = CategoryInMemoryRepository(use_text_index=True)
+        horror = Category(name='Horror', description='Scary movies')
+        sci_fi = Category(name='Sci-Fi Movies', description='Space and robots')
+        drama = Category(name='Drama', description=None)
+        repo.bulk_insert([horror, sci_fi, drama])
+
+        def search(filter_param):
+            result = repo.search(CategoryRepository.SearchParams(
+                filter=filter_param, sort='name'))
+            return result.items
+
+        self.assertEqual(search('MOV'), [horror, sci_fi])
+        self.assertEqual(search('movies sc'), [horror, sci_fi])
+        self.assertEqual(search('fi rob'), [sci_fi])
+        self.assertEqual(search('ovies'), [])
+        self.assertEqual(search('-'), [sci_fi])
+        self.assertEqual(repo.deactivate_many(filter_param='mov'), 2)
+
+        sci_fi.update(name='Sci-Fi', description=None)
+        repo.update(sci_fi)
+        repo.delete(horror.id)
+        self.assertEqual(search('mov'), [])
+        self.assertEqual(search('sci'), [sci_fi])
+
+    def test_activate_and_deactivate_many(self):
+        movie, movies, documentary = (
+            Category(name=name) for name in ['Movie', 'MOVIES', 'Documentary'])
+        self.repo.bulk_insert([movie, movies, documentary])
+
+        self.assertEqual(self.repo.deactivate_many(filter_param='movie'), 2)
+        self.assertEqual(
+            [movie.is_active, movies.is_active, documentary.is_active], [False, False, True])
+        self.assertEqual(self.repo.activate_many([movie.id, documentary.id]), 2)
+        self.assertTrue(movie.is_active)
+        self.assertEqual(movie.dirty_fields, frozenset())
+
+    def test_update_many_validates_values(self):
+        movie = Category(name='Movie')
+        self.repo.insert(movie)
+
+        with self.assertRaises(ValidationException) as assert_error:
+            self.repo.update_many({'name': 't' * 256})
+        self.assertEqual(assert_error.exception.args[0], 'The name must be less than 255')
+
+        self.assertEqual(self.repo.update_many({'name': 'Anime', 'description': None}), 1)
+        self.assertEqual(self.repo.find_all_sorted('name'), [movie])
+        self.assertEqual(movie.name, 'Anime')
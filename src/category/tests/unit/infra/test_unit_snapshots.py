@@ -0,0 +1,107 @@
+import importlib.util
+import unittest
+
+from datetime import datetime, timedelta, timezone
+
+from category.domain.entities import Category
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+from category.infra.snapshots import CategorySnapshot, to_seconds
+
+
+class TestCategorySnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.categories = [
+            Category(name='Movie', created_at=datetime(2021, 1, 31, 23, 59)),
+            Category(name='Documentary', is_active=False, created_at=datetime(2021, 1, 1)),
+            Category(name='Anime', created_at=datetime(2021, 3, 15, 12)),
+            Category(name='Drama', is_active=False, created_at=datetime(2022, 3, 15)),
+            Category(name='Unknown', is_active=None, created_at=None),
+        ]
+        self.snapshot = CategorySnapshot.from_categories(self.categories)
+
+    def test_to_seconds(self):
+        self.assertEqual(to_seconds(datetime(1970, 1, 2)), 86400.0)
+        self.assertEqual(to_seconds(datetime(1970, 1, 2, tzinfo=timezone.utc)), 86400.0)
+        self.assertEqual(to_seconds(None), float('-inf'))
+
+    def test_orders_rows_by_created_at(self):
+        self.assertEqual(len(self.snapshot), 5)
+        self.assertEqual(
+            self.snapshot.names, ['Unknown', 'Documentary', 'Movie', 'Anime', 'Drama'])
+        self.assertEqual(self.snapshot.ids[2], self.categories[0].id)
+        self.assertEqual(list(self.snapshot.is_active), [2, 0, 1, 1, 0])
+        self.assertEqual(self.snapshot.created_at[1], to_seconds(datetime(2021, 1, 1)))
+
+    def test_from_repository(self):
+        repo = CategoryInMemoryRepository()
+        repo.bulk_insert(self.categories)
+        self.assertEqual(CategorySnapshot.from_repository(repo), self.snapshot)
+        self.assertEqual(len(CategorySnapshot.from_categories([])), 0)
+
+    def test_count(self):
+        self.assertEqual(self.snapshot.count(), 5)
+        self.assertEqual(self.snapshot.count(is_active=True), 2)
+        self.assertEqual(self.snapshot.count(is_active=False), 2)
+        self.assertEqual(self.snapshot.count(created_from=datetime(2021, 1, 31)), 3)
+        self.assertEqual(self.snapshot.count(
+            is_active=True, created_from=datetime(2021, 1, 1),
+            created_until=datetime(2021, 3, 15, 12)), 1)
+        self.assertEqual(self.snapshot.count(
+            created_from=datetime(2023, 1, 1), created_until=datetime(2022, 1, 1)), 0)
+        self.assertEqual(
+            self.snapshot.count_by_active(), {True: 2, False: 2, None: 1})
+
+    def test_select(self):
+        inactive = self.snapshot.select(is_active=False)
+        self.assertEqual(inactive.names, ['Documentary', 'Drama'])
+        self.assertEqual(inactive.count_by_active(), {True: 0, False: 2, None: 0})
+        self.assertEqual(list(inactive.created_at), [
+            to_seconds(datetime(2021, 1, 1)), to_seconds(datetime(2022, 3, 15))])
+
+        first_quarter = self.snapshot.select(
+            created_from=datetime(2021, 1, 1), created_until=datetime(2021, 4, 1))
+        self.assertEqual(first_quarter.names, ['Documentary', 'Movie', 'Anime'])
+        self.assertEqual(first_quarter.select(is_active=True).names, ['Movie', 'Anime'])
+
+    def test_count_by_created_at(self):
+        self.assertEqual(self.snapshot.count_by_created_at('month'), {
+            None: 1,
+            datetime(2021, 1, 1): 2,
+            datetime(2021, 3, 1): 1,
+            datetime(2022, 3, 1): 1,
+        })
+        self.assertEqual(self.snapshot.count_by_created_at('year', is_active=True), {
+            datetime(2021, 1, 1): 2,
+        })
+        self.assertEqual(self.snapshot.count_by_created_at(), {
+            None: 1,
+            datetime(2021, 1, 1): 1,
+            datetime(2021, 1, 31): 1,
+            datetime(2021, 3, 15): 1,
+            datetime(2022, 3, 15): 1,
+        })
+
+    def test_count_by_created_at_over_december(self):
+        start = datetime(2021, 12, 20)
+        snapshot = CategorySnapshot.from_categories(
+            Category(name=f'Category {day}', created_at=start + timedelta(days=day))
+            for day in range(20)
+        )
+        self.assertEqual(snapshot.count_by_created_at('month'), {
+            datetime(2021, 12, 1): 12,
+            datetime(2022, 1, 1): 8,
+        })
+
+    def test_throw_error_when_period_is_invalid(self):
+        with self.assertRaises(ValueError) as assert_error:
+            self.snapshot.count_by_created_at('week')
+        self.assertEqual(
+            assert_error.exception.args[0], 'The period must be one of day, month, year')
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_to_numpy(self):
+        columns = self.snapshot.to_numpy()
+        self.assertEqual(int((columns['is_active'] == 1).sum()), 2)
+        self.assertEqual(list(columns['names']), self.snapshot.names)
+        self.assertEqual(columns['created_at'][1], self.snapshot.created_at[1])